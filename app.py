@@ -4,6 +4,7 @@ Streamlit tabanlı kullanıcı arayüzü
 """
 
 import streamlit as st
+import pandas as pd
 import threading
 import time
 import json
@@ -15,10 +16,18 @@ import os
 # Import our modules
 from core.config import (
     TeslaConfig, KullaniciHesabi, KartBilgisi, 
-    AracTercihi, BotAyarlari, RenkTercihi, AracTipi
+    AracTercihi, BotAyarlari, SiralamaAyarlari, RenkTercihi, AracTipi, TarayiciProtokolu
 )
+from core.markets import VARSAYILAN_PAZAR, pazar_getir, pazar_kodlari
 from features.inventory import TeslaEnvanter, EnvanterArac
 from features.order_bot import TeslaSiparisBot
+from features.poller_daemon import PaylasilanEnvanter
+from features.notifications import bildirimleri_bagla, olay_metni
+from features.tracking import EnvanterTakibi
+from utils.events import (
+    OlayYolu, Olay, AracBulundu, SiparisBasladi, AdimTamamlandi,
+    SiparisBasarili, SiparisBasarisiz, KontrolHatasi, EnvanterGuncellendi
+)
 
 # Sayfa yapılandırması
 st.set_page_config(
@@ -37,6 +46,37 @@ if 'log_queue' not in st.session_state:
     st.session_state.log_queue = queue.Queue()
 if 'config' not in st.session_state:
     st.session_state.config = None
+if 'envanter' not in st.session_state:
+    st.session_state.envanter = None
+if 'siparis_bot' not in st.session_state:
+    st.session_state.siparis_bot = None
+if 'envanter_takibi' not in st.session_state:
+    st.session_state.envanter_takibi = EnvanterTakibi()
+
+
+# Canlı envanter tablosunun sütunları
+TABLO_SUTUNLARI = ['vin', 'trim', 'renk', 'fiyat', 'durum', 'lokasyon', 'uygun', 'red_nedeni', 'ilk_gorulme']
+
+RED_NEDENI_ETIKETLERI = {
+    'durum': 'Satışta değil',
+    'trim': 'Araç tipi',
+    'renk': 'Renk',
+    'fiyat': 'Fiyat limiti',
+    'opsiyon': 'Opsiyonlar',
+}
+
+
+def envanter_takibi() -> EnvanterTakibi:
+    """Oturuma ait, yeniden çalıştırmalar arasında korunan envanter takibi"""
+    return st.session_state.envanter_takibi
+
+
+def envanter_takibini_sifirla() -> EnvanterTakibi:
+    """Bot başlarken önceki çalıştırmanın envanterini ve tablo durumunu temizle"""
+    st.session_state.envanter_takibi = EnvanterTakibi()
+    st.session_state.pop('envanter_tablosu', None)
+    st.session_state.pop('tablo_surumu', None)
+    return st.session_state.envanter_takibi
 
 
 def log_mesaj(mesaj: str, seviye: str = "INFO"):
@@ -46,28 +86,105 @@ def log_mesaj(mesaj: str, seviye: str = "INFO"):
     st.session_state.log_queue.put(log_entry)
 
 
-def bot_calistir(config: TeslaConfig):
+def canli_envanter_paneli(takip: EnvanterTakibi):
+    """Envanter tablosunu yalnızca son görülen sürümden bu yana gelen farklarla güncelle"""
+    config = st.session_state.config
+    pazar = pazar_getir(config.bot.pazar if config else VARSAYILAN_PAZAR)
+    if 'envanter_tablosu' not in st.session_state:
+        st.session_state.envanter_tablosu = pd.DataFrame(columns=TABLO_SUTUNLARI).set_index('vin')
+        st.session_state.tablo_surumu = 0
+    
+    surum, satirlar, silinen, tam_liste = takip.farklar(st.session_state.tablo_surumu)
+    tablo = st.session_state.envanter_tablosu
+    if tam_liste:
+        tablo = pd.DataFrame(satirlar, columns=TABLO_SUTUNLARI).set_index('vin')
+    elif satirlar or silinen:
+        yeni = pd.DataFrame(satirlar, columns=TABLO_SUTUNLARI).set_index('vin')
+        tablo = pd.concat([tablo.drop(index=list(silinen) + list(yeni.index), errors='ignore'), yeni])
+    st.session_state.envanter_tablosu = tablo
+    st.session_state.tablo_surumu = surum
+    
+    if tablo.empty:
+        st.caption("Henüz envanter kontrolü yapılmadı")
+        return
+    
+    # Özet: uygun araçlar ve red nedenlerine göre dağılım
+    ozet = takip.ozet()
+    sutunlar = st.columns(2 + len(RED_NEDENI_ETIKETLERI))
+    sutunlar[0].metric("Toplam", ozet.get('toplam', 0))
+    sutunlar[1].metric("✅ Uygun", ozet.get('uygun', 0))
+    for sutun, (neden, etiket) in zip(sutunlar[2:], RED_NEDENI_ETIKETLERI.items()):
+        sutun.metric(etiket, ozet.get(neden, 0))
+    
+    nedenler = st.multiselect(
+        "Gösterilecek araçlar",
+        options=['uygun'] + list(RED_NEDENI_ETIKETLERI),
+        default=['uygun', 'renk', 'fiyat', 'opsiyon'],
+        format_func=lambda x: '✅ Uygun' if x == 'uygun' else RED_NEDENI_ETIKETLERI[x],
+    )
+    gorunen = tablo[tablo['red_nedeni'].where(~tablo['uygun'].astype(bool), 'uygun').isin(nedenler)]
+    gorunen = gorunen.sort_values(['uygun', 'fiyat'], ascending=[False, True]).assign(
+        red_nedeni=lambda t: t['red_nedeni'].map(RED_NEDENI_ETIKETLERI).fillna(''),
+        ilk_gorulme=lambda t: pd.to_datetime(t['ilk_gorulme'], unit='s'),
+    )
+    st.dataframe(
+        gorunen,
+        use_container_width=True,
+        height=400,
+        column_config={
+            'fiyat': st.column_config.NumberColumn(f"Fiyat ({pazar.para_simgesi})", format="%d"),
+            'uygun': st.column_config.CheckboxColumn("Uygun"),
+            'red_nedeni': "Red Nedeni",
+            'ilk_gorulme': st.column_config.DatetimeColumn("İlk Görülme", format="HH:mm:ss"),
+        },
+    )
+
+
+def olay_kaydet(olay: Olay):
+    """Olay yolundan gelen olayları log alanına yaz"""
+    if isinstance(olay, AracBulundu):
+        log_mesaj(f"Uygun araç bulundu: {olay.vin}", "SUCCESS")
+        log_mesaj(f"Model: {olay.trim}, Renk: {olay.renk}, Fiyat: {olay.fiyat:,.0f} {olay.para_birimi}", "INFO")
+    elif isinstance(olay, SiparisBasladi):
+        log_mesaj(f"Sipariş işlemi başladı: {olay.vin}", "INFO")
+    elif isinstance(olay, AdimTamamlandi):
+        log_mesaj(f"Adım tamamlandı: {olay.adim} ({olay.sure_ms:.0f} ms)", "INFO")
+    elif isinstance(olay, SiparisBasarili):
+        log_mesaj("Sipariş başarıyla verildi!", "SUCCESS")
+    elif isinstance(olay, SiparisBasarisiz):
+        log_mesaj(f"Sipariş işlemi başarısız! {olay_metni(olay)}", "ERROR")
+    elif isinstance(olay, KontrolHatasi):
+        log_mesaj(olay_metni(olay), "WARNING")
+
+
+def bot_calistir(config: TeslaConfig, takip: EnvanterTakibi):
     """Bot'u arka planda çalıştır"""
+    # Loglama, bildirimler ve envanter takibi olay yolu aboneleri olarak kendi
+    # thread'lerinde çalışır, bu yüzden kontrol ve sipariş akışını geciktiremez
+    olaylar = OlayYolu()
+    olaylar.abone_ol(olay_kaydet, ad="log")
+    # Takip yalnızca en son envanteri işler; geride kalırsa eski kontroller atılır
+    olaylar.abone_ol(takip, [EnvanterGuncellendi], ad="envanter_takibi", kuyruk_boyutu=1)
+    bildirimleri_bagla(olaylar, config.bot)
+    
     try:
         log_mesaj("Bot başlatılıyor...", "INFO")
         
-        # Envanter nesnesini oluştur
-        envanter = TeslaEnvanter(config)
+        # Envanter nesnesini oluştur (kontrol sunucusu varsa envanter oradan alınır)
+        if config.bot.kontrol_sunucusu:
+            envanter = PaylasilanEnvanter(config, olaylar=olaylar)
+        else:
+            envanter = TeslaEnvanter(config, olaylar=olaylar)
+        st.session_state.envanter = envanter
         
-        # Sipariş bot nesnesini oluştur
-        siparis_bot = TeslaSiparisBot(config)
+        # Sipariş bot nesnesini oluştur (aynı profil kaydediciyi ve olay yolunu paylaşır)
+        siparis_bot = TeslaSiparisBot(config, profil=envanter.profil, olaylar=olaylar)
+        st.session_state.siparis_bot = siparis_bot
         
         def siparis_callback(arac: EnvanterArac):
             """Araç bulunduğunda çağrılacak fonksiyon"""
-            log_mesaj(f"Uygun araç bulundu: {arac.vin}", "SUCCESS")
-            log_mesaj(f"Model: {arac.trim}, Renk: {arac.renk}, Fiyat: {arac.fiyat:,.0f} TL", "INFO")
-            
-            # Sipariş işlemini başlat
             if siparis_bot.siparis_ver(arac):
-                log_mesaj("Sipariş başarıyla verildi!", "SUCCESS")
                 st.session_state.bot_running = False
-            else:
-                log_mesaj("Sipariş işlemi başarısız!", "ERROR")
         
         # Sürekli kontrol başlat
         envanter.surekli_kontrol(callback=siparis_callback)
@@ -75,6 +192,9 @@ def bot_calistir(config: TeslaConfig):
     except Exception as e:
         log_mesaj(f"Bot hatası: {str(e)}", "ERROR")
     finally:
+        if st.session_state.envanter:
+            st.session_state.envanter.kapat()
+        olaylar.kapat()
         st.session_state.bot_running = False
         log_mesaj("Bot durduruldu", "INFO")
 
@@ -90,6 +210,15 @@ def main():
     with st.sidebar:
         st.header("⚙️ Konfigürasyon")
         
+        # Fiyat alanlarının para birimi ve sınırları seçilen pazardan gelir
+        pazar = st.selectbox(
+            "Pazar",
+            options=pazar_kodlari(),
+            format_func=lambda kod: f"{pazar_getir(kod).ad} ({pazar_getir(kod).para_birimi})",
+            help="Pazarlar data/pazarlar.json dosyasında tanımlıdır"
+        )
+        pazar_kaydi = pazar_getir(pazar)
+        
         # Kullanıcı Bilgileri
         with st.expander("👤 Kullanıcı Bilgileri", expanded=True):
             ad = st.text_input("Ad", placeholder="Ahmet")
@@ -112,12 +241,13 @@ def main():
         # Araç Tercihleri
         with st.expander("🚙 Araç Tercihleri"):
             maksimum_fiyat = st.number_input(
-                "Maksimum Fiyat (TL)", 
-                min_value=1000000.0, 
-                max_value=5000000.0, 
-                value=2000000.0,
-                step=100000.0,
-                format="%.0f"
+                f"Maksimum Fiyat ({pazar_kaydi.para_simgesi})",
+                min_value=pazar_kaydi.fiyat_alt_siniri,
+                max_value=pazar_kaydi.fiyat_ust_siniri,
+                value=pazar_kaydi.varsayilan_fiyat,
+                step=pazar_kaydi.fiyat_adimi,
+                format="%.0f",
+                key=f"maksimum_fiyat_{pazar}"
             )
             
             renk_tercih_sirasi = st.multiselect(
@@ -140,6 +270,52 @@ def main():
             )
             
             teslimat_posta_kodu = st.text_input("Teslimat Posta Kodu", placeholder="34000")
+            
+            zorunlu_secenekler = st.text_input(
+                "Zorunlu Opsiyon Kodları (virgülle)",
+                placeholder="WY20P, TW01",
+                help="Araçta mutlaka bulunması gereken opsiyonlar (jant, çeki demiri, koltuk düzeni vb.)"
+            )
+            yasak_secenekler = st.text_input(
+                "Yasak Opsiyon Kodları (virgülle)",
+                placeholder="STY7S",
+                help="Bu opsiyonlardan birini içeren araçlar atlanır"
+            )
+        
+        # Yedek Tercihler (ana tercih bulunamazsa sırayla denenir)
+        with st.expander("🔁 Yedek Tercihler"):
+            yedek_ayarlari = []
+            for sira in range(1, 3):
+                st.markdown(f"**{sira}. Yedek**")
+                yedek_aktif = st.checkbox("Aktif", value=False, key=f"yedek_aktif_{sira}")
+                yedek_tipi = st.selectbox(
+                    "Araç Tipi",
+                    options=[AracTipi.SR, AracTipi.LR, AracTipi.PERF],
+                    index=1,
+                    format_func=lambda x: x.value,
+                    key=f"yedek_tipi_{sira}",
+                    disabled=not yedek_aktif
+                )
+                yedek_fiyat = st.number_input(
+                    f"Maksimum Fiyat ({pazar_kaydi.para_simgesi})",
+                    min_value=pazar_kaydi.fiyat_alt_siniri,
+                    max_value=pazar_kaydi.fiyat_ust_siniri,
+                    value=min(pazar_kaydi.varsayilan_fiyat + 5 * pazar_kaydi.fiyat_adimi, pazar_kaydi.fiyat_ust_siniri),
+                    step=pazar_kaydi.fiyat_adimi,
+                    format="%.0f",
+                    key=f"yedek_fiyat_{pazar}_{sira}",
+                    disabled=not yedek_aktif
+                )
+                yedek_renkler = st.multiselect(
+                    "Renk Tercihleri",
+                    options=[r for r in RenkTercihi],
+                    default=[RenkTercihi.KIRMIZI],
+                    format_func=lambda x: x.value,
+                    key=f"yedek_renk_{sira}",
+                    disabled=not yedek_aktif
+                )
+                if yedek_aktif:
+                    yedek_ayarlari.append((yedek_tipi, yedek_fiyat, yedek_renkler))
         
         # Bot Ayarları
         with st.expander("🤖 Bot Ayarları"):
@@ -160,11 +336,73 @@ def main():
             bot_korumalari = st.checkbox("Bot Korumaları Aktif", value=True)
             headless_mod = st.checkbox("Headless Mod", value=False)
             debug_mod = st.checkbox("Debug Modu", value=False)
-            
+            sayfa_kaydi = st.checkbox(
+                "Sayfa Kaydı (seçici doğrulaması için)",
+                value=False,
+                help="Her sipariş adımının HTML'i sayfa_kayitlari/ altına yazılır: python -m features.locators"
+            )
+            tarayici_protokolu = st.selectbox(
+                "Tarayıcı Protokolü",
+                options=list(TarayiciProtokolu),
+                format_func=lambda x: x.value,
+                help="cdp: sipariş adımları chromedriver yerine doğrudan DevTools üzerinden yürütülür"
+            )
             satis_baslangic_saati = st.time_input(
                 "Satış Başlangıç Saati",
                 value=datetime.strptime("17:59", "%H:%M").time()
             )
+            
+            adaptif_kontrol = st.checkbox(
+                "Adaptif Kontrol Aralığı (geliş örüntüsünü öğren)",
+                value=False
+            )
+            col_min, col_max = st.columns(2)
+            with col_min:
+                minimum_aralik = st.number_input(
+                    "Min Aralık (sn)", min_value=0.5, max_value=60.0, value=1.0, step=0.5,
+                    disabled=not adaptif_kontrol
+                )
+            with col_max:
+                maksimum_aralik = st.number_input(
+                    "Max Aralık (sn)", min_value=1.0, max_value=900.0, value=60.0, step=5.0,
+                    disabled=not adaptif_kontrol
+                )
+            
+            kontrol_sunucusu = st.text_input(
+                "Paylaşılan Kontrol Sunucusu (host:port)",
+                placeholder="127.0.0.1:8765",
+                help="python -m features.poller_daemon ile başlatılan sunucudan envanteri al"
+            )
+        
+        # Sıralama
+        with st.expander("⚖️ Sıralama"):
+            st.caption("Birden fazla uygun araç varsa en düşük ağırlıklı puanlı araç seçilir")
+            col_a1, col_a2 = st.columns(2)
+            with col_a1:
+                fiyat_agirligi = st.number_input("Fiyat Ağırlığı", min_value=0.0, value=1.0, step=0.5)
+                teslimat_agirligi = st.number_input("Teslimat Ağırlığı", min_value=0.0, value=0.0, step=0.5)
+                durum_agirligi = st.number_input("Yoldaki Araç Cezası", min_value=0.0, value=0.0, step=0.5)
+            with col_a2:
+                renk_agirligi = st.number_input("Renk Ağırlığı", min_value=0.0, value=10.0, step=0.5)
+                mesafe_agirligi = st.number_input("Mesafe Ağırlığı", min_value=0.0, value=0.0, step=0.5)
+                lokasyon_agirligi = st.number_input("Lokasyon Ağırlığı", min_value=0.0, value=0.0, step=0.5)
+            tercih_edilen_lokasyonlar = st.text_input(
+                "Tercih Edilen Lokasyonlar (virgülle, öncelik sırasıyla)",
+                placeholder="İstanbul, Kocaeli"
+            )
+            maksimum_teslimat_gun = st.number_input(
+                "Maksimum Teslimat Süresi (gün, 0 = sınırsız)", min_value=0, max_value=365, value=0
+            )
+            maksimum_mesafe_km = st.number_input(
+                "Maksimum Mesafe (km, teslimat posta kodundan, 0 = sınırsız)", min_value=0, max_value=2000, value=0
+            )
+            yoldakiler_dahil = st.checkbox("Yoldaki (InTransit) Araçları Dahil Et", value=True)
+        
+        # Bildirimler
+        with st.expander("🔔 Bildirimler"):
+            masaustu_bildirimi = st.checkbox("Masaüstü Bildirimi", value=False)
+            sesli_uyari = st.checkbox("Sesli Uyarı", value=False)
+            bildirim_webhook = st.text_input("Webhook Adresi", placeholder="http://127.0.0.1:8000/tesla")
         
         # Kaydet butonu
         if st.button("💾 Ayarları Kaydet", use_container_width=True):
@@ -190,21 +428,68 @@ def main():
                         maksimum_fiyat=maksimum_fiyat,
                         renk_tercihi=[RenkTercihi(r[0]) for r in renk_tercih_sirasi],
                         koltuk_rengi_kurali=koltuk_rengi_kurali,
-                        teslimat_posta_kodu=teslimat_posta_kodu
+                        teslimat_posta_kodu=teslimat_posta_kodu,
+                        zorunlu_secenekler=zorunlu_secenekler.split(','),
+                        yasak_secenekler=yasak_secenekler.split(',')
                     ),
+                    yedek_tercihler=[
+                        AracTercihi(
+                            arac_tipi=yedek_tipi,
+                            maksimum_fiyat=yedek_fiyat,
+                            renk_tercihi=yedek_renkler,
+                            koltuk_rengi_kurali=koltuk_rengi_kurali,
+                            teslimat_posta_kodu=teslimat_posta_kodu,
+                            zorunlu_secenekler=zorunlu_secenekler.split(','),
+                            yasak_secenekler=yasak_secenekler.split(',')
+                        )
+                        for yedek_tipi, yedek_fiyat, yedek_renkler in yedek_ayarlari
+                    ],
                     bot=BotAyarlari(
                         kontrol_araligi=kontrol_araligi,
                         maksimum_deneme=maksimum_deneme,
                         bot_korumalari=bot_korumalari,
                         headless_mod=headless_mod,
                         debug_mod=debug_mod,
-                        satis_baslangic_saati=satis_baslangic_saati.strftime("%H:%M")
+                        satis_baslangic_saati=satis_baslangic_saati.strftime("%H:%M"),
+                        adaptif_kontrol=adaptif_kontrol,
+                        minimum_aralik=minimum_aralik,
+                        maksimum_aralik=maksimum_aralik,
+                        adaptif_gecmis_dosyasi="adaptif_gecmis.json" if adaptif_kontrol else None,
+                        bildirim_webhook=bildirim_webhook or None,
+                        masaustu_bildirimi=masaustu_bildirimi,
+                        sesli_uyari=sesli_uyari,
+                        kontrol_sunucusu=kontrol_sunucusu.strip() or None,
+                        tarayici_protokolu=tarayici_protokolu,
+                        sayfa_kaydi=sayfa_kaydi,
+                        pazar=pazar
+                    ),
+                    siralama=SiralamaAyarlari(
+                        fiyat_agirligi=fiyat_agirligi,
+                        renk_agirligi=renk_agirligi,
+                        teslimat_agirligi=teslimat_agirligi,
+                        mesafe_agirligi=mesafe_agirligi,
+                        lokasyon_agirligi=lokasyon_agirligi,
+                        durum_agirligi=durum_agirligi,
+                        tercih_edilen_lokasyonlar=[
+                            lokasyon.strip() for lokasyon in tercih_edilen_lokasyonlar.split(',') if lokasyon.strip()
+                        ],
+                        maksimum_teslimat_gun=maksimum_teslimat_gun or None,
+                        maksimum_mesafe_km=maksimum_mesafe_km or None,
+                        yoldakiler_dahil=yoldakiler_dahil
                     )
                 )
                 
                 st.session_state.config = config
                 st.success("✅ Ayarlar başarıyla kaydedildi!")
                 
+                # Bot çalışıyorsa yeni ayarlar durdurmadan bir sonraki kontrolde uygulanır
+                if st.session_state.bot_running and st.session_state.envanter:
+                    degisenler = st.session_state.envanter.config_guncelle(config)
+                    if st.session_state.siparis_bot:
+                        st.session_state.siparis_bot.config_guncelle(config)
+                    if degisenler:
+                        st.info(f"🔄 Çalışan bota uygulandı: {', '.join(degisenler)}")
+                
             except Exception as e:
                 st.error(f"❌ Hata: {str(e)}")
     
@@ -229,7 +514,7 @@ def main():
                     st.session_state.bot_running = True
                     st.session_state.bot_thread = threading.Thread(
                         target=bot_calistir,
-                        args=(st.session_state.config,),
+                        args=(st.session_state.config, envanter_takibini_sifirla()),
                         daemon=True
                     )
                     st.session_state.bot_thread.start()
@@ -247,6 +532,43 @@ def main():
         st.header("ℹ️ Bilgi")
         st.metric("Kontrol Aralığı", f"{st.session_state.config.bot.kontrol_araligi if st.session_state.config else 0} sn")
         st.metric("Max Deneme", st.session_state.config.bot.maksimum_deneme if st.session_state.config else 0)
+        
+        # Çalışma anında profil kaydını aç/kapat
+        envanter = st.session_state.envanter
+        if envanter and st.session_state.bot_running:
+            profil_acik = st.toggle("🔬 Profil Kaydı", value=envanter.profil.aktif)
+            if profil_acik and not envanter.profil.aktif:
+                envanter.profil.ac()
+            elif not profil_acik and envanter.profil.aktif:
+                envanter.profil.kapat()
+            for kayit in envanter.profil.ozet()[:3]:
+                st.caption(f"{kayit['etiket']}: {kayit['sure_ms']} ms")
+            
+            # İstek yöneticisi (bütçe, geri çekilme, devre kesici) durumu
+            devre_simgeleri = {'kapali': '🟢', 'yari_acik': '🟡', 'acik': '🔴'}
+            for uc_nokta, durum in (envanter.yonetici.durum() if envanter.yonetici else {}).items():
+                st.caption(
+                    f"{devre_simgeleri.get(durum['devre'], '⚪')} {uc_nokta.split('/')[0]} | "
+                    f"jeton {durum['jeton']} | son kod {durum['son_durum_kodu']} | "
+                    f"hata {durum['ardisik_hata']}/{durum['toplam_hata']}"
+                    + (f" | {durum['bekleme_sn']:.0f} sn bekleniyor" if durum['bekleme_sn'] else "")
+                )
+            
+            # Satış saati kontrolünde kullanılan sunucu saat farkı
+            saat_farki = envanter.saat_farki_durumu()
+            if saat_farki['belirsizlik_sn'] is not None:
+                st.metric(
+                    "Sunucu Saat Farkı",
+                    f"{saat_farki['fark_sn']:+.2f} sn",
+                    help=f"±{saat_farki['belirsizlik_sn']:.2f} sn, {saat_farki.get('ornek')} örnek "
+                         "(pozitif: yerel saat geride)"
+                )
+            else:
+                st.caption("🕒 Sunucu saat farkı henüz ölçülmedi")
+    
+    # Canlı envanter
+    st.header("🚘 Canlı Envanter")
+    canli_envanter_paneli(envanter_takibi())
     
     # Log Alanı
     st.header("📜 İşlem Kayıtları")
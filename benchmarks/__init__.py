@@ -0,0 +1 @@
+# Benchmarks paketi 
\ No newline at end of file
@@ -0,0 +1,137 @@
+"""
+Tarayıcı Sürücü Benchmark'ı
+Selenium (chromedriver) ve doğrudan DevTools (CDP) arka uçlarının komut başına
+gecikmesini ve uçtan uca sipariş süresini yerel sipariş sayfalarında karşılaştırır
+
+Yerel Chrome kurulumu gerektirir.
+
+Kullanım:
+    python -m benchmarks.driver_bench
+    python -m benchmarks.driver_bench --tekrar 50 --goster
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from typing import Callable, Dict
+
+from selenium.webdriver.common.by import By
+
+from benchmarks.inventory_bench import benchmark_config
+from core.config import TarayiciProtokolu
+from features.browser import CdpSurucusu, SeleniumSurucusu, TarayiciSurucusu
+from features.inventory import EnvanterArac
+from features.order_bot import TeslaSiparisBot
+from utils.clock import SanalSaat
+from utils.events import AdimTamamlandi
+from utils.mock_checkout import YerelSiparisSunucusu
+from utils.synthetic import SentetikEnvanter
+
+
+def _medyan_ms(islem: Callable[[], object], tekrar: int) -> float:
+    sureler = []
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        islem()
+        sureler.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(sureler)
+
+
+def komutlari_olc(surucu: TarayiciSurucusu, sunucu: YerelSiparisSunucusu, tekrar: int) -> Dict[str, float]:
+    """Kart sayfasında her sürücü komutunun medyan gecikmesi (ms)"""
+    kart_url = f"{sunucu.kok}/kart?vin=BENCH"
+    surucu.git(kart_url)
+    alan = surucu.bul((By.NAME, 'cardName'))
+    ay = surucu.bul((By.NAME, 'expirationMonth'))
+    buton = surucu.bul((By.CSS_SELECTOR, "button[data-id='place-order']"))
+
+    return {
+        'bul_name': _medyan_ms(lambda: surucu.bul((By.NAME, 'cvv')), tekrar),
+        'bul_css': _medyan_ms(lambda: surucu.bul((By.CSS_SELECTOR, "input[name='billingZip']")), tekrar),
+        'bul_xpath': _medyan_ms(lambda: surucu.bul((By.XPATH, "//button[contains(text(), 'Place Order')]")), tekrar),
+        'bul_eksik': _medyan_ms(lambda: surucu.bul((By.ID, 'olmayan')), tekrar),
+        'bul_tiklanabilir': _medyan_ms(lambda: surucu.bul((By.CSS_SELECTOR, '.place-order-button'), 5, True), tekrar),
+        'temizle': _medyan_ms(lambda: surucu.temizle(alan), tekrar),
+        'yaz_karakter': _medyan_ms(lambda: surucu.yaz(alan, 'a'), tekrar),
+        'kaydir': _medyan_ms(lambda: surucu.kaydir(buton), tekrar),
+        'tikla': _medyan_ms(lambda: surucu.tikla(alan), tekrar),
+        'sec': _medyan_ms(lambda: surucu.sec(ay, '7'), tekrar),
+        'sayfa_kaynagi': _medyan_ms(surucu.sayfa_kaynagi, tekrar),
+        'url': _medyan_ms(surucu.url, tekrar),
+        'git': _medyan_ms(lambda: surucu.git(kart_url), max(tekrar // 5, 3)),
+    }
+
+
+def siparisi_olc(protokol: TarayiciProtokolu, sunucu: YerelSiparisSunucusu, goster: bool) -> Dict[str, float]:
+    """Tam sipariş akışının adım süreleri (ms); rastgele beklemeler sanal saatle atlanır"""
+    config = benchmark_config()
+    config.bot.tarayici_protokolu = protokol
+    config.bot.headless_mod = not goster
+    config.bot.hata_kaydi = False
+    bot = TeslaSiparisBot(config, saat=SanalSaat(), tasarim_url=sunucu.tasarim_url)
+
+    sureler: Dict[str, float] = {}
+    bot.olaylar.abone_ol(lambda olay: sureler.__setitem__(olay.adim, olay.sure_ms), [AdimTamamlandi])
+    onceki = len(sunucu.siparisler)
+    t0 = time.perf_counter()
+    basarili = bot.siparis_ver(EnvanterArac(SentetikEnvanter(tohum=1).arac()))
+    toplam = (time.perf_counter() - t0) * 1000
+    bot.olaylar.kapat()
+    sureler['toplam'] = toplam
+    if not basarili or len(sunucu.siparisler) != onceki + 1:
+        raise RuntimeError(f"{protokol.value}: sipariş yerel sunucuya ulaşmadı")
+    return sureler
+
+
+def _tablo_yazdir(baslik: str, sonuclar: Dict[str, Dict[str, float]]):
+    arka_uclar = list(sonuclar)
+    print(f"\n{baslik}")
+    print(f"{'':>18} " + ' '.join(f"{a:>10}" for a in arka_uclar) + f" {'oran':>8}")
+    for olcum in sonuclar[arka_uclar[0]]:
+        degerler = [sonuclar[a].get(olcum, float('nan')) for a in arka_uclar]
+        oran = degerler[0] / degerler[-1] if degerler[-1] else float('nan')
+        print(f"{olcum:>18} " + ' '.join(f"{d:>10.2f}" for d in degerler) + f" {oran:>7.1f}x")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Tarayıcı sürücü benchmark'ı")
+    parser.add_argument('--tekrar', type=int, default=30, help="Komut başına ölçüm sayısı")
+    parser.add_argument('--goster', action='store_true', help="Tarayıcıyı headless olmadan çalıştır")
+    args = parser.parse_args(argv)
+
+    sunucu = YerelSiparisSunucusu().baslat()
+    config = benchmark_config()
+    config.bot.headless_mod = not args.goster
+    config.bot.hata_kaydi = False
+    bot = TeslaSiparisBot(config)
+    try:
+        try:
+            bot.tarayici_baslat()
+        except Exception as e:
+            print(f"[HATA] Chrome başlatılamadı (yerel Chrome kurulumu gerekli): {str(e)}")
+            return 1
+
+        # İki arka uç aynı tarayıcı oturumunda ölçülür
+        cdp = CdpSurucusu.driverdan(bot.driver)
+        komutlar = {
+            'selenium': komutlari_olc(SeleniumSurucusu(bot.driver), sunucu, args.tekrar),
+            'cdp': komutlari_olc(cdp, sunucu, args.tekrar),
+        }
+        cdp.kapat()
+        bot.tarayici_kapat()
+        _tablo_yazdir("Komut başına medyan gecikme (ms)", komutlar)
+
+        siparis = {
+            protokol.value: siparisi_olc(protokol, sunucu, args.goster)
+            for protokol in (TarayiciProtokolu.SELENIUM, TarayiciProtokolu.CDP)
+        }
+        _tablo_yazdir("Sipariş adımları (ms, beklemeler hariç)", siparis)
+    finally:
+        bot.tarayici_kapat()
+        sunucu.durdur()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
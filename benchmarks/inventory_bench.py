@@ -0,0 +1,228 @@
+"""
+Envanter Yolu Benchmark'ı
+JSON çözme, EnvanterArac oluşturma, filtreleme/sıralama, puanlama ve araç başına bellek ölçümü
+
+Süreler zamana yayılmış birkaç tur ölçülür ve turların en iyisi alınır; makinenin
+yavaş bir dönemi ancak tüm turları kapsarsa sonucu etkiler. Turların medyanı ile
+en iyisi arasındaki fark gürültü payı olarak regresyon eşiğine eklenir.
+
+Kullanım:
+    python -m benchmarks.inventory_bench            # baseline ile karşılaştır
+    python -m benchmarks.inventory_bench --kaydet   # yeni baseline yaz
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from core.config import (
+    TeslaConfig, KullaniciHesabi, KartBilgisi, AracTercihi,
+    BotAyarlari, RenkTercihi
+)
+from features.inventory import TeslaEnvanter, EnvanterArac
+from utils.synthetic import SentetikEnvanter
+
+
+BOYUTLAR = [50, 500, 5_000, 50_000]
+BASELINE_DOSYASI = os.path.join(os.path.dirname(__file__), 'baseline.json')
+TOHUM = 1234
+
+TURLAR = 5
+
+# Çok küçük sürelerde ölçüm gürültüsünü regresyon saymamak için alt sınır (ms);
+# turlar arası yayılım bundan büyükse eşik yayılıma göre büyür
+MUTLAK_ESIK_MS = 0.25
+
+
+def benchmark_config() -> TeslaConfig:
+    """Benchmark için sabit, ağ gerektirmeyen konfigürasyon"""
+    return TeslaConfig(
+        kullanici=KullaniciHesabi(ad="Bench", soyad="Mark", email="bench@example.com", telefon="5551234567"),
+        kart=KartBilgisi(
+            kart_sahibi="BENCH MARK", kart_no="4532015112830366",
+            son_kullanma_ay=12, son_kullanma_yil=2099, cvv="123", fatura_posta_kodu="34000"
+        ),
+        tercih=AracTercihi(
+            maksimum_fiyat=2_100_000,
+            renk_tercihi=[RenkTercihi.KIRMIZI, RenkTercihi.BEYAZ, RenkTercihi.SIYAH],
+            teslimat_posta_kodu="34000"
+        ),
+        bot=BotAyarlari(bot_korumalari=False, debug_mod=False),
+    )
+
+
+def _en_iyi_sure(islem: Callable[[], object], tekrar: int) -> float:
+    """İşlemi tekrar tekrar çalıştırıp en kısa süreyi (ms) döndür"""
+    en_iyi = float('inf')
+    for _ in range(tekrar):
+        gc.collect()
+        t0 = time.perf_counter()
+        islem()
+        en_iyi = min(en_iyi, time.perf_counter() - t0)
+    return en_iyi * 1000
+
+
+def _bellek(islem: Callable[[], object]) -> int:
+    """İşlemin sonucunun tuttuğu bellek (bayt)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        once = tracemalloc.get_traced_memory()[0]
+        sonuc = islem()
+        sonra = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del sonuc
+    return sonra - once
+
+
+def olc(adet: int, envanter: TeslaEnvanter) -> Dict[str, float]:
+    """Tek bir envanter boyutu için tek turluk süre ölçümleri"""
+    yuk = SentetikEnvanter(tohum=TOHUM).yanit_json(adet)
+    tekrar = 7 if adet >= 50_000 else 9 if adet >= 5_000 else 31
+
+    data = json.loads(yuk)
+    kayitlar = data['results']
+    araclar: List[EnvanterArac] = [EnvanterArac(kayit) for kayit in kayitlar]
+    tercih = envanter.config.tercih
+    adaylar = envanter.uygun_araclari_sirala(araclar)
+
+    return {
+        'json_cozme_ms': _en_iyi_sure(lambda: json.loads(yuk), tekrar),
+        'arac_olusturma_ms': _en_iyi_sure(lambda: [EnvanterArac(k) for k in kayitlar], tekrar),
+        'filtre_siralama_ms': _en_iyi_sure(lambda: envanter.uygun_araclari_sirala(araclar), tekrar),
+        'puanlama_ms': _en_iyi_sure(lambda: envanter.siralayici.sirala(adaylar, tercih), tekrar),
+    }
+
+
+def bellek_olc(adet: int) -> Dict[str, float]:
+    """Araç başına bellek (tur gerektirmez, deterministiktir)"""
+    yuk = SentetikEnvanter(tohum=TOHUM).yanit_json(adet)
+    kayitlar = json.loads(yuk)['results']
+    return {
+        'yuk_bayt_arac': round(_bellek(lambda: json.loads(yuk)) / adet, 1),
+        'arac_bayt_arac': round(_bellek(lambda: [EnvanterArac(k) for k in kayitlar]) / adet, 1),
+    }
+
+
+def calistir(boyutlar: List[int], tur: int = TURLAR) -> Tuple[Dict[str, Dict[str, float]], Dict[str, Dict[str, float]]]:
+    """Tüm boyutları `tur` kez ölç; (en iyi turlar, tur medyanının en iyi turdan farkı) döndür
+
+    Her turda tüm boyutlar sırayla ölçülür, böylece makinenin yavaş bir
+    dönemi tek bir boyutu değil tüm turu etkiler.
+    """
+    envanter = TeslaEnvanter(benchmark_config())
+    turlar: Dict[str, List[Dict[str, float]]] = {str(adet): [] for adet in boyutlar}
+    try:
+        for _ in range(tur):
+            for adet in boyutlar:
+                turlar[str(adet)].append(olc(adet, envanter))
+    finally:
+        envanter.kapat()
+
+    sonuclar: Dict[str, Dict[str, float]] = {}
+    yayilimlar: Dict[str, Dict[str, float]] = {}
+    for adet in boyutlar:
+        olcumler = turlar[str(adet)]
+        sonuclar[str(adet)] = {ad: round(min(o[ad] for o in olcumler), 4) for ad in olcumler[0]}
+        yayilimlar[str(adet)] = {
+            ad: round(statistics.median(o[ad] for o in olcumler) - sonuclar[str(adet)][ad], 4)
+            for ad in olcumler[0]
+        }
+        sonuclar[str(adet)].update(bellek_olc(adet))
+    return sonuclar, yayilimlar
+
+
+def karsilastir(sonuclar: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+                sure_toleransi: float, bellek_toleransi: float,
+                yayilimlar: Dict[str, Dict[str, float]] = None,
+                baseline_yayilimlari: Dict[str, Dict[str, float]] = None) -> List[str]:
+    """Baseline'a göre kötüleşen ölçümleri listele
+
+    Süre artışı hem oransal toleransı hem de mutlak eşiği aşmalıdır; mutlak
+    eşik iki çalıştırmanın tur yayılımlarının toplamından küçük olmaz.
+    """
+    yayilimlar = yayilimlar or {}
+    baseline_yayilimlari = baseline_yayilimlari or {}
+    regresyonlar = []
+    for adet, olcumler in sonuclar.items():
+        onceki = baseline.get(adet)
+        if not onceki:
+            continue
+        for ad, deger in olcumler.items():
+            eski = onceki.get(ad)
+            if eski is None:
+                continue
+            bellek_mi = ad.endswith('_bayt_arac')
+            tolerans = bellek_toleransi if bellek_mi else sure_toleransi
+            esik = max(
+                MUTLAK_ESIK_MS,
+                yayilimlar.get(adet, {}).get(ad, 0.0) + baseline_yayilimlari.get(adet, {}).get(ad, 0.0),
+            )
+            if deger > eski * (1 + tolerans) and (bellek_mi or deger - eski > esik):
+                regresyonlar.append(f"{adet} araç / {ad}: {eski} -> {deger} (+{(deger / eski - 1) * 100:.0f}%)")
+    return regresyonlar
+
+
+def _tablo_yazdir(sonuclar: Dict[str, Dict[str, float]]):
+    basliklar = ['json_cozme_ms', 'arac_olusturma_ms', 'filtre_siralama_ms', 'puanlama_ms', 'yuk_bayt_arac', 'arac_bayt_arac']
+    print(f"{'araç':>8} " + ' '.join(f"{b:>20}" for b in basliklar))
+    for adet, olcumler in sonuclar.items():
+        print(f"{adet:>8} " + ' '.join(f"{olcumler[b]:>20}" for b in basliklar))
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Envanter yolu benchmark'ı")
+    parser.add_argument('--kaydet', action='store_true', help="Sonuçları baseline olarak kaydet")
+    parser.add_argument('--baseline', default=BASELINE_DOSYASI, help="Baseline JSON dosyası")
+    parser.add_argument('--boyutlar', type=int, nargs='+', default=BOYUTLAR, help="Envanter boyutları")
+    parser.add_argument('--tur', type=int, default=TURLAR, help="Süre ölçümü tur sayısı (en iyisi alınır)")
+    parser.add_argument('--tolerans', type=float, default=0.30, help="Süre için izin verilen artış oranı")
+    parser.add_argument('--bellek-toleransi', type=float, default=0.10, help="Bellek için izin verilen artış oranı")
+    args = parser.parse_args(argv)
+
+    sonuclar, yayilimlar = calistir(args.boyutlar, args.tur)
+    _tablo_yazdir(sonuclar)
+
+    if args.kaydet:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'tohum': TOHUM,
+                'tur': args.tur,
+                'sonuclar': sonuclar,
+                'yayilimlar': yayilimlar,
+            }, f, indent=2, ensure_ascii=False)
+            f.write('\n')
+        print(f"[BILGI] Baseline kaydedildi: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"[HATA] Baseline bulunamadı: {args.baseline} (önce --kaydet ile oluşturun)")
+        return 2
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        kayit = json.load(f)
+
+    regresyonlar = karsilastir(sonuclar, kayit['sonuclar'], args.tolerans, args.bellek_toleransi,
+                               yayilimlar, kayit.get('yayilimlar'))
+    if regresyonlar:
+        print("\n[HATA] Performans regresyonu tespit edildi:")
+        for satir in regresyonlar:
+            print(f"  {satir}")
+        return 1
+
+    print("\n[BAŞARI] Baseline'a göre regresyon yok")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
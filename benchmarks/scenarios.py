@@ -0,0 +1,454 @@
+"""
+Sanal Saatli Kontrol Döngüsü Senaryoları
+Satış saati geçişi, bekleme sapması, deneme tükenmesi, tam gün adaptif kontrol,
+hız sınırı (429/503), paylaşılan kontrol sunucusu, çalışırken ayar değişikliği ve
+sunucu saat farkı senaryolarını sanal saatle milisaniyeler içinde çalıştırır.
+
+Kullanım:
+    python -m benchmarks.scenarios
+"""
+
+import argparse
+import contextlib
+import io
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from benchmarks.inventory_bench import benchmark_config
+from core.config import TeslaConfig, RenkTercihi
+from features.inventory import TeslaEnvanter, EnvanterArac
+from features.poller_daemon import EnvanterYayinci, PaylasilanEnvanter, yayinci_config
+from features.query import sorgu_secenekleri
+from utils.clock import SanalSaat
+from utils.mock_server import YerelEnvanterSunucusu
+from utils.synthetic import SentetikEnvanter
+
+
+GUN = datetime(2025, 1, 1)
+
+
+class SimuleEnvanter(TeslaEnvanter):
+    """Envanteri API yerine sanal saate bağlı bir araç akışından okuyan envanter"""
+
+    SAAT_OLCUMU = False  # Ağ isteği yapılmaz; yerel saat sunucu saati sayılır
+
+    def __init__(self, config: TeslaConfig, saat: SanalSaat,
+                 akis: List[Tuple[float, float, EnvanterArac]]):
+        super().__init__(config, saat=saat)
+        self.akis = akis  # (geliş zamanı, gidiş zamanı, araç)
+        self.sorgu_zamanlari: List[float] = []
+        self.guncellemeler: List[Tuple[float, Dict[str, Any]]] = []  # (zaman, arayüzden gelen değişiklik)
+
+    def envanter_sorgula(self) -> List[EnvanterArac]:
+        simdi = self.saat.zaman()
+        self.sorgu_zamanlari.append(simdi)
+        while self.guncellemeler and self.guncellemeler[0][0] <= simdi:
+            self.config_guncelle(self.guncellemeler.pop(0)[1])
+        self._tam_sonuc = True
+        return [arac for gelis, gidis, arac in self.akis if gelis <= simdi < gidis]
+
+
+def _an(saat: str, saniye: int = 0) -> datetime:
+    """Simülasyon gününde 'SS:DD' anı"""
+    zaman = datetime.strptime(saat, '%H:%M')
+    return GUN + timedelta(hours=zaman.hour, minutes=zaman.minute, seconds=saniye)
+
+
+def _config(**bot_ayarlari) -> TeslaConfig:
+    config = benchmark_config()
+    ayarlar = {'isitma_oncesi': 0, 'satis_baslangic_saati': '17:59', **bot_ayarlari}
+    return config.copy(update={'bot': config.bot.copy(update=ayarlar)})
+
+
+def _arac(uretec: SentetikEnvanter, uygun: bool) -> EnvanterArac:
+    kayit = uretec.arac()
+    kayit['InventoryStatus'] = 'Available'
+    if uygun:
+        kayit.update({'TrimName': 'Model Y Standard Range RWD', 'TrimCode': 'MYRWD', 'Price': 1_950_000})
+        kayit['PAINT'] = {'Code': 'red', 'Value': 'PR01'}
+    else:
+        kayit.update({'TrimName': 'Model Y Performance AWD', 'TrimCode': 'PAWD'})
+    return EnvanterArac(kayit)
+
+
+def _arka_plan(uretec: SentetikEnvanter, adet: int) -> List[Tuple[float, float, EnvanterArac]]:
+    """Gün boyunca gelip giden, tercihe uymayan araçlar"""
+    gun_basi = GUN.timestamp()
+    akis = []
+    for _ in range(adet):
+        gelis = gun_basi + uretec.rng.uniform(0, 86400)
+        akis.append((gelis, gelis + uretec.rng.uniform(600, 7200), _arac(uretec, False)))
+    return akis
+
+
+def satis_gecisi() -> Dict[str, Any]:
+    """17:50'de başlayan, bot korumalı (sapmalı) döngü; araç 18:03'te gelir"""
+    uretec = SentetikEnvanter(tohum=1)
+    hedef = _arac(uretec, True)
+    gelis = _an('18:03', 20).timestamp()
+    akis = _arka_plan(uretec, 200) + [(gelis, gelis + 300, hedef)]
+
+    saat = SanalSaat(_an('17:50'))
+    envanter = SimuleEnvanter(_config(bot_korumalari=True, kontrol_araligi=5, maksimum_deneme=500), saat, akis)
+    bulunan = envanter.surekli_kontrol()
+
+    ilk_sorgu = min(envanter.sorgu_zamanlari)
+    gecikme = saat.zaman() - gelis
+    hatalar = []
+    if bulunan is not hedef:
+        hatalar.append("hedef araç bulunamadı")
+    if ilk_sorgu < _an('17:59').timestamp():
+        hatalar.append("satış saatinden önce sorgu yapıldı")
+    if not 0 <= gecikme <= 10:
+        hatalar.append(f"bulma gecikmesi {gecikme:.1f} sn")
+    return {'sorgu': len(envanter.sorgu_zamanlari), 'gecikme_sn': round(gecikme, 1),
+            'bitis': saat.simdi().strftime('%H:%M:%S'), 'hatalar': hatalar}
+
+
+def deneme_tukenmesi() -> Dict[str, Any]:
+    """Hiç uygun araç yok; 100 deneme 5 sn aralıkla tükenir"""
+    uretec = SentetikEnvanter(tohum=2)
+    saat = SanalSaat(_an('17:59'))
+    envanter = SimuleEnvanter(_config(kontrol_araligi=5, maksimum_deneme=100), saat, _arka_plan(uretec, 200))
+    bulunan = envanter.surekli_kontrol()
+
+    gecen = saat.zaman() - _an('17:59').timestamp()
+    hatalar = []
+    if bulunan is not None:
+        hatalar.append("uygun araç olmamasına rağmen araç bulundu")
+    if len(envanter.sorgu_zamanlari) != 100:
+        hatalar.append(f"{len(envanter.sorgu_zamanlari)} sorgu yapıldı (beklenen 100)")
+    if gecen != 99 * 5:
+        hatalar.append(f"sanal süre {gecen} sn (beklenen {99 * 5})")
+    return {'sorgu': len(envanter.sorgu_zamanlari), 'sanal_sure_sn': gecen, 'hatalar': hatalar}
+
+
+def _gunluk_akis(uretec: SentetikEnvanter, gun_sayisi: int, gunluk: int) -> List[Tuple[float, float, EnvanterArac]]:
+    """GUN'den önceki günlerden başlayan, çoğu mesai saatinde (08-18) gelen uygunsuz araçlar"""
+    baslangic = GUN.timestamp() - (gun_sayisi - 1) * 86400
+    akis = []
+    for gun in range(gun_sayisi):
+        for _ in range(gunluk):
+            if uretec.rng.random() < 0.8:
+                saniye = uretec.rng.uniform(8 * 3600, 18 * 3600)
+            else:
+                saniye = uretec.rng.uniform(0, 86400)
+            gelis = baslangic + gun * 86400 + saniye
+            akis.append((gelis, gelis + uretec.rng.uniform(600, 7200), _arac(uretec, False)))
+    return akis
+
+
+def _gecmisi_ogren(zamanlayici, akis: List[Tuple[float, float, EnvanterArac]],
+                   baslangic: float, bitis: float, adim: int = 60):
+    """Zamanlayıcıya baslangic-bitis arasında `adim` saniyede bir yapılmış kontrolleri bildir"""
+    sirali = sorted(akis, key=lambda kayit: kayit[0])
+    sira = 0
+    aktif: List[Tuple[float, float, EnvanterArac]] = []
+    for t in range(int(baslangic), int(bitis), adim):
+        while sira < len(sirali) and sirali[sira][0] <= t:
+            aktif.append(sirali[sira])
+            sira += 1
+        aktif = [kayit for kayit in aktif if kayit[1] > t]
+        zamanlayici.gozlemle([arac for _, _, arac in aktif], t)
+
+
+def _gun_boyu_kontrol(envanter: SimuleEnvanter, bitis: float) -> Dict[str, float]:
+    """`surekli_kontrol` döngüsünü bulunan araçta durmadan `bitis`e kadar sür; VIN -> ilk bulunma anı"""
+    bulunanlar: Dict[str, float] = {}
+    while envanter.saat.zaman() < bitis:
+        arac = envanter.uygun_arac_bul()
+        if arac:
+            bulunanlar.setdefault(arac.vin, envanter.saat.zaman())
+        envanter.saat.uyu(envanter.bekleme_suresi())
+    return bulunanlar
+
+
+def tam_gun_adaptif() -> Dict[str, Any]:
+    """Önceki haftanın geliş örüntüsünü bilen adaptif aralıkla 00:00-24:00 arası tam gün;
+    iki saatte bir 3 dakika stokta kalan bir hedef araç gelir
+
+    Aynı gün sabit aralıkla da çalıştırılır. Adaptif kontrol mesai saatlerinde
+    (gelişlerin %80'i) hedefleri daha erken bulmalı, gün boyunca en az %20 daha
+    az istek yapmalıdır. Tasarruf yoğun saatlerin günün ne kadarını kapladığıyla
+    sınırlıdır: mesai saatlerinde sabit aralıktan sık sorgulandığı için sessiz
+    saatlerde hiç istek yapılmasa bile bu örüntüde tasarruf ~%40'ı geçemez.
+    """
+    uretec = SentetikEnvanter(tohum=3)
+    gun_basi = GUN.timestamp()
+    hedefler = [(gun_basi + i * 7200 + uretec.rng.uniform(0, 7200), _arac(uretec, True)) for i in range(12)]
+    akis = _gunluk_akis(uretec, 8, 400) + [(gelis, gelis + 180, hedef) for gelis, hedef in hedefler]
+
+    sorgular = {}
+    gecikmeler = {}
+    for adaptif in (False, True):
+        saat = SanalSaat(_an('00:00'))
+        config = _config(satis_baslangic_saati='00:00', adaptif_kontrol=adaptif, kontrol_araligi=30,
+                         minimum_aralik=1.0, maksimum_aralik=300.0, maksimum_deneme=100_000)
+        envanter = SimuleEnvanter(config, saat, akis)
+        if adaptif:
+            _gecmisi_ogren(envanter.zamanlayici, akis, gun_basi - 7 * 86400, gun_basi)
+        bulunanlar = _gun_boyu_kontrol(envanter, gun_basi + 86400)
+        sorgular[adaptif] = len(envanter.sorgu_zamanlari)
+        gecikmeler[adaptif] = {
+            hedef.vin: bulunanlar[hedef.vin] - gelis for gelis, hedef in hedefler if hedef.vin in bulunanlar
+        }
+
+    def mesai_ortalamasi(adaptif: bool) -> float:
+        mesai = [gecikmeler[adaptif][hedef.vin] for gelis, hedef in hedefler
+                 if 8 <= (gelis - gun_basi) / 3600 < 18 and hedef.vin in gecikmeler[adaptif]]
+        return sum(mesai) / len(mesai) if mesai else float('inf')
+
+    hatalar = []
+    kacan = len(hedefler) - len(gecikmeler[True])
+    if kacan:
+        hatalar.append(f"3 dakika stokta kalan {kacan} hedef araç kaçırıldı")
+    if sorgular[True] > 0.8 * sorgular[False]:
+        hatalar.append(f"adaptif kontrol {sorgular[True]} sorgu yaptı, sabit aralık {sorgular[False]}")
+    if mesai_ortalamasi(True) >= mesai_ortalamasi(False):
+        hatalar.append(f"mesai saatlerinde adaptif bulma gecikmesi {mesai_ortalamasi(True):.1f} sn, "
+                       f"sabit aralık {mesai_ortalamasi(False):.1f} sn")
+    return {'sorgu': sorgular[True], 'sabit_sorgu': sorgular[False],
+            'tasarruf': f"%{100 * (1 - sorgular[True] / sorgular[False]):.0f}",
+            'mesai_gecikme_sn': round(mesai_ortalamasi(True), 1),
+            'sabit_mesai_gecikme_sn': round(mesai_ortalamasi(False), 1),
+            'bitis': saat.simdi().strftime('%d %H:%M'), 'hatalar': hatalar}
+
+
+def hiz_siniri() -> Dict[str, Any]:
+    """Yerel sunucu önce 429 (Retry-After: 30), ardından 503 fırtınası döndürür"""
+    saat = SanalSaat(_an('18:00'))
+    sunucu = YerelEnvanterSunucusu(adet=300, tohum=4, saat=saat).baslat()
+    sunucu.zorla(429, 2, retry_after='30')
+    sunucu.zorla(503, 8)
+
+    envanter = TeslaEnvanter(_config(kontrol_araligi=5, maksimum_deneme=200), api_url=sunucu.url, saat=saat)
+    uyarilar = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(uyarilar):
+            bulunan = envanter.surekli_kontrol()
+    finally:
+        envanter.kapat()
+        sunucu.durdur()
+
+    gecen = saat.zaman() - _an('18:00').timestamp()
+    durum = next(iter(envanter.yonetici.durum().values()))
+    hatalar = []
+    if bulunan is None:
+        hatalar.append("sunucu düzeldikten sonra araç bulunamadı")
+    if durum['toplam_hata'] != 10:
+        hatalar.append(f"{durum['toplam_hata']} hatalı istek (beklenen 10, fazlası fırtına demek)")
+    if gecen < 60:
+        hatalar.append(f"Retry-After'a uyulmadı (toplam {gecen:.0f} sn)")
+    if "devre açıldı" not in uyarilar.getvalue():
+        hatalar.append("ardışık hatalarda devre açılmadı")
+    if durum['devre'] != 'kapali':
+        hatalar.append(f"devre {durum['devre']} durumda kaldı")
+    return {'istek': sunucu.istek_sayisi, 'hatali': durum['toplam_hata'],
+            'sanal_sure_sn': round(gecen), 'hatalar': hatalar}
+
+
+def paylasilan_kontrol() -> Dict[str, Any]:
+    """Tek yayıncı, farklı tercihli üç abone; envanter her turda değişir
+
+    Yayıncı abonelerin birleşik filtresiyle ve en yüksek fiyat limitine
+    kadar sayfalar; her abonenin limitine uyan tüm araçlar kopyada olmalı
+    ve istek sayısı filtresiz tam sayfalamadan az olmalıdır.
+    """
+    saat = SanalSaat(_an('18:00'))
+    sunucu = YerelEnvanterSunucusu(adet=300, tohum=5, saat=saat).baslat()
+    yayinci = EnvanterYayinci(
+        TeslaEnvanter(yayinci_config(isitma_oncesi=0), api_url=sunucu.url, saat=saat), port=0
+    ).baslat()
+
+    temel = _config()
+    tercihler = [
+        temel.tercih,
+        temel.tercih.copy(update={'maksimum_fiyat': 2_400_000, 'renk_tercihi': list(RenkTercihi)}),
+        temel.tercih.copy(update={'maksimum_fiyat': 3_000_000, 'renk_tercihi': [RenkTercihi.SIYAH]}),
+    ]
+    aboneler = [
+        PaylasilanEnvanter(temel.copy(update={'tercih': tercih}), adres=yayinci.adres, saat=saat)
+        for tercih in tercihler
+    ]
+
+    turlar = 5
+    filtresiz_istek = 0
+    hatalar = []
+    try:
+        # Aboneler bağlanınca tercihlerini kendi thread'lerinde gönderir
+        bitis = time.monotonic() + 5.0
+        while yayinci.hazir_abone_sayisi < len(aboneler) and time.monotonic() < bitis:
+            time.sleep(0.01)
+        if yayinci.hazir_abone_sayisi < len(aboneler):
+            hatalar.append(f"{yayinci.hazir_abone_sayisi}/{len(aboneler)} abone tercih gönderdi")
+
+        for tur in range(turlar):
+            if tur:
+                sunucu.ilerlet(0.05, 0.05)
+            with sunucu._kilit:
+                adet = len(sunucu._araclar)
+            filtresiz_istek += -(-adet // TeslaEnvanter.SAYFA_BOYUTU)
+            yayinci.kontrol_et()
+            kopyalar = []
+            for sira, (abone, tercih) in enumerate(zip(aboneler, tercihler)):
+                if not abone.abone.bekle(yayinci.surum - 1, 5.0):
+                    hatalar.append(f"tur {tur}: abone {sira} sürüm {yayinci.surum} almadı")
+                    continue
+                kopya = {arac.vin for arac in abone.abone.araclar()}
+                kopyalar.append(kopya)
+                gereken = {
+                    kayit['VIN'] for kayit in sunucu._filtrele(sorgu_secenekleri([tercih]))
+                    if kayit['Price'] <= tercih.maksimum_fiyat
+                }
+                if gereken - kopya:
+                    hatalar.append(f"tur {tur}: abone {sira} limitine uyan {len(gereken - kopya)} araç kopyada yok")
+                abone.uygun_arac_bul()
+                if abone.son_hata:
+                    hatalar.append(f"tur {tur}: abone {sira}: {abone.son_hata}")
+            if any(kopya != kopyalar[0] for kopya in kopyalar):
+                hatalar.append(f"tur {tur}: abonelerin envanter kopyaları farklı")
+    finally:
+        for abone in aboneler:
+            abone.kapat()
+        yayinci.durdur()
+        sunucu.durdur()
+
+    if sunucu.istek_sayisi >= filtresiz_istek:
+        hatalar.append(f"{sunucu.istek_sayisi} upstream istek (filtresiz sayfalama {filtresiz_istek})")
+    return {'abone': len(aboneler), 'tur': turlar, 'istek': sunucu.istek_sayisi,
+            'filtresiz': filtresiz_istek, 'surum': yayinci.surum, 'hatalar': hatalar}
+
+
+def canli_ayar() -> Dict[str, Any]:
+    """Satış sırasında fiyat limiti yükseltilir ve aralık kısaltılır; bot yeniden başlatılmaz"""
+    uretec = SentetikEnvanter(tohum=6)
+    hedef = _arac(uretec, True)
+    hedef.fiyat = 2_250_000  # Başlangıçtaki 2.100.000 TL limitin üstünde
+    gelis = _an('18:01').timestamp()
+    akis = _arka_plan(uretec, 200) + [(gelis, gelis + 3600, hedef)]
+
+    saat = SanalSaat(_an('18:00'))
+    envanter = SimuleEnvanter(_config(kontrol_araligi=10, maksimum_deneme=500), saat, akis)
+    oturum = envanter.session
+    guncelleme_ani = _an('18:05').timestamp()
+    envanter.guncellemeler.append(
+        (guncelleme_ani, {'tercih': {'maksimum_fiyat': 2_300_000}, 'bot': {'kontrol_araligi': 2}})
+    )
+
+    hatalar = []
+    try:
+        envanter.config_guncelle({'bot': {'minimum_aralik': 30, 'maksimum_aralik': 5}})
+        hatalar.append("geçersiz güncelleme kabul edildi")
+    except ValidationError:
+        pass
+
+    bulunan = envanter.surekli_kontrol()
+    # Güncellemenin geldiği sorgudan sonraki sorgu
+    sonrasi = [z for z in envanter.sorgu_zamanlari if z >= guncelleme_ani][1:]
+    gecikme = saat.zaman() - guncelleme_ani
+    if bulunan is not hedef:
+        hatalar.append("limit yükseltildikten sonra hedef araç bulunamadı")
+    if not sonrasi or sonrasi[0] - guncelleme_ani > 2:
+        hatalar.append("yeni kontrol aralığı bir sonraki turda uygulanmadı")
+    if envanter.session is not oturum:
+        hatalar.append("HTTP oturumu yeniden oluşturuldu")
+    if envanter.config.bot.minimum_aralik == 30:
+        hatalar.append("reddedilen güncelleme çalışan konfigürasyona sızdı")
+    return {'sorgu': len(envanter.sorgu_zamanlari), 'gecikme_sn': round(gecikme, 1),
+            'aralik': envanter.config.bot.kontrol_araligi, 'hatalar': hatalar}
+
+
+class _IlkSorguEnvanteri(TeslaEnvanter):
+    """İlk envanter sorgusunun (sunucuya göre) zamanını kaydeden envanter"""
+
+    def __init__(self, *args, sunucu_farki: float, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sunucu_farki = sunucu_farki
+        self.ilk_sorgu: Optional[float] = None
+
+    def ham_sayfalar(self):
+        if self.ilk_sorgu is None:
+            self.ilk_sorgu = self.saat.zaman() + self.sunucu_farki
+        return super().ham_sayfalar()
+
+
+def saat_farki() -> Dict[str, Any]:
+    """Yerel saat sunucudan 7,4 sn geride; ilk sorgu sunucu saatiyle 17:59:00'da yapılmalı"""
+    fark = 7.4
+    saat = SanalSaat(_an('17:55'))
+    sunucu = YerelEnvanterSunucusu(adet=300, tohum=7, saat=saat, saat_farki=fark).baslat()
+    envanter = _IlkSorguEnvanteri(
+        _config(bot_korumalari=True, kontrol_araligi=5, maksimum_deneme=80, isitma_oncesi=30),
+        api_url=sunucu.url, saat=saat, sunucu_farki=fark,
+    )
+    try:
+        envanter.surekli_kontrol()
+    finally:
+        envanter.kapat()
+        sunucu.durdur()
+
+    durum = envanter.saat_farki.durum()
+    hatalar = []
+    if envanter.ilk_sorgu is None:
+        hatalar.append("envanter hiç sorgulanmadı")
+    else:
+        erken = _an('17:59').timestamp() - envanter.ilk_sorgu
+        if erken > 0:
+            hatalar.append(f"satıştan {erken:.2f} sn önce sorgu yapıldı")
+        elif -erken > 0.5:
+            hatalar.append(f"ilk sorgu satıştan {-erken:.2f} sn sonra")
+    if durum['belirsizlik_sn'] is None or abs(durum['fark_sn'] - fark) > durum['belirsizlik_sn']:
+        hatalar.append(f"tahmin {durum['fark_sn']} ± {durum['belirsizlik_sn']} gerçek farkı ({fark}) kapsamıyor")
+    elif durum['belirsizlik_sn'] > 0.25:
+        hatalar.append(f"belirsizlik {durum['belirsizlik_sn']} sn")
+    ilk = envanter.ilk_sorgu and datetime.fromtimestamp(envanter.ilk_sorgu).strftime('%H:%M:%S.%f')[:-3]
+    return {'fark_sn': durum['fark_sn'], 'belirsizlik_sn': durum['belirsizlik_sn'], 'ornek': durum['ornek'],
+            'ilk_sorgu': ilk, 'hatalar': hatalar}
+
+
+SENARYOLAR: Dict[str, Callable[[], Dict[str, Any]]] = {
+    'satis_gecisi': satis_gecisi,
+    'deneme_tukenmesi': deneme_tukenmesi,
+    'tam_gun_adaptif': tam_gun_adaptif,
+    'hiz_siniri': hiz_siniri,
+    'paylasilan_kontrol': paylasilan_kontrol,
+    'canli_ayar': canli_ayar,
+    'saat_farki': saat_farki,
+}
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Sanal saatli kontrol döngüsü senaryoları")
+    parser.add_argument('senaryo', nargs='*', help=f"Çalıştırılacak senaryolar ({', '.join(SENARYOLAR)})")
+    parser.add_argument('--tohum', type=int, default=42, help="Bekleme sapması için rastgele tohum")
+    args = parser.parse_args(argv)
+    for ad in args.senaryo:
+        if ad not in SENARYOLAR:
+            parser.error(f"bilinmeyen senaryo: {ad}")
+
+    basarisiz = 0
+    for ad in args.senaryo or SENARYOLAR:
+        random.seed(args.tohum)
+        t0 = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            sonuc = SENARYOLAR[ad]()
+        sure_ms = (time.perf_counter() - t0) * 1000
+
+        hatalar = sonuc.pop('hatalar')
+        durum = "HATA" if hatalar else "OK"
+        ayrinti = ' '.join(f"{k}={v}" for k, v in sonuc.items())
+        print(f"[{durum}] {ad:<18} {sure_ms:8.1f} ms  {ayrinti}")
+        for hata in hatalar:
+            print(f"    {hata}")
+        basarisiz += bool(hatalar)
+
+    return 1 if basarisiz else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,274 @@
+"""
+Uzun Süreli Çalışma (Soak) Testi
+Yerel envanter sunucusuna karşı saatlerce simüle edilmiş kontrol yapar,
+belirli aralıklarla yerel sipariş sayfalarında tarayıcıyı başlatıp sipariş
+verir ve kapatır; bellek (RSS), açık dosya tanımlayıcıları, Chrome alt
+süreçleri ve Chrome profil dizini boyutundaki büyümeyi izler.
+
+Tarayıcı döngüsü yerel Chrome kurulumu gerektirir; `--tarayicisiz` ile
+yalnızca envanter döngüsü çalışır ve Chrome/profil kontrolleri yapılmaz.
+
+Kullanım:
+    python -m benchmarks.soak --saat 8 --aralik 5
+    python -m benchmarks.soak --saat 1 --tarayicisiz
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from benchmarks.inventory_bench import benchmark_config
+from features.inventory import TeslaEnvanter, EnvanterArac
+from features.order_bot import TeslaSiparisBot
+from utils.clock import SanalSaat
+from utils.mock_checkout import YerelSiparisSunucusu
+from utils.mock_server import YerelEnvanterSunucusu
+from utils.synthetic import SentetikEnvanter
+
+
+# Sipariş döngüsünde kullanılan sentetik aracın tohumu
+TOHUM_SIPARIS = 1
+
+
+def rss_bayt() -> int:
+    """Sürecin anlık fiziksel bellek kullanımı"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        import resource
+        # Linux dışı sistemlerde yalnızca tepe değer bilinebilir
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def acik_fd_sayisi() -> Optional[int]:
+    """Açık dosya tanımlayıcısı sayısı"""
+    for yol in ('/proc/self/fd', '/dev/fd'):
+        if os.path.isdir(yol):
+            return len(os.listdir(yol))
+    return None
+
+
+def chrome_surec_sayisi() -> int:
+    """Bu sürecin altındaki Chrome/chromedriver süreçlerinin sayısı"""
+    if not os.path.isdir('/proc'):
+        return 0
+    ebeveynler: Dict[int, int] = {}
+    adlar: Dict[int, str] = {}
+    for girdi in os.listdir('/proc'):
+        if not girdi.isdigit():
+            continue
+        try:
+            with open(f'/proc/{girdi}/stat') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # stat: pid (ad) durum ppid ...
+        ad = stat[stat.index('(') + 1:stat.rindex(')')]
+        ppid = int(stat[stat.rindex(')') + 2:].split()[1])
+        ebeveynler[int(girdi)] = ppid
+        adlar[int(girdi)] = ad
+
+    kok = os.getpid()
+    sayi = 0
+    for pid, ad in adlar.items():
+        if 'chrom' not in ad.lower():
+            continue
+        ata = ebeveynler.get(pid)
+        while ata and ata != kok:
+            ata = ebeveynler.get(ata)
+        if ata == kok:
+            sayi += 1
+    return sayi
+
+
+def dizin_boyutu(yol: str) -> int:
+    """Dizindeki dosyaların toplam boyutu (bayt)"""
+    toplam = 0
+    for kok, _, dosyalar in os.walk(yol):
+        for dosya in dosyalar:
+            try:
+                toplam += os.path.getsize(os.path.join(kok, dosya))
+            except OSError:
+                pass
+    return toplam
+
+
+def _egim(noktalar: List[Dict[str, float]], alan: str) -> float:
+    """Simüle saat başına doğrusal büyüme (en küçük kareler)"""
+    xs = [n['saat'] for n in noktalar]
+    ys = [n[alan] for n in noktalar]
+    if len(xs) < 2:
+        return 0.0
+    ort_x = sum(xs) / len(xs)
+    ort_y = sum(ys) / len(ys)
+    pay = sum((x - ort_x) * (y - ort_y) for x, y in zip(xs, ys))
+    payda = sum((x - ort_x) ** 2 for x in xs)
+    return pay / payda if payda else 0.0
+
+
+def _siparis_botu(siparis_sunucusu: YerelSiparisSunucusu, profil_dizini: str) -> TeslaSiparisBot:
+    """Geçici profil dizini kullanan, yerel sipariş sayfalarına giden headless bot"""
+    config = benchmark_config()
+    # Profil dizini yalnızca bot korumaları açıkken kullanılır
+    config.bot.bot_korumalari = True
+    config.bot.headless_mod = True
+    config.bot.hata_kaydi = False
+    config.bot.chrome_profil_dizini = profil_dizini
+    # Rastgele beklemeler ayrı bir sanal saatle atlanır
+    return TeslaSiparisBot(config, saat=SanalSaat(), tasarim_url=siparis_sunucusu.tasarim_url)
+
+
+def calistir(saat: float, aralik: float, adet: int, ornek_araligi: int,
+             siparis_araligi: int = 0) -> List[Dict[str, float]]:
+    """Simülasyonu çalıştır ve ölçüm noktalarını döndür
+
+    `siparis_araligi` > 0 ise her o kadar döngüde bir tarayıcı başlatılıp
+    yerel sipariş sayfalarında sipariş verilir ve tarayıcı kapatılır; Chrome
+    başlatılamazsa RuntimeError fırlatılır.
+    """
+    config = benchmark_config()
+    sunucu = YerelEnvanterSunucusu(adet=adet).baslat()
+    # İstek bütçesi ve geri çekilme simüle edilen zamana göre işlesin
+    sanal_saat = SanalSaat()
+    envanter = TeslaEnvanter(config, api_url=sunucu.url, saat=sanal_saat)
+
+    tarayicili = siparis_araligi > 0
+    siparis_sunucusu = bot = None
+    profil_dizini = tempfile.mkdtemp(prefix="soak_profil_")
+    if tarayicili:
+        siparis_sunucusu = YerelSiparisSunucusu().baslat()
+        bot = _siparis_botu(siparis_sunucusu, profil_dizini)
+        arac = EnvanterArac(SentetikEnvanter(tohum=TOHUM_SIPARIS).arac())
+
+    dongu_sayisi = int(saat * 3600 / aralik)
+    denenen = 0
+    noktalar = []
+    t0 = time.perf_counter()
+    try:
+        if tarayicili:
+            try:
+                with contextlib.redirect_stdout(io.StringIO()):
+                    bot.tarayici_baslat()
+            except Exception as e:
+                raise RuntimeError(f"Chrome başlatılamadı (yerel Chrome kurulumu gerekli): {str(e)}") from e
+            finally:
+                bot.tarayici_kapat()
+
+        for dongu in range(1, dongu_sayisi + 1):
+            sunucu.ilerlet()
+            sanal_saat.ilerlet(aralik)
+            with contextlib.redirect_stdout(io.StringIO()):
+                envanter.uygun_arac_bul()
+                if tarayicili and dongu % siparis_araligi == 0:
+                    denenen += 1
+                    # siparis_ver tarayıcıyı kendisi başlatıp kapatır
+                    bot.siparis_ver(arac)
+
+            if dongu % ornek_araligi == 0 or dongu == dongu_sayisi:
+                nokta = {
+                    'dongu': dongu,
+                    'saat': dongu * aralik / 3600,
+                    'rss_mb': rss_bayt() / 1e6,
+                    'fd': acik_fd_sayisi() or 0,
+                }
+                satir = (f"[SOAK] {nokta['saat']:6.2f} sa | RSS {nokta['rss_mb']:7.1f} MB | "
+                         f"FD {nokta['fd']:4d}")
+                if tarayicili:
+                    nokta['chrome'] = chrome_surec_sayisi()
+                    nokta['profil_mb'] = dizin_boyutu(profil_dizini) / 1e6
+                    nokta['siparis'] = len(siparis_sunucusu.siparisler)
+                    nokta['denenen'] = denenen
+                    satir += (f" | Chrome {nokta['chrome']:2d} | Profil {nokta['profil_mb']:6.1f} MB | "
+                              f"Sipariş {nokta['siparis']}/{denenen}")
+                noktalar.append(nokta)
+                print(satir)
+    finally:
+        if bot:
+            bot.tarayici_kapat()
+            bot.olaylar.kapat()
+        if siparis_sunucusu:
+            siparis_sunucusu.durdur()
+        envanter.kapat()
+        sunucu.durdur()
+        shutil.rmtree(profil_dizini, ignore_errors=True)
+
+    print(f"[SOAK] {dongu_sayisi} döngü {time.perf_counter() - t0:.1f} sn sürdü "
+          f"({sunucu.istek_sayisi} istek, {denenen} sipariş denemesi)")
+    return noktalar
+
+
+def degerlendir(noktalar: List[Dict[str, float]], rss_limiti_mb: float,
+                fd_limiti: int, profil_limiti_mb: float) -> List[str]:
+    """Isınma sonrası büyümeyi limitlerle karşılaştır"""
+    isinma = max(1, len(noktalar) // 10)
+    kararli = noktalar[isinma:] or noktalar
+    ilk, son = kararli[0], kararli[-1]
+
+    hatalar = []
+    if son['rss_mb'] - ilk['rss_mb'] > rss_limiti_mb:
+        hatalar.append(f"RSS {ilk['rss_mb']:.1f} -> {son['rss_mb']:.1f} MB "
+                       f"({_egim(kararli, 'rss_mb'):+.2f} MB/sa)")
+    if son['fd'] - ilk['fd'] > fd_limiti:
+        hatalar.append(f"Açık FD {ilk['fd']} -> {son['fd']}")
+    # Chrome ölçümleri yalnızca tarayıcı döngüsü çalıştıysa vardır
+    if 'chrome' in son:
+        if son['chrome'] > 0:
+            hatalar.append(f"{son['chrome']} Chrome süreci açık kaldı")
+        if son['profil_mb'] - ilk['profil_mb'] > profil_limiti_mb:
+            hatalar.append(f"Chrome profili {ilk['profil_mb']:.1f} -> {son['profil_mb']:.1f} MB")
+        if son['siparis'] < son['denenen']:
+            hatalar.append(f"{son['denenen'] - son['siparis']}/{son['denenen']} sipariş yerel sunucuya ulaşmadı")
+    return hatalar
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Uzun süreli çalışma sızıntı testi")
+    parser.add_argument('--saat', type=float, default=8.0, help="Simüle edilecek süre (saat)")
+    parser.add_argument('--aralik', type=float, default=5.0, help="Simüle kontrol aralığı (saniye)")
+    parser.add_argument('--adet', type=int, default=2000, help="Yerel sunucudaki araç sayısı")
+    parser.add_argument('--ornek', type=int, default=200, help="Kaç döngüde bir ölçüm alınsın")
+    parser.add_argument('--siparis-araligi', type=int, default=100,
+                        help="Kaç döngüde bir tarayıcıyla yerel sipariş verilsin")
+    parser.add_argument('--tarayicisiz', action='store_true',
+                        help="Tarayıcı döngüsünü atla (Chrome/profil kontrolleri yapılmaz)")
+    parser.add_argument('--rss-limiti', type=float, default=20.0, help="İzin verilen RSS büyümesi (MB)")
+    parser.add_argument('--fd-limiti', type=int, default=2, help="İzin verilen açık FD artışı")
+    parser.add_argument('--profil-limiti', type=float, default=50.0, help="İzin verilen profil büyümesi (MB)")
+    parser.add_argument('--rapor', help="Ölçümlerin yazılacağı JSON dosyası")
+    args = parser.parse_args(argv)
+
+    siparis_araligi = 0 if args.tarayicisiz else max(1, args.siparis_araligi)
+    try:
+        noktalar = calistir(args.saat, args.aralik, args.adet, args.ornek, siparis_araligi)
+    except RuntimeError as e:
+        print(f"[HATA] {str(e)} (yalnızca envanter döngüsü için --tarayicisiz)")
+        return 2
+
+    if args.rapor:
+        with open(args.rapor, 'w', encoding='utf-8') as f:
+            json.dump(noktalar, f, indent=2)
+
+    hatalar = degerlendir(noktalar, args.rss_limiti, args.fd_limiti, args.profil_limiti)
+    if hatalar:
+        print("\n[HATA] Büyüme tespit edildi:")
+        for hata in hatalar:
+            print(f"  {hata}")
+        return 1
+
+    if siparis_araligi:
+        print("\n[BAŞARI] Bellek, FD, Chrome süreci ve profil boyutu sabit kaldı")
+    else:
+        print("\n[BAŞARI] Bellek ve FD sabit kaldı (tarayıcı döngüsü çalıştırılmadı)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
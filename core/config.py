@@ -4,10 +4,12 @@ Kullanıcı hesabı, kart bilgisi ve araç tercihleri için veri modelleri
 """
 
 from pydantic import BaseModel, Field, validator
-from typing import Optional, List
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 from enum import Enum
 
+from core.markets import VARSAYILAN_PAZAR, basliklar, pazar_getir
+
 
 class RenkTercihi(str, Enum):
     """Araç renk seçenekleri"""
@@ -33,6 +35,12 @@ class AracTipi(str, Enum):
     PERF = "Performance"
 
 
+class TarayiciProtokolu(str, Enum):
+    """Sipariş adımlarında tarayıcıyla konuşma yöntemi"""
+    SELENIUM = "selenium"
+    CDP = "cdp"
+
+
 class KullaniciHesabi(BaseModel):
     """Tesla hesap bilgileri"""
     ad: str = Field(..., min_length=2, description="Kullanıcı adı")
@@ -104,7 +112,7 @@ class KartBilgisi(BaseModel):
 class AracTercihi(BaseModel):
     """Araç tercihleri ve limitler"""
     arac_tipi: AracTipi = Field(default=AracTipi.SR, description="Araç tipi")
-    maksimum_fiyat: float = Field(..., gt=0, description="Maksimum fiyat limiti (TL)")
+    maksimum_fiyat: float = Field(..., gt=0, description="Maksimum fiyat limiti (pazarın para biriminde)")
     renk_tercihi: List[RenkTercihi] = Field(
         default=[RenkTercihi.KIRMIZI, RenkTercihi.STANDART],
         description="Renk tercihleri (öncelik sırasına göre)"
@@ -114,6 +122,23 @@ class AracTercihi(BaseModel):
         description="Otomatik koltuk rengi kuralı (kırmızı araç=standart, diğer=beyaz)"
     )
     teslimat_posta_kodu: str = Field(..., pattern=r'^[0-9]{5}$', description="Teslimat posta kodu")
+    zorunlu_secenekler: List[str] = Field(
+        default_factory=list,
+        description="Araçta bulunması gereken opsiyon kodları (örn. WY20P jant, TW01 çeki demiri)"
+    )
+    yasak_secenekler: List[str] = Field(
+        default_factory=list,
+        description="Araçta bulunmaması gereken opsiyon kodları (örn. STY7S 7 koltuk)"
+    )
+    
+    @validator('zorunlu_secenekler', 'yasak_secenekler')
+    def secenek_kodlari(cls, v):
+        kodlar = []
+        for kod in v:
+            kod = kod.strip().upper()
+            if kod and kod not in kodlar:
+                kodlar.append(kod)
+        return kodlar
     
     def koltuk_rengini_belirle(self, arac_rengi: str) -> KoltukRengi:
         """Araç rengine göre koltuk rengini belirle"""
@@ -131,7 +156,9 @@ class AracTercihi(BaseModel):
                 "maksimum_fiyat": 2000000.0,
                 "renk_tercihi": ["red", "standard"],
                 "koltuk_rengi_kurali": True,
-                "teslimat_posta_kodu": "06660"
+                "teslimat_posta_kodu": "06660",
+                "zorunlu_secenekler": ["WY20P"],
+                "yasak_secenekler": ["STY7S"]
             }
         }
 
@@ -144,7 +171,50 @@ class BotAyarlari(BaseModel):
     headless_mod: bool = Field(default=False, description="Tarayıcı headless modda çalışsın")
     debug_mod: bool = Field(default=False, description="Debug modunda çalıştır")
     satis_baslangic_saati: str = Field(default="17:59", pattern=r'^[0-2][0-9]:[0-5][0-9]$', description="Satış başlangıç saati")
-    
+    sunucu_filtresi: bool = Field(default=True, description="Tip ve renk filtrelerini envanter sorgusuna ekle")
+    baglanti_zaman_asimi: float = Field(default=3.05, gt=0, le=30, description="TCP/TLS bağlantı zaman aşımı (saniye)")
+    okuma_zaman_asimi: float = Field(default=10.0, gt=0, le=60, description="Yanıt okuma zaman aşımı (saniye)")
+    baglanti_havuzu: int = Field(default=4, ge=1, le=32, description="Host başına açık tutulacak bağlantı sayısı")
+    http2: bool = Field(default=False, description="HTTP/2 kullan (httpx[http2] gerektirir)")
+    isitma_oncesi: int = Field(default=30, ge=0, le=600, description="Satıştan kaç saniye önce bağlantı ısıtılsın (0=kapalı)")
+    chrome_profil_dizini: str = Field(default="/tmp/chrome_profile", description="Chrome kullanıcı profili dizini")
+    profil_modu: bool = Field(default=False, description="Kontrol döngüsü ve sipariş profillerini kaydet (debug modunda her zaman açık)")
+    profil_klasoru: str = Field(default="profiller", description="Profil dosyalarının kaydedileceği klasör")
+    profil_sayisi: int = Field(default=10, ge=1, le=1000, description="Saklanacak en yavaş profil sayısı")
+    adaptif_kontrol: bool = Field(default=False, description="Kontrol aralığını gözlenen araç geliş örüntüsüne göre uyarla")
+    minimum_aralik: float = Field(default=1.0, ge=0.5, le=60, description="Adaptif modda en kısa kontrol aralığı (saniye)")
+    maksimum_aralik: float = Field(default=60.0, ge=1, le=900, description="Adaptif modda en uzun kontrol aralığı (saniye)")
+    adaptif_gecmis_dosyasi: Optional[str] = Field(default=None, description="Öğrenilen geliş örüntüsünün saklanacağı JSON dosyası")
+    bildirim_webhook: Optional[str] = Field(default=None, pattern=r'^https?://', description="Olayların JSON olarak gönderileceği webhook adresi")
+    masaustu_bildirimi: bool = Field(default=False, description="Araç bulunduğunda ve sipariş sonucunda masaüstü bildirimi göster")
+    sesli_uyari: bool = Field(default=False, description="Araç bulunduğunda ve sipariş sonucunda sesli uyarı ver")
+    istek_butcesi: float = Field(default=60.0, ge=1, le=600, description="Endpoint başına dakikada en fazla istek (jeton kovası dolum hızı)")
+    istek_patlama: int = Field(default=10, ge=1, le=100, description="Art arda gönderilebilecek en fazla istek (jeton kovası kapasitesi)")
+    geri_cekilme_tabani: float = Field(default=2.0, gt=0, le=60, description="429/5xx sonrası ilk geri çekilme süresi (saniye)")
+    geri_cekilme_tavani: float = Field(default=300.0, gt=0, le=3600, description="Üstel geri çekilmenin üst sınırı (saniye)")
+    devre_esigi: int = Field(default=5, ge=1, le=100, description="Devre kesicinin açılması için ardışık hata sayısı")
+    devre_suresi: float = Field(default=120.0, gt=0, le=3600, description="Devre açıkken deneme isteğine kadar beklenecek süre (saniye)")
+    hata_kaydi: bool = Field(default=True, description="Başarısız sipariş adımlarında ekran görüntüsü, DOM ve logları kaydet")
+    hata_kayit_klasoru: str = Field(default="hata_kayitlari", description="Hata kayıtlarının yazılacağı klasör")
+    hata_kayit_limiti_mb: float = Field(default=200.0, gt=0, description="Hata kayıt klasörünün azami boyutu (MB)")
+    ag_kaydi: bool = Field(default=False, description="Hata kayıtlarına ağ olaylarını ekle (Chrome performans logu tüm sipariş boyunca açık kalır)")
+    sayfa_kaydi: bool = Field(default=False, description="Sipariş adımlarının sayfa HTML'ini seçici doğrulaması için kaydet")
+    sayfa_kayit_klasoru: str = Field(default="sayfa_kayitlari", description="Adım sayfalarının kaydedileceği klasör")
+    kontrol_sunucusu: Optional[str] = Field(default=None, pattern=r'^[\w.-]+:\d+$', description="Envanterin alınacağı paylaşılan kontrol sunucusu (host:port)")
+    tarayici_protokolu: TarayiciProtokolu = Field(default=TarayiciProtokolu.SELENIUM, description="Sipariş adımlarında Selenium veya doğrudan DevTools (CDP) bağlantısı")
+    pazar: str = Field(default=VARSAYILAN_PAZAR, description="Envanter ve siparişin yapılacağı pazar (data/pazarlar.json anahtarı)")
+
+    @validator('maksimum_aralik')
+    def aralik_sirasi(cls, v, values):
+        minimum = values.get('minimum_aralik')
+        if minimum is not None and v < minimum:
+            raise ValueError('Maksimum aralık minimum aralıktan küçük olamaz')
+        return v
+
+    @validator('pazar')
+    def pazar_kayitli(cls, v):
+        return pazar_getir(v).kod
+
     class Config:
         schema_extra = {
             "example": {
@@ -153,7 +223,71 @@ class BotAyarlari(BaseModel):
                 "bot_korumalari": True,
                 "headless_mod": False,
                 "debug_mod": False,
-                "satis_baslangic_saati": "17:59"
+                "satis_baslangic_saati": "17:59",
+                "sunucu_filtresi": True,
+                "baglanti_zaman_asimi": 3.05,
+                "okuma_zaman_asimi": 10.0,
+                "baglanti_havuzu": 4,
+                "http2": False,
+                "isitma_oncesi": 30,
+                "profil_modu": False,
+                "adaptif_kontrol": False,
+                "minimum_aralik": 1.0,
+                "maksimum_aralik": 60.0,
+                "masaustu_bildirimi": False,
+                "sesli_uyari": False,
+                "istek_butcesi": 60.0,
+                "istek_patlama": 10,
+                "devre_esigi": 5,
+                "hata_kaydi": True,
+                "hata_kayit_limiti_mb": 200.0,
+                "ag_kaydi": False,
+                "sayfa_kaydi": False,
+                "kontrol_sunucusu": None,
+                "tarayici_protokolu": "selenium",
+                "pazar": "TR"
+            }
+        }
+
+
+class SiralamaAyarlari(BaseModel):
+    """Uygun araçlar arasında seçim için ağırlıklı puanlama
+
+    Her terim adaylar arasında 0-1 aralığına ölçeklenir ve ağırlığıyla
+    çarpılır; toplam puanı en düşük olan araç seçilir. Varsayılan ağırlıklar
+    önce renk önceliğine, sonra fiyata bakar.
+    """
+    fiyat_agirligi: float = Field(default=1.0, ge=0, description="Fiyat terimi ağırlığı")
+    renk_agirligi: float = Field(default=10.0, ge=0, description="Renk tercih sırası terimi ağırlığı")
+    teslimat_agirligi: float = Field(default=0.0, ge=0, description="Tahmini teslimat tarihi (ETA) terimi ağırlığı")
+    mesafe_agirligi: float = Field(default=0.0, ge=0, description="Teslimat posta koduna kuş uçuşu mesafe terimi ağırlığı")
+    lokasyon_agirligi: float = Field(default=0.0, ge=0, description="Lokasyon tercih sırası terimi ağırlığı")
+    durum_agirligi: float = Field(default=0.0, ge=0, description="Yoldaki (InTransit) araç cezası ağırlığı")
+    tercih_edilen_lokasyonlar: List[str] = Field(
+        default_factory=list,
+        description="Öncelik sırasına göre tercih edilen teslimat lokasyonları (MetroName)"
+    )
+    maksimum_teslimat_gun: Optional[int] = Field(default=None, ge=0, description="Bu kadar günden geç teslim edilecek araçları ele")
+    maksimum_mesafe_km: Optional[float] = Field(default=None, gt=0, description="Teslimat posta kodundan bu mesafeden uzaktaki araçları ele (konumu bilinmeyenler elenmez)")
+    minimum_menzil: Optional[int] = Field(default=None, ge=0, description="Bu menzilin (km) altındaki araçları ele")
+    yoldakiler_dahil: bool = Field(default=True, description="Henüz stoğa girmemiş (InTransit) araçları da değerlendir")
+    aday_sayisi: int = Field(default=5, ge=1, le=100, description="Puan dökümüyle raporlanacak en iyi aday sayısı")
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "fiyat_agirligi": 1.0,
+                "renk_agirligi": 10.0,
+                "teslimat_agirligi": 2.0,
+                "mesafe_agirligi": 1.0,
+                "lokasyon_agirligi": 0.5,
+                "durum_agirligi": 0.5,
+                "tercih_edilen_lokasyonlar": ["İstanbul", "Ankara"],
+                "maksimum_teslimat_gun": 60,
+                "maksimum_mesafe_km": 500.0,
+                "minimum_menzil": None,
+                "yoldakiler_dahil": True,
+                "aday_sayisi": 5
             }
         }
 
@@ -163,7 +297,43 @@ class TeslaConfig(BaseModel):
     kullanici: KullaniciHesabi
     kart: KartBilgisi
     tercih: AracTercihi
+    yedek_tercihler: List[AracTercihi] = Field(
+        default_factory=list,
+        description="Ana tercih bulunamazsa sırayla denenecek yedek tercihler"
+    )
     bot: BotAyarlari = Field(default_factory=BotAyarlari)
+    siralama: SiralamaAyarlari = Field(default_factory=SiralamaAyarlari)
+    
+    def tercih_profilleri(self) -> List[AracTercihi]:
+        """Ana tercih ve yedekleri öncelik sırasıyla döndür"""
+        return [self.tercih] + list(self.yedek_tercihler)
+    
+    def guncelle(self, degisiklikler: Dict[str, Any]) -> 'TeslaConfig':
+        """Değişiklikleri iç içe birleştirip doğrulanmış yeni konfigürasyon döndür
+        
+        Örn. {'tercih': {'maksimum_fiyat': 2100000}}. Geçersiz değerler
+        mevcut doğrulayıcılar tarafından ValidationError ile reddedilir.
+        """
+        def birlestir(eski: Dict[str, Any], yeni: Dict[str, Any]) -> Dict[str, Any]:
+            sonuc = dict(eski)
+            for anahtar, deger in yeni.items():
+                if isinstance(deger, dict) and isinstance(sonuc.get(anahtar), dict):
+                    deger = birlestir(sonuc[anahtar], deger)
+                sonuc[anahtar] = deger
+            return sonuc
+        
+        return type(self)(**birlestir(self.dict(), degisiklikler))
+    
+    def degisen_alanlar(self, diger: 'TeslaConfig') -> List[str]:
+        """İki konfigürasyon arasında değişen alanlar ('bot.kontrol_araligi' gibi)"""
+        alanlar = []
+        eski, yeni = self.dict(), diger.dict()
+        for bolum in yeni:
+            if isinstance(yeni[bolum], dict) and isinstance(eski.get(bolum), dict):
+                alanlar += [f"{bolum}.{alan}" for alan in yeni[bolum] if yeni[bolum][alan] != eski[bolum].get(alan)]
+            elif yeni[bolum] != eski.get(bolum):
+                alanlar.append(bolum)
+        return alanlar
     
     class Config:
         schema_extra = {
@@ -171,29 +341,27 @@ class TeslaConfig(BaseModel):
                 "kullanici": KullaniciHesabi.Config.schema_extra["example"],
                 "kart": KartBilgisi.Config.schema_extra["example"],
                 "tercih": AracTercihi.Config.schema_extra["example"],
-                "bot": BotAyarlari.Config.schema_extra["example"]
+                "bot": BotAyarlari.Config.schema_extra["example"],
+                "siralama": SiralamaAyarlari.Config.schema_extra["example"]
             }
         }
 
 
 # Bölgesel ayarlar
+_VARSAYILAN = pazar_getir(VARSAYILAN_PAZAR)
+
+
 class BolgeAyarlari:
-    """Türkiye bölgesi için sabit ayarlar"""
-    BASE_URL = "https://www.tesla.com/tr_TR"
-    INVENTORY_API = "https://www.tesla.com/tr_TR/api/tesla/inventory/tesla"
-    ORDER_URL = "https://www.tesla.com/tr_TR/modely/order"
-    DESIGN_URL = "https://www.tesla.com/tr_TR/modely/design#overview"
+    """Varsayılan pazar (Türkiye) için sabit ayarlar; değerler pazar kayıt defterinden gelir"""
+    BASE_URL = _VARSAYILAN.base_url
+    INVENTORY_API = _VARSAYILAN.envanter_api
+    ORDER_URL = _VARSAYILAN.siparis_url
+    DESIGN_URL = _VARSAYILAN.tasarim_url
     
-    MARKET = "TR"
-    LANGUAGE = "tr"
-    SUPER_REGION = "europe"
-    CURRENCY = "TRY"
+    MARKET = _VARSAYILAN.market
+    LANGUAGE = _VARSAYILAN.dil
+    SUPER_REGION = _VARSAYILAN.super_region
+    CURRENCY = _VARSAYILAN.para_birimi
     
     # API Headers
-    HEADERS = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "application/json",
-        "Accept-Language": "tr-TR,tr;q=0.9,en;q=0.8",
-        "Referer": BASE_URL,
-        "Origin": BASE_URL
-    } 
\ No newline at end of file
+    HEADERS = dict(basliklar(VARSAYILAN_PAZAR, False))
@@ -0,0 +1,178 @@
+"""
+Tesla Pazar Kayıt Defteri
+Pazar başına URL, pazar kodu, para birimi, yedek endpoint ve yanıt alanı
+varyantlarını `data/pazarlar.json` dosyasından okur
+
+Yeni bir pazar eklemek için dosyaya bir kayıt eklemek yeterlidir.
+"""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, Field, validator
+
+
+PAZAR_DOSYASI = Path(__file__).resolve().parent.parent / "data" / "pazarlar.json"
+VARSAYILAN_PAZAR = "TR"
+
+# Her pazarda gönderilen başlıklar; Referer, Origin ve Accept-Language pazardan gelir
+TEMEL_BASLIKLAR = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "application/json",
+}
+
+# Bot korumaları açıkken eklenen tarayıcı başlıkları
+KORUMA_BASLIKLARI = {
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Accept': '*/*',
+    'Connection': 'keep-alive',
+    'Cache-Control': 'no-cache',
+    'Pragma': 'no-cache',
+    'sec-ch-ua': '"Google Chrome";v="120", "Chromium";v="120", "Not-A.Brand";v="24"',
+    'sec-ch-ua-mobile': '?0',
+    'sec-ch-ua-platform': '"Windows"',
+    'sec-fetch-dest': 'empty',
+    'sec-fetch-mode': 'cors',
+    'sec-fetch-site': 'same-origin',
+}
+
+
+def _alan(data: Dict[str, Any], yol: str) -> Any:
+    """'data.results' gibi noktalı yolu sözlükte izle, yoksa None"""
+    deger: Any = data
+    for anahtar in yol.split('.'):
+        if not isinstance(deger, dict):
+            return None
+        deger = deger.get(anahtar)
+    return deger
+
+
+class Pazar(BaseModel):
+    """Tek bir pazarın envanter ve sipariş ayarları"""
+    kod: str = Field(..., description="Kayıt defterindeki pazar anahtarı")
+    ad: str = Field(..., description="Pazarın görünen adı")
+    base_url: str = Field(..., pattern=r'^https?://', description="Yerel site kökü")
+    envanter_api: str = Field(..., pattern=r'^https?://', description="Birincil envanter API adresi")
+    yedek_apiler: List[str] = Field(default_factory=list, description="404 durumunda sırayla denenecek envanter adresleri")
+    siparis_url: str = Field(..., pattern=r'^https?://', description="Sipariş sayfası")
+    tasarim_url: str = Field(..., pattern=r'^https?://', description="Siparişin başlatıldığı tasarım sayfası")
+    market: str = Field(..., description="Envanter sorgusundaki market kodu")
+    dil: str = Field(..., description="Envanter sorgusundaki dil kodu")
+    super_region: str = Field(..., description="Envanter sorgusundaki bölge")
+    para_birimi: str = Field(..., min_length=3, max_length=3, description="Fiyatların para birimi (ISO 4217)")
+    para_simgesi: str = Field(..., description="Arayüzde ve loglarda fiyatın yanında gösterilen simge")
+    fiyat_alt_siniri: float = Field(..., gt=0, description="Arayüzde girilebilecek en düşük fiyat limiti")
+    fiyat_ust_siniri: float = Field(..., gt=0, description="Arayüzde girilebilecek en yüksek fiyat limiti")
+    varsayilan_fiyat: float = Field(..., gt=0, description="Arayüzdeki başlangıç fiyat limiti")
+    fiyat_adimi: float = Field(..., gt=0, description="Arayüzdeki fiyat limiti artış adımı")
+    kabul_dili: str = Field(..., description="Accept-Language başlığı")
+    sonuc_alanlari: List[str] = Field(default=["results"], description="Araç listesinin yanıttaki olası yolları")
+    toplam_alanlari: List[str] = Field(default=["total_matches_found"], description="Toplam sonuç sayısının yanıttaki olası yolları")
+    konum_indeksi: Optional[str] = Field(None, description="data/ altındaki posta kodu konum indeksi; yoksa mesafe terimleri kullanılmaz")
+
+    @validator('kod', 'market')
+    def buyuk_harf(cls, v):
+        return v.strip().upper()
+
+    @validator('varsayilan_fiyat')
+    def fiyat_sinirlar_icinde(cls, v, values):
+        alt, ust = values.get('fiyat_alt_siniri'), values.get('fiyat_ust_siniri')
+        if alt is not None and ust is not None and not alt <= v <= ust:
+            raise ValueError(f"Varsayılan fiyat {alt:.0f}-{ust:.0f} aralığında olmalı")
+        return v
+
+    def fiyat_metni(self, fiyat: float) -> str:
+        """Fiyatı pazarın para simgesiyle yaz"""
+        return f"{fiyat:,.0f} {self.para_simgesi}"
+
+    def sonuclar(self, data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Yanıttaki araç listesini bilinen alan varyantlarından çıkar"""
+        for yol in self.sonuc_alanlari:
+            sonuc = _alan(data, yol)
+            if sonuc:
+                return sonuc
+        return []
+
+    def toplam(self, data: Dict[str, Any]) -> Optional[int]:
+        """Yanıtta bildirilen toplam araç sayısı (varsa)"""
+        for yol in self.toplam_alanlari:
+            toplam = _alan(data, yol)
+            if toplam is None:
+                continue
+            try:
+                return int(toplam)
+            except (TypeError, ValueError):
+                return None
+        return None
+
+    class Config:
+        schema_extra = {
+            "example": {
+                "kod": "TR",
+                "ad": "Türkiye",
+                "base_url": "https://www.tesla.com/tr_TR",
+                "envanter_api": "https://www.tesla.com/tr_TR/api/tesla/inventory/tesla",
+                "yedek_apiler": ["https://www.tesla.com/inventory/api/v1/inventory-results"],
+                "siparis_url": "https://www.tesla.com/tr_TR/modely/order",
+                "tasarim_url": "https://www.tesla.com/tr_TR/modely/design#overview",
+                "market": "TR",
+                "dil": "tr",
+                "super_region": "europe",
+                "para_birimi": "TRY",
+                "para_simgesi": "TL",
+                "fiyat_alt_siniri": 1000000,
+                "fiyat_ust_siniri": 5000000,
+                "varsayilan_fiyat": 2000000,
+                "fiyat_adimi": 100000,
+                "kabul_dili": "tr-TR,tr;q=0.9,en;q=0.8",
+                "sonuc_alanlari": ["results", "data.results"],
+                "toplam_alanlari": ["total_matches_found", "data.total_matches_found"],
+                "konum_indeksi": "posta_kodlari.bin"
+            }
+        }
+
+
+@lru_cache(maxsize=None)
+def pazarlari_yukle(dosya: Path = PAZAR_DOSYASI) -> Dict[str, Pazar]:
+    """Kayıt defterini dosyadan bir kez oku ve doğrula"""
+    with open(dosya, encoding='utf-8') as f:
+        kayitlar = json.load(f)
+    pazarlar = {}
+    for kod, kayit in kayitlar.items():
+        p = Pazar(kod=kod, **kayit)
+        pazarlar[p.kod] = p
+    return pazarlar
+
+
+def pazar_kodlari() -> List[str]:
+    """Kayıtlı pazar kodları"""
+    return list(pazarlari_yukle())
+
+
+def pazar_getir(kod: str = VARSAYILAN_PAZAR) -> Pazar:
+    """Koda göre pazar; bilinmeyen kodlar ValueError ile reddedilir"""
+    pazarlar = pazarlari_yukle()
+    try:
+        return pazarlar[kod.strip().upper()]
+    except KeyError:
+        raise ValueError(f"Bilinmeyen pazar: {kod} (kayıtlı: {', '.join(pazarlar)})") from None
+
+
+@lru_cache(maxsize=None)
+def basliklar(kod: str, bot_korumalari: bool) -> Dict[str, str]:
+    """Pazar için HTTP başlıkları; pazar ve koruma modu başına bir kez derlenir
+
+    Dönen sözlük paylaşılır, değiştirilmemelidir.
+    """
+    p = pazar_getir(kod)
+    sonuc = dict(TEMEL_BASLIKLAR)
+    sonuc.update({
+        "Accept-Language": p.kabul_dili,
+        "Referer": p.base_url,
+        "Origin": p.base_url,
+    })
+    if bot_korumalari:
+        sonuc.update(KORUMA_BASLIKLARI)
+    return sonuc
@@ -0,0 +1,392 @@
+"""
+Tesla Tarayıcı Sürücü Modülü
+Sipariş adımlarının DOM, giriş ve gezinme işlemleri için Selenium ve DevTools (CDP) arka uçları
+"""
+
+import itertools
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+import requests
+from selenium.common.exceptions import InvalidSelectorException, NoSuchElementException, TimeoutException
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.select import Select
+from selenium.webdriver.support.ui import WebDriverWait
+
+try:
+    from websockets.sync.client import connect as ws_baglan
+except ImportError:  # websockets < 11
+    ws_baglan = None
+
+
+Konumlayici = Tuple[str, str]  # (By.XPATH, "//button") gibi
+
+
+class TarayiciSurucusu(ABC):
+    """Sipariş adımlarının kullandığı tarayıcı işlemleri arayüzü
+
+    Elemanlar arka uca özgü tanıtıcılardır; yalnızca aynı sürücüye geri
+    verilmeleri gerekir.
+    """
+
+    ad = "surucu"
+
+    @abstractmethod
+    def git(self, url: str, zaman_asimi: float = 30.0):
+        """Sayfaya git ve yüklenmesini bekle"""
+
+    @abstractmethod
+    def bul(self, konumlayici: Konumlayici, zaman_asimi: float = 0.0, tiklanabilir: bool = False):
+        """Elemanı bul; `zaman_asimi` kadar bekle, bulunamazsa None döndür"""
+
+    @abstractmethod
+    def temizle(self, eleman):
+        """Elemanın içeriğini temizle"""
+
+    @abstractmethod
+    def yaz(self, eleman, metin: str):
+        """Odaklanmış elemana metin yaz (mevcut değerin sonuna)"""
+
+    @abstractmethod
+    def tikla(self, eleman, ofset: Optional[Tuple[int, int]] = None):
+        """Elemana (merkezinden `ofset` kadar kaydırarak) fare ile tıkla"""
+
+    @abstractmethod
+    def js_tikla(self, eleman):
+        """Elemana JavaScript ile tıkla"""
+
+    @abstractmethod
+    def kaydir(self, eleman):
+        """Elemanı görünür alana kaydır"""
+
+    @abstractmethod
+    def sec(self, eleman, deger: str):
+        """<select> elemanında değeri seç"""
+
+    @abstractmethod
+    def sayfa_kaynagi(self) -> str:
+        """Sayfanın güncel HTML'i"""
+
+    @abstractmethod
+    def url(self) -> str:
+        """Geçerli sayfa adresi"""
+
+    def elemanlari_birak(self):
+        """Bulunan eleman tanıtıcılarını serbest bırak (her sipariş adımından sonra çağrılır)"""
+
+    def kapat(self):
+        pass
+
+
+class SeleniumSurucusu(TarayiciSurucusu):
+    """Her işlemi WebDriver HTTP protokolüyle chromedriver üzerinden yapan arka uç"""
+
+    ad = "selenium"
+
+    def __init__(self, driver):
+        self.driver = driver
+
+    def git(self, url: str, zaman_asimi: float = 30.0):
+        self.driver.get(url)
+
+    def bul(self, konumlayici: Konumlayici, zaman_asimi: float = 0.0, tiklanabilir: bool = False):
+        if zaman_asimi <= 0:
+            try:
+                eleman = self.driver.find_element(*konumlayici)
+            except (NoSuchElementException, InvalidSelectorException):
+                return None
+            if tiklanabilir and not (eleman.is_displayed() and eleman.is_enabled()):
+                return None
+            return eleman
+        kosul = EC.element_to_be_clickable if tiklanabilir else EC.presence_of_element_located
+        try:
+            return WebDriverWait(self.driver, zaman_asimi).until(kosul(konumlayici))
+        except (TimeoutException, InvalidSelectorException):
+            return None
+
+    def temizle(self, eleman):
+        eleman.clear()
+
+    def yaz(self, eleman, metin: str):
+        eleman.send_keys(metin)
+
+    def tikla(self, eleman, ofset: Optional[Tuple[int, int]] = None):
+        if ofset is None:
+            eleman.click()
+        else:
+            ActionChains(self.driver).move_to_element_with_offset(eleman, *ofset).click().perform()
+
+    def js_tikla(self, eleman):
+        self.driver.execute_script("arguments[0].click();", eleman)
+
+    def kaydir(self, eleman):
+        self.driver.execute_script("arguments[0].scrollIntoView(true);", eleman)
+
+    def sec(self, eleman, deger: str):
+        Select(eleman).select_by_value(deger)
+
+    def sayfa_kaynagi(self) -> str:
+        return self.driver.page_source
+
+    def url(self) -> str:
+        return self.driver.current_url
+
+
+class CdpHatasi(Exception):
+    """DevTools komutu hata döndürdü veya zaman aşımına uğradı"""
+
+
+class CdpBaglantisi:
+    """Tek bir sayfa hedefine açılmış DevTools websocket bağlantısı
+
+    Komutlar eşzamanlı gönderilir; yanıt beklenirken gelen olaylar
+    `olay_bekle` için kuyrukta tutulur.
+    """
+
+    OLAY_LIMITI = 1000
+
+    def __init__(self, ws_url: str, zaman_asimi: float = 10.0):
+        if ws_baglan is None:
+            raise CdpHatasi("DevTools bağlantısı için websockets>=11 gerekli")
+        self.zaman_asimi = zaman_asimi
+        self._ws = ws_baglan(ws_url, max_size=None, open_timeout=zaman_asimi)
+        self._sayac = itertools.count(1)
+        self._olaylar: Deque[Dict[str, Any]] = deque(maxlen=self.OLAY_LIMITI)
+
+    @classmethod
+    def adresten(cls, debugger_adresi: str, **kwargs) -> 'CdpBaglantisi':
+        """'host:port' DevTools adresindeki ilk sayfa hedefine bağlan"""
+        hedefler = requests.get(f"http://{debugger_adresi}/json/list", timeout=5).json()
+        for hedef in hedefler:
+            if hedef.get('type') == 'page' and hedef.get('webSocketDebuggerUrl'):
+                return cls(hedef['webSocketDebuggerUrl'], **kwargs)
+        raise CdpHatasi(f"{debugger_adresi} adresinde sayfa hedefi yok")
+
+    def _oku(self, bitis: float) -> Dict[str, Any]:
+        kalan = bitis - time.monotonic()
+        if kalan <= 0:
+            raise TimeoutError
+        return json.loads(self._ws.recv(timeout=kalan))
+
+    def komut(self, metod: str, zaman_asimi: Optional[float] = None, **parametreler) -> Dict[str, Any]:
+        """Komutu gönder ve sonucunu döndür"""
+        kimlik = next(self._sayac)
+        self._ws.send(json.dumps({'id': kimlik, 'method': metod, 'params': parametreler}))
+        bitis = time.monotonic() + (zaman_asimi or self.zaman_asimi)
+        try:
+            while True:
+                mesaj = self._oku(bitis)
+                if mesaj.get('id') == kimlik:
+                    if 'error' in mesaj:
+                        raise CdpHatasi(f"{metod}: {mesaj['error'].get('message')}")
+                    return mesaj.get('result', {})
+                if 'method' in mesaj:
+                    self._olaylar.append(mesaj)
+        except TimeoutError:
+            raise CdpHatasi(f"{metod} zaman aşımına uğradı")
+
+    def olay_bekle(self, metod: str, zaman_asimi: float) -> Optional[Dict[str, Any]]:
+        """Verilen olayı bekle (önceden gelmişse kuyruktan al)"""
+        for olay in list(self._olaylar):
+            if olay['method'] == metod:
+                self._olaylar.remove(olay)
+                return olay.get('params', {})
+        bitis = time.monotonic() + zaman_asimi
+        try:
+            while True:
+                mesaj = self._oku(bitis)
+                if mesaj.get('method') == metod:
+                    return mesaj.get('params', {})
+                if 'method' in mesaj:
+                    self._olaylar.append(mesaj)
+        except TimeoutError:
+            return None
+
+    def olaylari_temizle(self):
+        self._olaylar.clear()
+
+    def kapat(self):
+        try:
+            self._ws.close()
+        except Exception:
+            pass
+
+
+# Elemanı bulan ifade; konumlayıcı sayfa içinde çözülür, tek gidiş dönüşte sonuç alınır
+_BUL_BETIGI = """(() => {
+    const [tip, deger, tiklanabilir] = %s;
+    let el = null;
+    if (tip === 'xpath') {
+        el = document.evaluate(deger, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    } else {
+        el = document.querySelector(deger);
+    }
+    if (!el || !tiklanabilir) return el;
+    const gorunur = el.getClientRects().length > 0 && getComputedStyle(el).visibility !== 'hidden';
+    return gorunur && !el.disabled ? el : null;
+})()"""
+
+
+def _css_karsiligi(konumlayici: Konumlayici) -> Tuple[str, str]:
+    """Selenium konumlayıcısını ('xpath' | 'css', ifade) biçimine çevir"""
+    tip, deger = konumlayici
+    if tip == By.XPATH:
+        return 'xpath', deger
+    if tip == By.CSS_SELECTOR:
+        return 'css', deger
+    if tip == By.ID:
+        return 'css', f'[id={json.dumps(deger)}]'
+    if tip == By.NAME:
+        return 'css', f'[name={json.dumps(deger)}]'
+    if tip == By.CLASS_NAME:
+        return 'css', f'.{deger}'
+    if tip == By.TAG_NAME:
+        return 'css', deger
+    raise CdpHatasi(f"Desteklenmeyen konumlayıcı: {tip}")
+
+
+class CdpSurucusu(TarayiciSurucusu):
+    """Çalışan Chrome'a DevTools websocket'i üzerinden doğrudan bağlanan arka uç
+
+    Eleman arama sayfa içinde tek bir `Runtime.evaluate` ile yapılır;
+    tıklama ve yazma `Input.*` ile gerçek (isTrusted) olaylar üretir. Bekleme
+    döngüleri chromedriver'ın 500 ms'lik yoklaması yerine `YOKLAMA_ARALIGI`
+    ile yapılır ve her işlem WebDriver HTTP katmanını atlar. Bulunan
+    elemanların uzak nesneleri `NESNE_GRUBU`nda tutulur ve adım sonunda
+    topluca serbest bırakılır.
+    """
+
+    ad = "cdp"
+    YOKLAMA_ARALIGI = 0.05
+    NESNE_GRUBU = "siparis-adimi"
+
+    def __init__(self, baglanti: CdpBaglantisi):
+        self.baglanti = baglanti
+        # Yalnızca sayfa yükleme olayları gerekir; Runtime olayları dinlenmez
+        self.baglanti.komut('Page.enable')
+
+    @classmethod
+    def driverdan(cls, driver) -> 'CdpSurucusu':
+        """Selenium/undetected-chromedriver'ın başlattığı Chrome'un DevTools adresine bağlan"""
+        adres = (driver.capabilities.get('goog:chromeOptions') or {}).get('debuggerAddress')
+        if not adres:
+            adres = getattr(getattr(driver, 'options', None), 'debugger_address', None)
+        if not adres:
+            raise CdpHatasi("Chrome DevTools adresi bulunamadı")
+        return cls(CdpBaglantisi.adresten(adres))
+
+    def _degerlendir(self, ifade: str, deger_olarak: bool = True) -> Dict[str, Any]:
+        parametreler = {} if deger_olarak else {'objectGroup': self.NESNE_GRUBU}
+        sonuc = self.baglanti.komut(
+            'Runtime.evaluate', expression=ifade, returnByValue=deger_olarak, awaitPromise=False,
+            **parametreler
+        )
+        if 'exceptionDetails' in sonuc:
+            raise CdpHatasi(sonuc['exceptionDetails'].get('text', 'Betik hatası'))
+        return sonuc['result']
+
+    def _cagir(self, eleman: str, fonksiyon: str, *argumanlar) -> Any:
+        sonuc = self.baglanti.komut(
+            'Runtime.callFunctionOn', objectId=eleman, functionDeclaration=fonksiyon,
+            arguments=[{'value': arguman} for arguman in argumanlar], returnByValue=True,
+        )
+        if 'exceptionDetails' in sonuc:
+            raise CdpHatasi(sonuc['exceptionDetails'].get('text', 'Betik hatası'))
+        return sonuc['result'].get('value')
+
+    def git(self, url: str, zaman_asimi: float = 30.0):
+        self.baglanti.olaylari_temizle()
+        sonuc = self.baglanti.komut('Page.navigate', url=url)
+        if sonuc.get('errorText'):
+            raise CdpHatasi(f"Sayfa açılamadı: {sonuc['errorText']}")
+        if self.baglanti.olay_bekle('Page.loadEventFired', zaman_asimi) is None:
+            raise CdpHatasi(f"Sayfa {zaman_asimi:.0f} sn içinde yüklenmedi: {url}")
+
+    def bul(self, konumlayici: Konumlayici, zaman_asimi: float = 0.0, tiklanabilir: bool = False):
+        ifade = _BUL_BETIGI % json.dumps([*_css_karsiligi(konumlayici), tiklanabilir])
+        bitis = time.monotonic() + zaman_asimi
+        while True:
+            try:
+                sonuc = self._degerlendir(ifade, deger_olarak=False)
+            except CdpHatasi:
+                sonuc = {}  # Sayfa geçişi sırasında bağlam yok olabilir
+            if sonuc.get('objectId'):
+                return sonuc['objectId']
+            if time.monotonic() >= bitis:
+                return None
+            time.sleep(self.YOKLAMA_ARALIGI)
+
+    def temizle(self, eleman):
+        self._cagir(eleman, "function() { this.focus(); if (this.select) this.select(); }")
+        for tip in ('keyDown', 'keyUp'):
+            self.baglanti.komut(
+                'Input.dispatchKeyEvent', type=tip, key='Backspace', code='Backspace', windowsVirtualKeyCode=8
+            )
+
+    def yaz(self, eleman, metin: str):
+        self._cagir(eleman, "function() { if (document.activeElement !== this) this.focus(); }")
+        self.baglanti.komut('Input.insertText', text=metin)
+
+    def _merkez(self, eleman) -> Tuple[float, float]:
+        kutu = self._cagir(eleman, """function() {
+            this.scrollIntoView({block: 'center', inline: 'center'});
+            const r = this.getBoundingClientRect();
+            return [r.left + r.width / 2, r.top + r.height / 2];
+        }""")
+        return kutu[0], kutu[1]
+
+    def tikla(self, eleman, ofset: Optional[Tuple[int, int]] = None):
+        x, y = self._merkez(eleman)
+        if ofset:
+            x, y = x + ofset[0], y + ofset[1]
+        self.baglanti.komut('Input.dispatchMouseEvent', type='mouseMoved', x=x, y=y)
+        for tip in ('mousePressed', 'mouseReleased'):
+            self.baglanti.komut('Input.dispatchMouseEvent', type=tip, x=x, y=y, button='left', clickCount=1)
+
+    def js_tikla(self, eleman):
+        self._cagir(eleman, "function() { this.click(); }")
+
+    def kaydir(self, eleman):
+        self._cagir(eleman, "function() { this.scrollIntoView(true); }")
+
+    def sec(self, eleman, deger: str):
+        bulundu = self._cagir(eleman, """function(deger) {
+            const secenek = Array.from(this.options).find(o => o.value === deger);
+            if (!secenek) return false;
+            this.value = deger;
+            this.dispatchEvent(new Event('input', {bubbles: true}));
+            this.dispatchEvent(new Event('change', {bubbles: true}));
+            return true;
+        }""", deger)
+        if not bulundu:
+            raise CdpHatasi(f"Seçenek bulunamadı: {deger}")
+
+    def sayfa_kaynagi(self) -> str:
+        return self._degerlendir("document.documentElement.outerHTML").get('value', '')
+
+    def url(self) -> str:
+        return self._degerlendir("location.href").get('value', '')
+
+    def elemanlari_birak(self):
+        try:
+            self.baglanti.komut('Runtime.releaseObjectGroup', objectGroup=self.NESNE_GRUBU)
+        except CdpHatasi:
+            pass  # Sayfa değiştiyse nesneler zaten yok
+
+    def kapat(self):
+        self.baglanti.kapat()
+
+
+def surucu_olustur(driver, protokol: str) -> TarayiciSurucusu:
+    """İstenen arka ucu oluştur; DevTools bağlantısı kurulamazsa Selenium'a dön"""
+    if protokol == "cdp":
+        try:
+            return CdpSurucusu.driverdan(driver)
+        except Exception as e:
+            print(f"[UYARI] DevTools bağlantısı kurulamadı, Selenium kullanılacak: {str(e)}")
+    return SeleniumSurucusu(driver)
@@ -0,0 +1,284 @@
+"""
+Tesla Hata Kayıt Modülü
+Sipariş adımı başarısız olduğunda ekran görüntüsü, DOM, URL ve konsol/ağ olaylarını kaydetme
+(kart numarası ve CVV maskelenir)
+"""
+
+import base64
+import json
+import os
+import queue
+import re
+import shutil
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from core.config import BotAyarlari
+
+
+# <input> etiketlerindeki value özniteliği (React gibi çerçeveler yazılan değeri buraya yansıtır)
+_GIRDI_DEGERI = re.compile(
+    r'(<input\b[^>]*?)\svalue\s*=\s*(?:"[^"]*"|\'[^\']*\'|[^\s>]+)', re.IGNORECASE
+)
+
+
+def girdi_degerlerini_sil(html: str) -> str:
+    """Sayfadaki <input> alanlarının value özniteliklerini kaldır"""
+    onceki = None
+    # Bir etikette birden fazla value özniteliği olabilir
+    while onceki != html:
+        onceki, html = html, _GIRDI_DEGERI.sub(r'\1', html)
+    return html
+
+
+class HataKaydi:
+    """Tarayıcıdan alınan ham hata verisi (diske yazılmamış)"""
+
+    def __init__(self, adim: str, vin: str, hata: str):
+        self.zaman = datetime.now()
+        self.adim = adim
+        self.vin = vin
+        self.hata = hata
+        self.url: Optional[str] = None
+        self.baslik: Optional[str] = None
+        self.ekran_goruntusu: Optional[str] = None  # base64 PNG
+        self.dom: Optional[str] = None
+        self.konsol: List[Dict[str, Any]] = []
+        self.ag: List[str] = []  # Ham performans log mesajları (JSON)
+        self.yakalama_ms = 0.0  # Sipariş thread'inde geçen süre
+        self.driver = None  # Ekran görüntüsü ve DOM yazıcı thread'inde bu sürücüden okunur
+        self.ekran_alinsin = True
+
+
+class HataKaydedici:
+    """Hata anındaki tarayıcı durumunu yakalayıp arka planda diske yazan sınıf
+
+    Sipariş thread'i yalnızca ucuz durumu okur (URL, başlık ve log
+    tamponları) ve kaydı kuyruğa bırakır. Ekran görüntüsü ve DOM, PNG
+    çözme, JSON ayrıştırma ve dosya yazma arka plandaki yazıcı thread'inde
+    yapılır; bekleyen kayıt varken tarayıcının kapatılması da bu thread'e
+    devredilir. Kart numarası ve CVV yazılmadan önce maskelenir; kart
+    adımlarında ekran görüntüsü ve ağ olayları hiç alınmaz. Klasör boyutu
+    limiti aşarsa en eski kayıtlar silinir.
+    """
+
+    SON_OLAY_SAYISI = 100
+    # Kart bilgisi girilmiş sayfalar: ekran görüntüsü ve ağ olayları (POST gövdesi) alınmaz
+    HASSAS_ADIMLAR = ('kart_bilgileri', 'onay')
+    MASKE = '[GİZLİ]'
+
+    def __init__(self, klasor: str = "hata_kayitlari", limit_mb: float = 200.0,
+                 aktif: bool = True, kuyruk_boyutu: int = 8, ag_kaydi: bool = False,
+                 gizli_degerler: Iterable[str] = ()):
+        self.klasor = klasor
+        self.limit_bayt = int(limit_mb * 1024 * 1024)
+        self.aktif = aktif
+        self.ag_kaydi = ag_kaydi
+        self.gizli_degerler(gizli_degerler)
+        self.kayitlar: List[str] = []
+        self._kuyruk: queue.Queue = queue.Queue(maxsize=kuyruk_boyutu)
+        self._thread: Optional[threading.Thread] = None
+        self._kilit = threading.Lock()
+
+    @classmethod
+    def configden(cls, ayarlar: BotAyarlari, gizli_degerler: Iterable[str] = ()) -> 'HataKaydedici':
+        """Bot ayarlarından oluştur"""
+        return cls(
+            klasor=ayarlar.hata_kayit_klasoru,
+            limit_mb=ayarlar.hata_kayit_limiti_mb,
+            aktif=ayarlar.hata_kaydi,
+            ag_kaydi=ayarlar.ag_kaydi,
+            gizli_degerler=gizli_degerler,
+        )
+
+    def gizli_degerler(self, degerler: Iterable[str]):
+        """Kayıtlarda maskelenecek değerleri ayarla (kart numarası, CVV)
+
+        Rakamlardan oluşan değerler aralarında boşluk veya tire olsa da
+        eşleşir; başka bir sayının parçası olan eşleşmeler atlanır.
+        """
+        desenler = []
+        for deger in degerler:
+            deger = (deger or '').strip()
+            if not deger:
+                continue
+            if deger.isdigit():
+                desenler.append(r'(?<!\d)' + r'[\s-]?'.join(deger) + r'(?!\d)')
+            else:
+                desenler.append(re.escape(deger))
+        self._gizli = re.compile('|'.join(desenler)) if desenler else None
+
+    def maskele(self, metin: Optional[str]) -> Optional[str]:
+        """Gizli değerleri (kart numarası, CVV) maskeyle değiştir"""
+        if not metin or self._gizli is None:
+            return metin
+        return self._gizli.sub(self.MASKE, metin)
+
+    def yakala(self, driver, adim: str, vin: str, hata: str) -> Optional[HataKaydi]:
+        """Tarayıcının ucuz durumunu oku ve kaydı yazıcı thread'ine bırak
+
+        Ekran görüntüsü ve DOM yazıcı thread'inde okunur; sipariş thread'i
+        yalnızca URL, başlık ve log tamponlarını okur.
+        """
+        if not self.aktif or driver is None:
+            return None
+
+        t0 = time.perf_counter()
+        kayit = HataKaydi(adim, vin, hata)
+        hassas = adim in self.HASSAS_ADIMLAR
+        okumalar = [
+            ('url', lambda: driver.current_url),
+            ('baslik', lambda: driver.title),
+            ('konsol', lambda: driver.get_log('browser')[-self.SON_OLAY_SAYISI:]),
+        ]
+        if self.ag_kaydi and not hassas:
+            okumalar.append(
+                ('ag', lambda: [g['message'] for g in driver.get_log('performance')[-self.SON_OLAY_SAYISI:]])
+            )
+        # Tarayıcı çökmüş olabilir; her parça ayrı ayrı denenir
+        for alan, oku in okumalar:
+            try:
+                setattr(kayit, alan, oku())
+            except Exception:
+                pass
+        kayit.driver = driver
+        kayit.ekran_alinsin = not hassas
+        kayit.yakalama_ms = (time.perf_counter() - t0) * 1000
+
+        self._yaziciyi_baslat()
+        try:
+            self._kuyruk.put_nowait(kayit)
+        except queue.Full:
+            print(f"[UYARI] Hata kaydı kuyruğu dolu, '{adim}' kaydı atlandı")
+            return None
+        return kayit
+
+    def _yaziciyi_baslat(self):
+        with self._kilit:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._yaz_dongusu, name="hata-kaydi", daemon=True)
+                self._thread.start()
+
+    def kapanisi_devral(self, kapat: Callable[[], None]) -> bool:
+        """Bekleyen kayıt varsa tarayıcıyı kapatma işini ondan sonra yazıcı thread'inde yap
+
+        Devralınmazsa (bekleyen kayıt yok veya kuyruk dolu) False döner ve
+        tarayıcı çağıran tarafından kapatılır.
+        """
+        if not self._kuyruk.unfinished_tasks:
+            return False
+        try:
+            self._kuyruk.put_nowait(kapat)
+        except queue.Full:
+            return False
+        self._yaziciyi_baslat()
+        return True
+
+    def _tarayicidan_oku(self, kayit: HataKaydi):
+        """Pahalı okumaları (ekran görüntüsü, DOM) yazıcı thread'inde yap"""
+        driver, kayit.driver = kayit.driver, None
+        if driver is None:
+            return
+        okumalar = [('dom', lambda: driver.page_source)]
+        if kayit.ekran_alinsin:
+            okumalar.insert(0, ('ekran_goruntusu', driver.get_screenshot_as_base64))
+        for alan, oku in okumalar:
+            try:
+                setattr(kayit, alan, oku())
+            except Exception:
+                pass
+
+    def _yaz_dongusu(self):
+        while True:
+            kayit = self._kuyruk.get()
+            try:
+                if callable(kayit):
+                    kayit()
+                    continue
+                self._tarayicidan_oku(kayit)
+                dizin = self._yaz(kayit)
+                self.kayitlar.append(dizin)
+                print(f"[BILGI] Hata kaydı oluşturuldu: {dizin}")
+                self._limiti_uygula()
+            except Exception as e:
+                print(f"[HATA] Hata kaydı yazılamadı: {str(e)}")
+            finally:
+                self._kuyruk.task_done()
+
+    def _yaz(self, kayit: HataKaydi) -> str:
+        guvenli = re.sub(r'[^A-Za-z0-9_.-]', '_', f"{kayit.adim}_{kayit.vin}")
+        dizin = os.path.join(self.klasor, f"{kayit.zaman.strftime('%Y%m%d_%H%M%S_%f')}_{guvenli}")
+        os.makedirs(dizin, exist_ok=True)
+
+        if kayit.ekran_goruntusu:
+            with open(os.path.join(dizin, 'ekran.png'), 'wb') as f:
+                f.write(base64.b64decode(kayit.ekran_goruntusu))
+        if kayit.dom:
+            with open(os.path.join(dizin, 'dom.html'), 'w', encoding='utf-8') as f:
+                f.write(self.maskele(kayit.dom))
+
+        ag = []
+        for mesaj in kayit.ag:
+            try:
+                olay = json.loads(mesaj)['message']
+            except (ValueError, KeyError, TypeError):
+                continue
+            if olay.get('method', '').startswith('Network.'):
+                ag.append(olay)
+
+        ozet = {
+            'zaman': kayit.zaman.isoformat(),
+            'adim': kayit.adim,
+            'vin': kayit.vin,
+            'hata': kayit.hata,
+            'url': kayit.url,
+            'baslik': kayit.baslik,
+            'yakalama_ms': round(kayit.yakalama_ms, 1),
+            'konsol': kayit.konsol,
+            'ag': ag,
+        }
+        with open(os.path.join(dizin, 'kayit.json'), 'w', encoding='utf-8') as f:
+            f.write(self.maskele(json.dumps(ozet, ensure_ascii=False, indent=2, default=str)))
+        return dizin
+
+    def _limiti_uygula(self):
+        """Klasör boyutu limiti aşıyorsa en eski kayıtları sil"""
+        try:
+            dizinler = sorted(
+                os.path.join(self.klasor, ad) for ad in os.listdir(self.klasor)
+                if os.path.isdir(os.path.join(self.klasor, ad))
+            )
+        except OSError:
+            return
+
+        boyutlar = []
+        for dizin in dizinler:
+            boyut = 0
+            for kok, _, dosyalar in os.walk(dizin):
+                for dosya in dosyalar:
+                    try:
+                        boyut += os.path.getsize(os.path.join(kok, dosya))
+                    except OSError:
+                        pass
+            boyutlar.append(boyut)
+
+        toplam = sum(boyutlar)
+        # En yeni kayıt her zaman korunur
+        for dizin, boyut in zip(dizinler[:-1], boyutlar):
+            if toplam <= self.limit_bayt:
+                break
+            shutil.rmtree(dizin, ignore_errors=True)
+            toplam -= boyut
+            if dizin in self.kayitlar:
+                self.kayitlar.remove(dizin)
+
+    def bekle(self, zaman_asimi: float = 10.0) -> bool:
+        """Kuyruktaki kayıtların yazılmasını bekle (kapanışta kullanılır)"""
+        bitis = time.monotonic() + zaman_asimi
+        while self._kuyruk.unfinished_tasks:
+            if time.monotonic() >= bitis:
+                return False
+            time.sleep(0.05)
+        return True
@@ -0,0 +1,210 @@
+"""
+Tesla Konum Modülü
+Posta kodu ön ekinden koordinata çevrimdışı indeks ve teslimat mesafesi hesabı
+
+İndeks `data/posta_kodlari.csv` dosyasından derlenir:
+    python -m features.geo
+"""
+
+import argparse
+import csv
+import math
+import mmap
+import struct
+import sys
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from core.markets import Pazar
+
+
+VERI_KLASORU = Path(__file__).resolve().parent.parent / "data"
+KAYNAK_DOSYASI = VERI_KLASORU / "posta_kodlari.csv"
+INDEKS_DOSYASI = VERI_KLASORU / "posta_kodlari.bin"
+
+# Dosya düzeni: başlık, 100 ön ek için (enlem, boylam) float32 çiftleri, ad tablosu
+BASLIK = struct.Struct('<4sHH')
+SIHIRLI = b'TRPK'
+SURUM = 1
+ON_EK_SAYISI = 100  # Türkiye posta kodlarının ilk iki hanesi il plaka kodudur
+DUNYA_YARICAPI_KM = 6371.0
+
+_TURKCE_HARFLER = str.maketrans('İIıŞşĞğÜüÖöÇç', 'iiissgguuoocc')
+
+
+def ad_anahtari(ad: str) -> str:
+    """Lokasyon adını büyük/küçük harf ve Türkçe karakterlerden bağımsız anahtara çevir"""
+    ad = unicodedata.normalize('NFKD', ad.strip().translate(_TURKCE_HARFLER))
+    return ''.join(harf for harf in ad if not unicodedata.combining(harf)).lower()
+
+
+def indeks_olustur(kaynak: Path = KAYNAK_DOSYASI, hedef: Path = INDEKS_DOSYASI) -> int:
+    """CSV kaynağını bellek eşlemeli ikili indekse derle; kayıt sayısını döndür"""
+    koordinatlar = np.full((ON_EK_SAYISI, 2), np.nan, dtype='<f4')
+    adlar: Dict[str, int] = {}
+    with open(kaynak, encoding='utf-8', newline='') as dosya:
+        for satir in csv.DictReader(dosya):
+            on_ek = int(satir['on_ek'])
+            koordinatlar[on_ek] = (float(satir['enlem']), float(satir['boylam']))
+            for ad in [satir['il']] + [a for a in (satir.get('diger_adlar') or '').split('|') if a]:
+                adlar[ad_anahtari(ad)] = on_ek
+
+    ad_tablosu = bytearray(struct.pack('<H', len(adlar)))
+    for anahtar, on_ek in adlar.items():
+        kodlu = anahtar.encode('utf-8')
+        ad_tablosu += struct.pack('<BB', on_ek, len(kodlu)) + kodlu
+
+    gecici = hedef.with_suffix('.tmp')
+    with open(gecici, 'wb') as dosya:
+        dosya.write(BASLIK.pack(SIHIRLI, SURUM, ON_EK_SAYISI))
+        dosya.write(koordinatlar.tobytes())
+        dosya.write(ad_tablosu)
+    gecici.replace(hedef)
+    return int((~np.isnan(koordinatlar[:, 0])).sum())
+
+
+class _MesafeTablosu(dict):
+    """Lokasyon adı -> km; her ad ilk görüldüğünde bir kez hesaplanır"""
+
+    def __init__(self, indeks: 'KonumIndeksi', mesafeler: np.ndarray):
+        super().__init__()
+        self._indeks = indeks
+        self._mesafeler = mesafeler
+
+    def __missing__(self, lokasyon: str) -> float:
+        on_ek = self._indeks.on_ek(lokasyon)
+        if on_ek is None:
+            self._indeks.bilinmeyen_bildir(lokasyon)
+        mesafe = float(self._mesafeler[on_ek]) if on_ek is not None else math.nan
+        self[lokasyon] = mesafe
+        return mesafe
+
+
+class KonumIndeksi:
+    """Posta kodu ön eki ve lokasyon adından koordinata çevrimdışı indeks
+
+    Koordinat dizisi dosyadan kopyalanmadan bellek eşlemesiyle okunur.
+    Bir teslimat posta kodu için tüm illere mesafe tek vektörel işlemle
+    hesaplanır; araç başına maliyet bir sözlük aramasıdır.
+    """
+
+    TABLO_SAYISI = 64
+
+    def __init__(self, yol: Path = INDEKS_DOSYASI):
+        with open(yol, 'rb') as dosya:
+            self._mmap = mmap.mmap(dosya.fileno(), 0, access=mmap.ACCESS_READ)
+        sihirli, surum, adet = BASLIK.unpack_from(self._mmap, 0)
+        if sihirli != SIHIRLI or surum != SURUM:
+            raise ValueError(f"Geçersiz konum indeksi: {yol}")
+
+        konum = BASLIK.size
+        self.koordinatlar = np.frombuffer(self._mmap, dtype='<f4', count=adet * 2, offset=konum).reshape(adet, 2)
+        konum += self.koordinatlar.nbytes
+
+        (ad_sayisi,) = struct.unpack_from('<H', self._mmap, konum)
+        konum += 2
+        self._adlar: Dict[str, int] = {}
+        for _ in range(ad_sayisi):
+            on_ek, uzunluk = struct.unpack_from('<BB', self._mmap, konum)
+            konum += 2
+            self._adlar[self._mmap[konum:konum + uzunluk].decode('utf-8')] = on_ek
+            konum += uzunluk
+
+        self._enlem = np.radians(self.koordinatlar[:, 0].astype(float))
+        self._boylam = np.radians(self.koordinatlar[:, 1].astype(float))
+        self._tablolar: Dict[str, _MesafeTablosu] = {}
+        self._bilinmeyenler: Set[str] = set()
+
+    def on_ek(self, lokasyon: str) -> Optional[int]:
+        """Lokasyon adının il ön eki ('Istanbul Kartal' gibi adlarda ilk kelimeye de bakılır)"""
+        anahtar = ad_anahtari(lokasyon)
+        on_ek = self._adlar.get(anahtar)
+        if on_ek is None and ' ' in anahtar:
+            on_ek = self._adlar.get(anahtar.split()[0])
+        return on_ek
+
+    def koordinat(self, posta_kodu: str) -> Optional[Tuple[float, float]]:
+        """Posta kodunun (enlem, boylam) karşılığı"""
+        if len(posta_kodu) < 2 or not posta_kodu[:2].isdigit():
+            return None
+        enlem, boylam = self.koordinatlar[int(posta_kodu[:2])]
+        if math.isnan(enlem):
+            return None
+        return float(enlem), float(boylam)
+
+    def bilinmeyen_bildir(self, lokasyon: str):
+        """İndekste olmayan lokasyon adını bir kez uyar"""
+        anahtar = ad_anahtari(lokasyon)
+        if anahtar not in self._bilinmeyenler:
+            self._bilinmeyenler.add(anahtar)
+            print(f"[UYARI] '{lokasyon}' lokasyonu konum indeksinde yok; mesafesi bilinmiyor")
+
+    def mesafe_tablosu(self, posta_kodu: str) -> _MesafeTablosu:
+        """Posta koduna göre lokasyon adı -> kuş uçuşu km tablosu (bilinmeyen ad NaN)"""
+        tablo = self._tablolar.get(posta_kodu)
+        if tablo is None:
+            if len(self._tablolar) >= self.TABLO_SAYISI:
+                self._tablolar.clear()
+            tablo = self._tablolar[posta_kodu] = self._tablo_olustur(posta_kodu)
+        return tablo
+
+    def _tablo_olustur(self, posta_kodu: str) -> _MesafeTablosu:
+        mesafeler = np.full(len(self.koordinatlar), np.nan)
+        if self.koordinat(posta_kodu) is not None:
+            on_ek = int(posta_kodu[:2])
+            enlem, boylam = self._enlem[on_ek], self._boylam[on_ek]
+            # Haversine
+            a = (np.sin((self._enlem - enlem) / 2) ** 2
+                 + np.cos(enlem) * np.cos(self._enlem) * np.sin((self._boylam - boylam) / 2) ** 2)
+            mesafeler = 2 * DUNYA_YARICAPI_KM * np.arcsin(np.sqrt(a))
+        return _MesafeTablosu(self, mesafeler)
+
+    def mesafe_km(self, posta_kodu: str, lokasyon: str) -> Optional[float]:
+        """Posta kodu ile lokasyon arasındaki kuş uçuşu mesafe"""
+        mesafe = self.mesafe_tablosu(posta_kodu)[lokasyon]
+        return None if math.isnan(mesafe) else mesafe
+
+    def mesafeler(self, posta_kodu: str, lokasyonlar: Sequence[str]) -> np.ndarray:
+        """Lokasyon listesinin mesafe dizisi (bilinmeyenler NaN)"""
+        tablo = self.mesafe_tablosu(posta_kodu)
+        return np.fromiter((tablo[lokasyon] for lokasyon in lokasyonlar), float, len(lokasyonlar))
+
+
+@lru_cache(maxsize=None)
+def _indeks_ac(yol: Path) -> KonumIndeksi:
+    return KonumIndeksi(yol)
+
+
+def varsayilan_indeks() -> KonumIndeksi:
+    """Paketle gelen Türkiye konum indeksi (ilk kullanımda bir kez açılır)"""
+    return _indeks_ac(INDEKS_DOSYASI)
+
+
+def pazar_indeksi(pazar: Pazar) -> Optional[KonumIndeksi]:
+    """Pazarın konum indeksi; pazar kaydında indeks yoksa None
+
+    Posta kodu ön ekleri ve lokasyon adları pazara özgüdür, bu yüzden bir
+    pazarın indeksi başka pazarın posta kodlarıyla kullanılmaz.
+    """
+    if not pazar.konum_indeksi:
+        return None
+    return _indeks_ac(VERI_KLASORU / pazar.konum_indeksi)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Posta kodu konum indeksini derle")
+    parser.add_argument('--kaynak', type=Path, default=KAYNAK_DOSYASI, help="CSV kaynak dosyası")
+    parser.add_argument('--hedef', type=Path, default=INDEKS_DOSYASI, help="İkili indeks dosyası")
+    args = parser.parse_args(argv)
+
+    adet = indeks_olustur(args.kaynak, args.hedef)
+    print(f"[BILGI] {adet} il ön eki {args.hedef} dosyasına yazıldı ({args.hedef.stat().st_size} bayt)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
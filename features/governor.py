@@ -0,0 +1,186 @@
+"""
+Tesla İstek Yönetimi Modülü
+Endpoint başına istek bütçesi, Retry-After, üstel geri çekilme ve devre kesici
+"""
+
+import random
+import threading
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from core.config import BotAyarlari
+from utils.clock import Saat, GERCEK_SAAT
+
+
+class DevreDurumu:
+    """Devre kesici durumları"""
+    KAPALI = "kapali"        # Normal çalışma
+    ACIK = "acik"            # İstek gönderilmiyor
+    YARI_ACIK = "yari_acik"  # Tek bir deneme isteğine izin var
+
+
+class UcNokta:
+    """Tek bir endpoint'in bütçe, geri çekilme ve devre durumu"""
+
+    def __init__(self, ad: str, kapasite: float, zaman: float):
+        self.ad = ad
+        self.jeton = kapasite
+        self.son_dolum = zaman
+        self.bekle_kadar = 0.0  # Retry-After / geri çekilme bitişi
+        self.ardisik_hata = 0
+        self.devre = DevreDurumu.KAPALI
+        self.devre_acilma_sayisi = 0
+        self.deneme_bekliyor = False
+        self.son_durum_kodu: Optional[int] = None
+        self.toplam_istek = 0
+        self.toplam_hata = 0
+
+
+class IstekYoneticisi:
+    """Endpoint başına istek hızını yöneten sınıf
+
+    - Jeton kovası: `istek_butcesi` istek/dakika hızında dolar, en fazla
+      `istek_patlama` istek birikebilir.
+    - 429/5xx yanıtlarında `Retry-After` başlığına uyulur; başlık yoksa
+      `geri_cekilme_tavani` ile sınırlı, sapmalı üstel geri çekilme uygulanır.
+    - Ardışık `devre_esigi` hatadan sonra devre açılır ve `devre_suresi`
+      boyunca istek gönderilmez; ardından tek bir deneme isteğine izin
+      verilir. Deneme başarılıysa devre kapanır, değilse süre ikiye katlanır
+      (en fazla `geri_cekilme_tavani` kadar).
+    """
+
+    def __init__(self, ayarlar: BotAyarlari, saat: Optional[Saat] = None):
+        self.ayarlar = ayarlar
+        self.saat = saat or GERCEK_SAAT
+        self.kapasite = float(ayarlar.istek_patlama)
+        self.dolum_hizi = ayarlar.istek_butcesi / 60.0
+        self._uc_noktalar: Dict[str, UcNokta] = {}
+        self._kilit = threading.Lock()
+
+    def ayarlari_guncelle(self, ayarlar: BotAyarlari):
+        """Bütçe ve geri çekilme ayarlarını endpoint durumlarını koruyarak değiştir"""
+        with self._kilit:
+            self.ayarlar = ayarlar
+            self.kapasite = float(ayarlar.istek_patlama)
+            self.dolum_hizi = ayarlar.istek_butcesi / 60.0
+            for uc in self._uc_noktalar.values():
+                uc.jeton = min(uc.jeton, self.kapasite)
+
+    @staticmethod
+    def anahtar(url: str) -> str:
+        """Sorgu parametreleri olmadan endpoint adı"""
+        parca = urlsplit(url)
+        return f"{parca.netloc}{parca.path}"
+
+    def _uc_nokta(self, url: str) -> UcNokta:
+        ad = self.anahtar(url)
+        uc = self._uc_noktalar.get(ad)
+        if uc is None:
+            uc = self._uc_noktalar[ad] = UcNokta(ad, self.kapasite, self.saat.zaman())
+        return uc
+
+    def _doldur(self, uc: UcNokta, simdi: float):
+        uc.jeton = min(self.kapasite, uc.jeton + (simdi - uc.son_dolum) * self.dolum_hizi)
+        uc.son_dolum = simdi
+
+    def _devre_suresi(self, uc: UcNokta) -> float:
+        return min(max(self.ayarlar.geri_cekilme_tavani, self.ayarlar.devre_suresi),
+                   self.ayarlar.devre_suresi * 2 ** min(uc.devre_acilma_sayisi - 1, 20))
+
+    def bekleme(self, url: str) -> Tuple[float, Optional[str]]:
+        """İstek gönderilebilmesi için beklenmesi gereken süre ve nedeni"""
+        with self._kilit:
+            uc = self._uc_nokta(url)
+            simdi = self.saat.zaman()
+            if uc.devre == DevreDurumu.ACIK:
+                if simdi < uc.bekle_kadar:
+                    return uc.bekle_kadar - simdi, "devre"
+                uc.devre = DevreDurumu.YARI_ACIK
+            if uc.devre == DevreDurumu.YARI_ACIK and uc.deneme_bekliyor:
+                return 1.0, "devre"
+            if simdi < uc.bekle_kadar:
+                return uc.bekle_kadar - simdi, "geri_cekilme"
+            self._doldur(uc, simdi)
+            if uc.jeton < 1:
+                return (1 - uc.jeton) / self.dolum_hizi, "butce"
+            return 0.0, None
+
+    def izin_al(self, url: str) -> Tuple[float, Optional[str]]:
+        """İzin varsa bir jeton harca ve (0, None) döndür, yoksa beklemeyi döndür"""
+        bekleme, neden = self.bekleme(url)
+        if bekleme > 0:
+            return bekleme, neden
+        with self._kilit:
+            uc = self._uc_nokta(url)
+            uc.jeton -= 1
+            uc.toplam_istek += 1
+            if uc.devre == DevreDurumu.YARI_ACIK:
+                uc.deneme_bekliyor = True
+        return 0.0, None
+
+    def _retry_after(self, deger: Optional[str], simdi: float) -> Optional[float]:
+        """Retry-After başlığını saniyeye çevir (saniye veya HTTP tarihi)"""
+        if not deger:
+            return None
+        deger = deger.strip()
+        if deger.isdigit():
+            return float(deger)
+        try:
+            return max(0.0, parsedate_to_datetime(deger).timestamp() - simdi)
+        except (TypeError, ValueError):
+            return None
+
+    def sonuc_bildir(self, url: str, durum_kodu: Optional[int], retry_after: Optional[str] = None):
+        """Yanıtı kaydet; durum_kodu None ise bağlantı hatası sayılır"""
+        with self._kilit:
+            uc = self._uc_nokta(url)
+            simdi = self.saat.zaman()
+            uc.son_durum_kodu = durum_kodu
+            uc.deneme_bekliyor = False
+
+            # 429 ve 5xx sunucunun yük altında olduğunu gösterir; 404 gibi kodlar hata sayılmaz
+            if durum_kodu is not None and durum_kodu != 429 and durum_kodu < 500:
+                uc.ardisik_hata = 0
+                uc.bekle_kadar = 0.0
+                if uc.devre != DevreDurumu.KAPALI:
+                    print(f"[BILGI] {uc.ad} tekrar yanıt veriyor, devre kapatıldı")
+                uc.devre = DevreDurumu.KAPALI
+                uc.devre_acilma_sayisi = 0
+                return
+
+            uc.ardisik_hata += 1
+            uc.toplam_hata += 1
+            # Sunucu zaten yavaşlamamızı istedi, birikmiş jetonları kullanma
+            uc.jeton = min(uc.jeton, 0.0)
+
+            bekleme = self._retry_after(retry_after, simdi)
+            if bekleme is None:
+                taban = self.ayarlar.geri_cekilme_tabani * 2 ** min(uc.ardisik_hata - 1, 20)
+                bekleme = random.uniform(0.5, 1.0) * min(self.ayarlar.geri_cekilme_tavani, taban)
+
+            if uc.devre == DevreDurumu.YARI_ACIK or uc.ardisik_hata >= self.ayarlar.devre_esigi:
+                uc.devre = DevreDurumu.ACIK
+                uc.devre_acilma_sayisi += 1
+                bekleme = max(bekleme, self._devre_suresi(uc))
+                print(f"[UYARI] {uc.ad} için devre açıldı, {bekleme:.0f} sn sonra tekrar denenecek")
+
+            uc.bekle_kadar = max(uc.bekle_kadar, simdi + bekleme)
+
+    def durum(self) -> Dict[str, Dict[str, Any]]:
+        """Arayüz için endpoint durumları"""
+        with self._kilit:
+            simdi = self.saat.zaman()
+            sonuc = {}
+            for ad, uc in self._uc_noktalar.items():
+                self._doldur(uc, simdi)
+                sonuc[ad] = {
+                    'devre': uc.devre,
+                    'jeton': round(uc.jeton, 1),
+                    'bekleme_sn': round(max(0.0, uc.bekle_kadar - simdi), 1),
+                    'ardisik_hata': uc.ardisik_hata,
+                    'son_durum_kodu': uc.son_durum_kodu,
+                    'toplam_istek': uc.toplam_istek,
+                    'toplam_hata': uc.toplam_hata,
+                }
+            return sonuc
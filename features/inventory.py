@@ -5,21 +5,44 @@ Envanter API'sinden veri çekme ve uygun araç seçimi
 
 import requests
 import json
-import time
 import random
-from typing import List, Optional, Dict, Any
-from datetime import datetime
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Dict, Any, Iterator, Union
+from datetime import datetime, timedelta
 from fake_useragent import UserAgent
 
 from core.config import (
     TeslaConfig, AracTercihi, RenkTercihi, 
-    AracTipi, BolgeAyarlari
+    AracTipi
 )
+from core.markets import KORUMA_BASLIKLARI, basliklar, pazar_getir
+from .governor import IstekYoneticisi
+from .matching import EnvanterIndeksi, RENK_ESLEMESI
+from .options import secenek_maskesi
+from .polling import AdaptifZamanlayici
+from .query import DerlenmisSorgu, derlenmis_sorgu
+from .ranking import AracSiralayici, AdayPuani
+from .transport import EnvanterTasiyici
+from utils.clock import Saat, SunucuSaatFarki, GERCEK_SAAT
+from utils.events import OlayYolu, AracBulundu, KontrolHatasi, EnvanterGuncellendi
+from utils.profiling import ProfilYakalayici
 
 
 class EnvanterArac:
     """Envanterdeki araç bilgilerini temsil eden sınıf"""
     
+    __slots__ = (
+        'vin', 'model', 'trim', 'renk', 'koltuk_rengi', 'fiyat', 'yil',
+        'lokasyon', 'menzil', 'durum', 'teslimat_tarihi', 'ozellikler',
+        '_secenek_maskesi',
+    )
+    
+    # Ham API verisi yalnızca en son görülen araçlar için tutulur (uzun çalışmada bellek sabit kalır)
+    HAM_VERI_LIMITI = 256
+    _ham_veri: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+    _ham_veri_kilidi = threading.Lock()
+    
     def __init__(self, data: Dict[str, Any]):
         self.vin = data.get('VIN', '')
         self.model = data.get('Model', '')
@@ -33,221 +56,439 @@ class EnvanterArac:
         self.durum = data.get('InventoryStatus', '')
         self.teslimat_tarihi = data.get('ETA', '')
         self.ozellikler = data.get('OptionCodeList', [])
-        self._raw_data = data
+        self._secenek_maskesi: Optional[int] = None
+    
+    @classmethod
+    def ham_verileri_sakla(cls, kayitlar: List[Dict[str, Any]]):
+        """Bir sayfanın ham kayıtlarını sınırlı önbelleğe ekle"""
+        with cls._ham_veri_kilidi:
+            for kayit in kayitlar[-cls.HAM_VERI_LIMITI:]:
+                vin = kayit.get('VIN', '')
+                cls._ham_veri[vin] = kayit
+                cls._ham_veri.move_to_end(vin)
+            while len(cls._ham_veri) > cls.HAM_VERI_LIMITI:
+                cls._ham_veri.popitem(last=False)
+    
+    @property
+    def _raw_data(self) -> Optional[Dict[str, Any]]:
+        """Ham API verisi (yalnızca son görülen araçlar için saklanır)"""
+        return self._ham_veri.get(self.vin)
+    
+    @property
+    def secenek_maskesi(self) -> int:
+        """Opsiyon kodlarının bitset karşılığı (ilk kullanımda hesaplanır)"""
+        if self._secenek_maskesi is None:
+            self._secenek_maskesi = secenek_maskesi(self.ozellikler)
+        return self._secenek_maskesi
     
     def is_sr_model(self) -> bool:
         """SR (Standard Range) modeli mi kontrol et"""
         sr_indicators = ['Standard Range', 'SR', 'RWD']
         return any(indicator in self.trim for indicator in sr_indicators)
     
+    def tip_uygun_mu(self, arac_tipi: AracTipi) -> bool:
+        """Araç tipi tercihe uygun mu"""
+        if arac_tipi == AracTipi.SR:
+            return self.is_sr_model()
+        if arac_tipi == AracTipi.PERF:
+            return 'Performance' in self.trim
+        return 'Long Range' in self.trim or (
+            'AWD' in self.trim and 'Performance' not in self.trim
+        )
+    
     def renk_uygun_mu(self, tercihler: List[RenkTercihi]) -> bool:
         """Araç rengi tercihlere uygun mu"""
-        renk_map = {
-            'red': RenkTercihi.KIRMIZI,
-            'white': RenkTercihi.BEYAZ,
-            'black': RenkTercihi.SIYAH,
-            'blue': RenkTercihi.MAVI,
-            'grey': RenkTercihi.GRI,
-            'pearl': RenkTercihi.BEYAZ,  # Pearl white
-            'solid': RenkTercihi.SIYAH,  # Solid black
-        }
-        
-        arac_rengi = renk_map.get(self.renk.lower())
+        arac_rengi = RENK_ESLEMESI.get(self.renk.lower())
         return arac_rengi in tercihler if arac_rengi else False
     
+    def secenekler_uygun_mu(self, zorunlu: int, yasak: int) -> bool:
+        """Tüm zorunlu opsiyonlar var ve hiçbir yasak opsiyon yok mu (bitset maskeleri)"""
+        maske = self.secenek_maskesi
+        return maske & zorunlu == zorunlu and not maske & yasak
+    
     def fiyat_uygun_mu(self, max_fiyat: float) -> bool:
         """Fiyat limite uygun mu"""
         return self.fiyat <= max_fiyat
     
     def __repr__(self):
-        return f"<EnvanterArac VIN={self.vin} Model={self.trim} Renk={self.renk} Fiyat={self.fiyat:,.0f} TL>"
+        return f"<EnvanterArac VIN={self.vin} Model={self.trim} Renk={self.renk} Fiyat={self.fiyat:,.0f}>"
 
 
 class TeslaEnvanter:
     """Tesla envanter API ile etkileşim sınıfı"""
     
-    def __init__(self, config: TeslaConfig):
+    SAYFA_BOYUTU = 50  # Tek istekte istenen araç sayısı
+    MAKSIMUM_SAYFA = 40  # Bir kontrolde en fazla getirilecek sayfa
+    BUTCE_BEKLEME_SINIRI = 5.0  # İstek bütçesi için kontrol içinde en fazla beklenecek süre (saniye)
+    # Bağlantı havuzu ve envanter kaynağı kurulurken kullanılan, çalışan motorda değiştirilemeyen ayarlar
+    YENIDEN_BASLATMA_GEREKTIREN = ('baglanti_havuzu', 'http2', 'kontrol_sunucusu', 'pazar')
+    # Satıştan bu kadar saniye önce sunucu saat farkı HEAD istekleriyle ölçülmeye başlanır
+    SAAT_OLCUM_ONCESI = 300
+    SAAT_OLCUMU = True  # Envanter başka bir süreçten geliyorsa kapatılır
+    # Envanter başka bir süreçten geliyorsa HTTP taşıyıcısı (oturum, DNS thread'i) ve
+    # istek yöneticisi kurulmaz
+    UPSTREAM_ISTEMCISI = True
+    
+    def __init__(self, config: TeslaConfig, profil: Optional[ProfilYakalayici] = None,
+                 api_url: Optional[str] = None, olaylar: Optional[OlayYolu] = None,
+                 saat: Optional[Saat] = None):
         self.config = config
-        self.session = requests.Session()
-        self.ua = UserAgent()
+        self.saat = saat or GERCEK_SAAT
+        self.profil = profil or ProfilYakalayici.configden(config.bot)
+        self.olaylar = olaylar or OlayYolu()
+        if self.UPSTREAM_ISTEMCISI:
+            self.tasiyici: Optional[EnvanterTasiyici] = EnvanterTasiyici(config.bot, self.saat)
+            self.saat_farki = self.tasiyici.saat_farki
+            self.session: Optional[requests.Session] = self.tasiyici.session
+            self.yonetici: Optional[IstekYoneticisi] = IstekYoneticisi(config.bot, self.saat)
+            self.ua = UserAgent()
+        else:
+            self.tasiyici = None
+            self.saat_farki = SunucuSaatFarki()
+            self.session = None
+            self.yonetici = None
+            self.ua = None
+        self.pazar = pazar_getir(config.bot.pazar)
+        self._api_url = api_url or self.pazar.envanter_api
+        self._sorgu = self._sorguyu_derle()
+        self._isitildi = self.tasiyici is None  # Taşıyıcı yoksa ısıtılacak bağlantı da yok
+        self._son_hata: Optional[str] = None
+        self._son_red: Optional[str] = None  # İstek yöneticisinin son reddetme nedeni
+        self._tam_sonuc = False
+        self.zamanlayici = AdaptifZamanlayici(config.bot, self.saat) if config.bot.adaptif_kontrol else None
+        self.siralayici = AracSiralayici(config.siralama, self.saat, pazar=self.pazar)
+        self.son_adaylar: List[AdayPuani] = []  # Son eşleşmede puan dökümüyle en iyi adaylar
+        self._bekleyen_config: Optional[TeslaConfig] = None
+        self._config_kilidi = threading.Lock()
+        self._uyandir = threading.Event()
         self._setup_session()
         
+    @property
+    def son_hata(self) -> Optional[str]:
+        """Son sorgudaki hata (başarılıysa None); eksik sayfa yüzünden sonuç tam değildir"""
+        return self._son_hata
+    
+    @property
+    def son_sorgu_tam(self) -> bool:
+        """Son sorgu envanteri eksiksiz getirdi mi (hata, istek reddi veya sayfa sınırıyla yarıda kalmadıysa)"""
+        return self._tam_sonuc
+    
     def _setup_session(self):
-        """Session ayarlarını yapılandır"""
-        headers = BolgeAyarlari.HEADERS.copy()
+        """Session başlıklarını pazar ve koruma moduna göre ayarla (koruma modu değişince tekrar çağrılır)"""
+        if self.session is None:
+            return
+        
+        # Önceki moddan kalan koruma başlıkları requests varsayılanlarına döndürülür
+        varsayilan = requests.utils.default_headers()
+        for baslik in KORUMA_BASLIKLARI:
+            if baslik in varsayilan:
+                self.session.headers[baslik] = varsayilan[baslik]
+            else:
+                self.session.headers.pop(baslik, None)
+        
+        # Başlıklar pazar ve koruma modu başına bir kez derlenir
+        self.session.headers.update(basliklar(self.pazar.kod, self.config.bot.bot_korumalari))
         
         if self.config.bot.bot_korumalari:
             # Rastgele User-Agent kullan
-            headers['User-Agent'] = self.ua.random
-            
-            # Ek bot koruma başlıkları
-            headers.update({
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Accept': '*/*',
-                'Connection': 'keep-alive',
-                'Cache-Control': 'no-cache',
-                'Pragma': 'no-cache',
-                'sec-ch-ua': '"Google Chrome";v="120", "Chromium";v="120", "Not-A.Brand";v="24"',
-                'sec-ch-ua-mobile': '?0',
-                'sec-ch-ua-platform': '"Windows"',
-                'sec-fetch-dest': 'empty',
-                'sec-fetch-mode': 'cors',
-                'sec-fetch-site': 'same-origin',
-            })
-        
-        self.session.headers.update(headers)
-    
-    def _api_params(self) -> Dict[str, str]:
-        """API çağrısı için gerekli parametreler"""
-        return {
-            'query': json.dumps({
-                'model': 'my',  # Model Y
-                'condition': 'new',
-                'market': BolgeAyarlari.MARKET,
-                'language': BolgeAyarlari.LANGUAGE,
-                'super_region': BolgeAyarlari.SUPER_REGION,
-                'options': {},
-                'arrangeby': 'Price',
-                'order': 'asc',
-                'zip': self.config.tercih.teslimat_posta_kodu,
-                'range': 0  # Tüm mesafeler
-            }),
-            'offset': '0',
-            'count': '50',  # Maksimum sonuç sayısı
-            'outsideOffset': '0',
-            'outsideSearch': 'false'
-        }
+            self.session.headers['User-Agent'] = self.ua.random
     
-    def envanter_sorgula(self) -> List[EnvanterArac]:
-        """Envanter API'sini sorgula ve araçları getir"""
-        try:
-            # Bot koruması için rastgele gecikme
-            if self.config.bot.bot_korumalari:
-                time.sleep(random.uniform(0.5, 2.0))
+    def config_guncelle(self, yeni: Union[TeslaConfig, Dict[str, Any]]) -> List[str]:
+        """Çalışan motorun konfigürasyonunu değiştir; değişen alanları döndür
+        
+        Sözlük verilirse ({'tercih': {'maksimum_fiyat': ...}}) mevcut
+        konfigürasyonla birleştirilip doğrulanır; geçersiz güncellemeler
+        ValidationError ile reddedilir ve çalışan konfigürasyon değişmez.
+        Güncelleme kontrol döngüsünün bir sonraki turunda bir kerede uygulanır
+        (bekleme varsa kesilir); HTTP oturumu, deneme sayacı, istek bütçesi
+        ve öğrenilen geliş örüntüsü korunur.
+        """
+        with self._config_kilidi:
+            temel = self._bekleyen_config or self.config
+            if isinstance(yeni, dict):
+                yeni = temel.guncelle(yeni)
             
-            # Önce ana API'yi dene
-            api_url = BolgeAyarlari.INVENTORY_API
+            sabit = {
+                alan: getattr(self.config.bot, alan) for alan in self.YENIDEN_BASLATMA_GEREKTIREN
+                if getattr(yeni.bot, alan) != getattr(self.config.bot, alan)
+            }
+            if sabit:
+                print(f"[UYARI] {', '.join(sabit)} ayarları bot yeniden başlatılınca geçerli olur")
+                yeni = yeni.copy(update={'bot': yeni.bot.copy(update=sabit)})
             
-            response = self.session.get(
-                api_url,
-                params=self._api_params(),
-                timeout=10
-            )
+            degisenler = self.config.degisen_alanlar(yeni)
+            if not degisenler:
+                self._bekleyen_config = None
+                return []
+            self._bekleyen_config = yeni
+        self._uyandir.set()
+        return degisenler
+    
+    def _guncellemeyi_uygula(self):
+        """Bekleyen konfigürasyonu ve ona bağlı eşleştirme/zamanlama durumunu uygula"""
+        if self._bekleyen_config is None:
+            return
+        with self._config_kilidi:
+            yeni, self._bekleyen_config = self._bekleyen_config, None
+            self._uyandir.clear()
+            if yeni is None:
+                return
+        
+        eski = self.config
+        bot = yeni.bot
+        
+        if yeni.siralama != eski.siralama:
+            self.siralayici = AracSiralayici(yeni.siralama, self.saat, pazar=self.pazar)
+        if not bot.adaptif_kontrol:
+            self.zamanlayici = None
+        elif self.zamanlayici is None:
+            self.zamanlayici = AdaptifZamanlayici(bot, self.saat)
+        else:
+            self.zamanlayici.ayarlari_guncelle(bot)
+        if self.tasiyici is not None:
+            self.yonetici.ayarlari_guncelle(bot)
+            self.tasiyici.ayarlar = bot
+            self.tasiyici.zaman_asimi = (bot.baglanti_zaman_asimi, bot.okuma_zaman_asimi)
+        if (bot.profil_modu, bot.debug_mod) != (eski.bot.profil_modu, eski.bot.debug_mod):
+            self.profil.aktif = bot.profil_modu or bot.debug_mod
+        self.profil.klasor = bot.profil_klasoru
+        self.profil.saklanacak = bot.profil_sayisi
+        
+        # Eşleştirme her kontrolde config'ten üretilir; sorgu dizesi yeni tercihlerle yeniden derlenir
+        self.config = yeni
+        self._sorgu = self._sorguyu_derle()
+        if bot.bot_korumalari != eski.bot.bot_korumalari:
+            self._setup_session()
+        print(f"[AYAR] Konfigürasyon güncellendi: {', '.join(eski.degisen_alanlar(yeni))}")
+    
+    def _sorguyu_derle(self) -> DerlenmisSorgu:
+        """Pazar ve tercih profilleri için kodlanmış sorguyu bir kez hazırla"""
+        return derlenmis_sorgu(
+            self.pazar.kod, self.config.tercih_profilleri(),
+            self.config.bot.sunucu_filtresi, self.SAYFA_BOYUTU
+        )
+    
+    def _izin_bekle(self, url: Optional[str] = None) -> bool:
+        """İstek yöneticisinden izin al; kısa bütçe beklemelerinde bekle"""
+        url = url or self._api_url
+        bekleme, neden = self.yonetici.izin_al(url)
+        if bekleme > 0 and neden == "butce" and bekleme <= self.BUTCE_BEKLEME_SINIRI:
+            self.saat.uyu(bekleme)
+            bekleme, neden = self.yonetici.izin_al(url)
+        if bekleme > 0:
+            print(f"  [BEKLE] İstek gönderilmedi ({neden}, {bekleme:.0f} sn)")
+            if neden == "devre":
+                self._son_red = f"İstek sınırı: devre açık ({bekleme:.0f} sn)"
+            else:
+                self._son_red = f"İstek sınırı: {bekleme:.0f} sn bekleniyor ({neden})"
+            return False
+        return True
+    
+    def _istek(self, uc_nokta: str, adres: str, method: str = 'GET') -> Optional[requests.Response]:
+        """Upstream isteğini istek yöneticisinden geçir; izin yoksa None
+        
+        Yanıt (bağlantı hatası dahil) uç noktaya bildirilir; bağlantı hataları
+        bildirildikten sonra yeniden fırlatılır.
+        """
+        if not self._izin_bekle(uc_nokta):
+            return None
+        try:
+            response = self.tasiyici.get(adres, method=method)
+        except requests.exceptions.RequestException:
+            self.yonetici.sonuc_bildir(uc_nokta, None)
+            raise
+        self.yonetici.sonuc_bildir(uc_nokta, response.status_code, response.headers.get('Retry-After'))
+        return response
+    
+    def _sayfa_getir(self, offset: int) -> Optional[Dict[str, Any]]:
+        """Tek bir envanter sayfasını getir, hata durumunda None döndür"""
+        try:
+            response = self._istek(self._api_url, self._sorgu.adres(self._api_url, offset))
+            if response is None:
+                self._son_hata = self._son_red
+                return None
             
             # Eğer 404 veya başka bir hata alırsak, alternatif URL'leri dene
             if response.status_code == 404:
-                # Türkiye için alternatif URL'ler
-                alternatif_urls = [
-                    f"{BolgeAyarlari.BASE_URL}/inventory/api/v1/inventory-results",
-                    f"{BolgeAyarlari.BASE_URL}/api/tesla/inventory",
-                    "https://www.tesla.com/inventory/api/v1/inventory-results"
-                ]
+                # Pazarın alternatif URL'leri
+                alternatif_urls = [self.pazar.envanter_api] + self.pazar.yedek_apiler
                 
                 for alt_url in alternatif_urls:
+                    if alt_url == self._api_url:
+                        continue
+                    if self.config.bot.debug_mod:
+                        print(f"[DEBUG] Alternatif URL deneniyor: {alt_url}")
                     try:
-                        if self.config.bot.debug_mod:
-                            print(f"[DEBUG] Alternatif URL deneniyor: {alt_url}")
-                        
-                        response = self.session.get(
-                            alt_url,
-                            params=self._api_params(),
-                            timeout=10
-                        )
-                        
-                        if response.status_code == 200:
-                            api_url = alt_url
-                            print(f"[BILGI] Alternatif API endpoint kullanılıyor: {alt_url}")
-                            break
-                    except:
+                        alt_response = self._istek(alt_url, self._sorgu.adres(alt_url, offset))
+                    except requests.exceptions.RequestException:
+                        continue
+                    if alt_response is None:
                         continue
+                    response = alt_response
+                    
+                    if response.status_code == 200:
+                        # Sonraki sayfalar ve kontroller aynı endpoint'i kullansın
+                        self._api_url = alt_url
+                        print(f"[BILGI] Alternatif API endpoint kullanılıyor: {alt_url}")
+                        break
             
             if response.status_code == 200:
-                data = response.json()
-                results = data.get('results', [])
-                
-                # Türkiye'ye özel veri yapısı kontrolü
-                if not results and 'data' in data:
-                    results = data.get('data', {}).get('results', [])
-                
-                # Araçları EnvanterArac nesnelerine dönüştür
-                araclar = [EnvanterArac(item) for item in results]
-                
-                if self.config.bot.debug_mod:
-                    print(f"[DEBUG] {len(araclar)} araç bulundu")
-                    print(f"[DEBUG] Kullanılan API: {api_url}")
-                    
-                return araclar
-            else:
-                print(f"[HATA] API yanıtı: {response.status_code}")
-                if self.config.bot.debug_mod:
-                    print(f"[DEBUG] Response headers: {response.headers}")
-                    print(f"[DEBUG] Response text: {response.text[:500]}...")
-                return []
+                return response.json()
+            
+            print(f"[HATA] API yanıtı: {response.status_code}")
+            self._son_hata = f"API yanıtı: {response.status_code}"
+            if self.config.bot.debug_mod:
+                print(f"[DEBUG] Response headers: {response.headers}")
+                print(f"[DEBUG] Response text: {response.text[:500]}...")
+            return None
                 
         except requests.exceptions.RequestException as e:
             print(f"[HATA] API isteği başarısız: {str(e)}")
-            return []
+            self._son_hata = f"API isteği başarısız: {str(e)}"
+            return None
         except json.JSONDecodeError as e:
             print(f"[HATA] JSON parse hatası: {str(e)}")
-            return []
+            self._son_hata = f"JSON parse hatası: {str(e)}"
+            return None
+    
+    def ham_sayfalar(self) -> Iterator[List[Dict[str, Any]]]:
+        """Envanteri fiyata göre artan sırada ham API kayıtları olarak sayfa sayfa getir
+        
+        Sonuçlar fiyata göre sıralı geldiği için, bir sayfada fiyat limitini
+        aşan bir araç görüldüğünde sonraki sayfalar da limitin üstündedir ve
+        istek yapılmaz. Bildirilen toplam sayıya ulaşıldığında da durulur.
+        Bekleyen konfigürasyon güncellemesi sorgudan önce uygulanır.
+        
+        Sayfalama hata, istek reddi veya sayfa sınırı yüzünden yarıda kalırsa
+        `son_sorgu_tam` False olur; eksik liste araçların satıldığını göstermez.
+        """
+        self._guncellemeyi_uygula()
+        self._son_hata = None
+        self._tam_sonuc = False
+        
+        # Bot koruması için rastgele gecikme
+        if self.config.bot.bot_korumalari:
+            self.saat.uyu(random.uniform(0.5, 2.0))
+        
+        # Yedek profiller daha yüksek limit içerebilir, en yüksek limite kadar sayfala
+        maksimum_fiyat = max(tercih.maksimum_fiyat for tercih in self.config.tercih_profilleri())
+        offset = 0
+        
+        for sayfa_no in range(self.MAKSIMUM_SAYFA):
+            if sayfa_no > 0 and self.config.bot.bot_korumalari:
+                self.saat.uyu(random.uniform(0.2, 0.6))
+            
+            data = self._sayfa_getir(offset)
+            if data is None:
+                return
+            
+            results = self.pazar.sonuclar(data)
+            if not results:
+                self._tam_sonuc = True
+                return
+            
+            if self.config.bot.debug_mod:
+                print(f"[DEBUG] Sayfa {sayfa_no + 1}: {len(results)} araç (offset={offset})")
+            
+            yield results
+            
+            offset += len(results)
+            toplam = self.pazar.toplam(data)
+            
+            if (toplam is not None and offset >= toplam
+                    or len(results) < self.SAYFA_BOYUTU
+                    or max(float(item.get('Price', 0)) for item in results) > maksimum_fiyat):
+                self._tam_sonuc = True
+                return
+        
+        print(f"[UYARI] Sayfa sınırına ({self.MAKSIMUM_SAYFA}) ulaşıldı, envanter eksik olabilir")
+    
+    def envanter_sayfalari(self) -> Iterator[List[EnvanterArac]]:
+        """Envanteri fiyata göre artan sırada EnvanterArac sayfaları olarak getir"""
+        for results in self.ham_sayfalar():
+            # Araçları EnvanterArac nesnelerine dönüştür
+            araclar = [EnvanterArac(item) for item in results]
+            EnvanterArac.ham_verileri_sakla(results)
+            yield araclar
+    
+    def envanter_sorgula(self) -> List[EnvanterArac]:
+        """Envanter API'sini sorgula ve araçları getir"""
+        araclar = []
+        for sayfa in self.envanter_sayfalari():
+            araclar.extend(sayfa)
+        
+        if self.config.bot.debug_mod:
+            print(f"[DEBUG] {len(araclar)} araç bulundu")
+            print(f"[DEBUG] Kullanılan API: {self._api_url}")
+        
+        return araclar
+    
+    def uygun_araclari_sirala(self, araclar: List[EnvanterArac]) -> List[EnvanterArac]:
+        """Araçları ana tercihe göre filtrele ve tercih sırasına diz"""
+        return EnvanterIndeksi(araclar).uygunlar(self.config.tercih)
     
     def uygun_arac_bul(self) -> Optional[EnvanterArac]:
-        """Kriterlere uygun araç bul"""
+        """Kriterlere uygun araç bul (ana tercih, sonra yedek tercihler)"""
+        self._guncellemeyi_uygula()
         araclar = self.envanter_sorgula()
         
-        # SR modellerini filtrele
-        sr_araclar = [arac for arac in araclar if arac.is_sr_model()]
+        # Tip, renk ve stok durumu filtresi tüm profiller için bir kez yapılır
+        # (sunucu filtresi uygulanmış olsa da güvenlik için)
+        indeks = EnvanterIndeksi(araclar)
+        profiller = self.config.tercih_profilleri()
         
         if self.config.bot.debug_mod:
-            print(f"[DEBUG] {len(sr_araclar)} SR model bulundu")
-        
-        # Kriterlere göre filtrele
-        uygun_araclar = []
-        for arac in sr_araclar:
-            # Fiyat kontrolü
-            if not arac.fiyat_uygun_mu(self.config.tercih.maksimum_fiyat):
-                continue
-                
-            # Renk kontrolü
-            if not arac.renk_uygun_mu(self.config.tercih.renk_tercihi):
-                continue
-                
-            # Stok durumu kontrolü
-            if arac.durum not in ['Available', 'InTransit']:
-                continue
-                
-            uygun_araclar.append(arac)
+            print(f"[DEBUG] {len(profiller)} tercih profili değerlendiriliyor")
         
-        if not uygun_araclar:
-            return None
+        # Adaptif zamanlayıcı geliş örüntüsünü tercih filtresinden önce tüm araçlardan öğrenir;
+        # eksik bir liste araçları satılmış, sonraki tam liste de yeni gelmiş gösterirdi
+        if self.zamanlayici and self.son_sorgu_tam:
+            self.zamanlayici.gozlemle(araclar)
         
-        # Renk tercihine göre sırala
-        def renk_onceligi(arac):
-            try:
-                return self.config.tercih.renk_tercihi.index(
-                    RenkTercihi(arac.renk.lower())
-                )
-            except (ValueError, AttributeError):
-                return 999  # Bilinmeyen renk en sona
+        # Canlı envanter tablosu farkları abonenin kendi thread'inde hesaplar; eksik liste
+        # tabloyu boşaltıp sonraki tam listede tüm araçları yeni göstereceği için yayınlanmaz
+        if self.son_sorgu_tam:
+            self.olaylar.yayinla(EnvanterGuncellendi(araclar, profiller))
         
-        uygun_araclar.sort(key=lambda x: (renk_onceligi(x), x.fiyat))
+        # Renk, tip, fiyat ve opsiyon filtresi indeksten; teslimat, menzil ve durum
+        # kısıtları ile puanlama sıralayıcıda yapılır
+        adaylar = [indeks.uygunlar(tercih) for tercih in profiller]
         
-        secilen_arac = uygun_araclar[0]
+        for profil_sirasi, (tercih, grup) in enumerate(zip(profiller, adaylar)):
+            siralama = self.siralayici.sirala(grup, tercih)
+            if siralama:
+                break
+        else:
+            return None
+        
+        self.son_adaylar = siralama
+        secilen_arac = siralama[0].arac
         
         print(f"\n[BULUNDU] Uygun araç tespit edildi:")
+        if profil_sirasi > 0:
+            print(f"  Profil: {profil_sirasi}. yedek tercih")
         print(f"  VIN: {secilen_arac.vin}")
         print(f"  Model: {secilen_arac.trim}")
         print(f"  Renk: {secilen_arac.renk}")
-        print(f"  Fiyat: {secilen_arac.fiyat:,.0f} TL")
+        print(f"  Fiyat: {self.pazar.fiyat_metni(secilen_arac.fiyat)}")
         print(f"  Lokasyon: {secilen_arac.lokasyon}")
         print(f"  Teslimat: {secilen_arac.teslimat_tarihi}")
+        if len(siralama) > 1 or self.config.bot.debug_mod:
+            print(f"  En iyi {len(siralama)} aday:")
+            for aday in siralama:
+                dokum = ', '.join(f"{terim} {deger:.2f}" for terim, deger in aday.kirilim.items() if deger)
+                print(f"    {aday.arac.vin} {self.pazar.fiyat_metni(aday.arac.fiyat)}  puan {aday.puan:.2f}  ({dokum or '-'})")
         
+        self.olaylar.yayinla(AracBulundu(
+            secilen_arac.vin, secilen_arac.trim, secilen_arac.renk,
+            secilen_arac.fiyat, profil_sirasi, self.pazar.para_birimi
+        ))
         return secilen_arac
     
     def surekli_kontrol(self, callback=None) -> Optional[EnvanterArac]:
         """Belirli aralıklarla envanter kontrolü yap"""
         deneme = 0
-        baslangic_zamani = time.time()
+        baslangic_zamani = self.saat.zaman()
         
         print(f"[BAŞLADI] Envanter kontrolü başladı...")
         print(f"  Kontrol aralığı: {self.config.bot.kontrol_araligi} saniye")
@@ -255,13 +496,22 @@ class TeslaEnvanter:
         
         while deneme < self.config.bot.maksimum_deneme:
             deneme += 1
-            gecen_sure = time.time() - baslangic_zamani
+            self._guncellemeyi_uygula()
+            gecen_sure = self.saat.zaman() - baslangic_zamani
             
-            print(f"\n[KONTROL #{deneme}] Saat: {datetime.now().strftime('%H:%M:%S')}")
+            print(f"\n[KONTROL #{deneme}] Saat: {self.saat.simdi().strftime('%H:%M:%S')}")
             
             # Satış saatini kontrol et
-            if self._satis_saati_kontrolu():
-                arac = self.uygun_arac_bul()
+            if self.satis_saati_kontrolu():
+                try:
+                    with self.profil.olc(f"kontrol_{deneme}"):
+                        arac = self.uygun_arac_bul()
+                except Exception as e:
+                    self.olaylar.yayinla(KontrolHatasi(deneme, str(e)))
+                    raise
+                
+                if self._son_hata:
+                    self.olaylar.yayinla(KontrolHatasi(deneme, self._son_hata))
                 
                 if arac:
                     if callback:
@@ -272,35 +522,100 @@ class TeslaEnvanter:
             
             # Son deneme değilse bekle
             if deneme < self.config.bot.maksimum_deneme:
-                # Rastgele varyasyon ekle (bot koruması)
-                bekleme_suresi = self.config.bot.kontrol_araligi
-                if self.config.bot.bot_korumalari:
-                    bekleme_suresi += random.uniform(-1, 1)
-                    bekleme_suresi = max(1, bekleme_suresi)  # En az 1 saniye
-                
+                bekleme_suresi = self.bekleme_suresi()
                 print(f"  {bekleme_suresi:.1f} saniye bekleniyor...")
-                time.sleep(bekleme_suresi)
+                self.saat.uyu(bekleme_suresi, self._uyandir)
         
         print(f"\n[BİTTİ] Maksimum deneme sayısına ulaşıldı")
         return None
     
-    def _satis_saati_kontrolu(self) -> bool:
-        """Satış saatinin gelip gelmediğini kontrol et"""
+    def kapat(self):
+        """HTTP bağlantılarını kapat"""
+        if self.tasiyici is not None:
+            self.tasiyici.kapat()
+    
+    def bekleme_suresi(self) -> float:
+        """Bir sonraki kontrole kadar beklenecek süre"""
+        if self.zamanlayici:
+            bekleme_suresi = self.zamanlayici.bekleme_suresi()
+            en_kisa = self.config.bot.minimum_aralik
+        else:
+            bekleme_suresi = self.config.bot.kontrol_araligi
+            en_kisa = 1  # En az 1 saniye
+        
+        # Rastgele varyasyon ekle (bot koruması)
+        if self.config.bot.bot_korumalari:
+            sapma = min(1.0, bekleme_suresi * 0.2) if self.zamanlayici else 1.0
+            bekleme_suresi += random.uniform(-sapma, sapma)
+            bekleme_suresi = max(en_kisa, bekleme_suresi)
+        
+        # Satış saati aralıktan yakınsa ilk kontrol tam satış anına (sunucu saatiyle) denk getirilir
+        kalan = self._satise_kalan()
+        if kalan > 0:
+            bekleme_suresi = min(bekleme_suresi, kalan + 1e-3)
+        
+        # Retry-After, geri çekilme veya açık devre varsa en az o kadar bekle
+        if self.yonetici is not None:
+            yonetici_beklemesi, _ = self.yonetici.bekleme(self._api_url)
+            bekleme_suresi = max(bekleme_suresi, yonetici_beklemesi)
+        
+        return bekleme_suresi
+    
+    def sunucu_simdi(self) -> datetime:
+        """Tahmini sunucu saati (yerel saat + ölçülen fark)"""
+        return self.saat.simdi() + timedelta(seconds=self.saat_farki.fark)
+    
+    def saat_farki_durumu(self) -> Dict[str, Any]:
+        """Sunucu saat farkı tahmininin özeti (arayüz için)"""
+        return self.saat_farki.durum()
+    
+    def _satise_kalan(self) -> float:
+        """Sunucu saatiyle satış başlangıcına kalan süre (saniye, başladıysa 0)
+        
+        Tahminin belirsizliği eklenir; satış kesin olarak başlamadan kontrol yapılmaz.
+        """
         satis_saati = datetime.strptime(
             self.config.bot.satis_baslangic_saati, 
             '%H:%M'
         ).time()
-        
-        simdiki_saat = datetime.now().time()
+        simdi = self.sunucu_simdi()
+        kalan = (datetime.combine(simdi.date(), satis_saati) - simdi).total_seconds()
+        if kalan <= 0:
+            return 0.0
+        return kalan + (self.saat_farki_durumu()['belirsizlik_sn'] or 0.0)
+    
+    def _saati_olc(self):
+        """Sunucu saat farkını tek bir HEAD isteğiyle ölç (istek bütçesinden düşer)"""
+        try:
+            self._istek(self._api_url, self._api_url, method='HEAD')
+        except requests.exceptions.RequestException:
+            pass
+    
+    def satis_saati_kontrolu(self) -> bool:
+        """Satış saatinin (sunucu saatine göre) gelip gelmediğini kontrol et"""
+        kalan_saniye = self._satise_kalan()
         
         # Satış saati henüz gelmemişse
-        if simdiki_saat < satis_saati:
-            kalan_dakika = (
-                datetime.combine(datetime.today(), satis_saati) - 
-                datetime.combine(datetime.today(), simdiki_saat)
-            ).seconds // 60
+        if kalan_saniye > 0:
+            # Satıştan önce sunucu saat farkını ölç
+            if (self.SAAT_OLCUMU and kalan_saniye <= self.SAAT_OLCUM_ONCESI
+                    and self.saat_farki.olcum_gerekli(self.saat.zaman())):
+                self._saati_olc()
+                kalan_saniye = self._satise_kalan()
+                if kalan_saniye <= 0:
+                    return True
+            
+            # Satıştan hemen önce DNS ve TLS bağlantısını hazırla
+            if not self._isitildi and kalan_saniye <= self.config.bot.isitma_oncesi:
+                # Isınma isteği de istek bütçesinden düşer ve sonucu bildirilir
+                self._isitildi = self.tasiyici.isit(
+                    self._api_url, lambda url: self._istek(url, url, method='HEAD')
+                )
             
-            print(f"  Satış saatine {kalan_dakika} dakika kaldı ({self.config.bot.satis_baslangic_saati})")
+            fark = self.saat_farki_durumu()
+            if fark['belirsizlik_sn'] is not None:
+                print(f"  Sunucu saat farkı: {fark['fark_sn']:+.2f} sn (±{fark['belirsizlik_sn']:.2f})")
+            print(f"  Satış saatine {int(kalan_saniye) // 60} dakika kaldı ({self.config.bot.satis_baslangic_saati})")
             return False
         
         return True 
\ No newline at end of file
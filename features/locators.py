@@ -0,0 +1,300 @@
+"""
+Tesla Sipariş Seçicileri Modülü
+Sipariş adımlarının eleman konumlayıcıları ve kaydedilmiş sayfalara karşı tarayıcısız doğrulama
+
+Sayfalar `sayfa_kaydi` açıkken sipariş sırasında adım adım kaydedilir;
+doğrulama lxml (XPath) ve BeautifulSoup/soupsieve (CSS) ile yapılır:
+    python -m features.locators sayfa_kayitlari
+    python -m features.locators --yerel      # yerel sipariş sayfalarına karşı
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import lxml.html
+from bs4 import BeautifulSoup
+from lxml.etree import XPathError
+from selenium.webdriver.common.by import By
+
+
+Konumlayici = Tuple[str, str]
+
+
+class SeciciGrubu:
+    """Aynı eleman için sırayla denenen konumlayıcılar ve her birinin bekleme süresi"""
+
+    __slots__ = ('ad', 'konumlayicilar', 'zaman_asimi', 'zorunlu')
+
+    def __init__(self, ad: str, konumlayicilar: Sequence[Konumlayici],
+                 zaman_asimi: float = 0.0, zorunlu: bool = True):
+        self.ad = ad
+        self.konumlayicilar = list(konumlayicilar)
+        self.zaman_asimi = zaman_asimi
+        self.zorunlu = zorunlu
+
+    def __iter__(self):
+        return iter(self.konumlayicilar)
+
+    def __repr__(self):
+        return f"<SeciciGrubu {self.ad} ({len(self.konumlayicilar)})>"
+
+
+def form_alani(alan: str, zaman_asimi: float = 0.0) -> SeciciGrubu:
+    """Hesap bilgileri formundaki bir alanın konumlayıcıları"""
+    return SeciciGrubu(alan, [
+        (By.NAME, alan),
+        (By.ID, alan),
+        (By.CSS_SELECTOR, f"input[name='{alan}']"),
+        (By.XPATH, f"//input[@name='{alan}']"),
+    ], zaman_asimi, zorunlu=False)
+
+
+def kart_alani(alan: str, zaman_asimi: float = 0.0) -> SeciciGrubu:
+    """Kart bilgileri formundaki bir alanın konumlayıcıları"""
+    return SeciciGrubu(alan, [
+        (By.NAME, alan),
+        (By.ID, alan),
+        (By.CSS_SELECTOR, f"input[name='{alan}']"),
+        (By.XPATH, f"//input[contains(@placeholder, '{alan}')]"),
+    ], zaman_asimi, zorunlu=False)
+
+
+SIPARIS_BUTONU = SeciciGrubu('siparis_butonu', [
+    (By.XPATH, "//button[contains(text(), 'Sipariş Ver')]"),
+    (By.XPATH, "//button[contains(text(), 'Order Now')]"),
+    (By.CSS_SELECTOR, "button[data-id='order-button']"),
+    (By.CSS_SELECTOR, ".order-button"),
+    (By.XPATH, "//button[contains(@class, 'order')]"),
+], zaman_asimi=5)
+
+POSTA_KODU_ALANI = SeciciGrubu('posta_kodu', [
+    (By.XPATH, "//input[@placeholder='Enter Delivery ZIP']"),
+    (By.XPATH, "//input[@placeholder='Teslimat Posta Kodu']"),
+    (By.NAME, "deliveryZip"),
+    (By.ID, "delivery-zip"),
+    (By.CSS_SELECTOR, "input[data-id='delivery-zip']"),
+], zaman_asimi=20, zorunlu=False)
+
+FORM_ALANLARI = ('firstName', 'lastName', 'email', 'confirmEmail', 'phone')
+
+KART_ODEME_BUTONU = SeciciGrubu('kart_odeme_butonu', [
+    (By.XPATH, "//button[contains(text(), 'Order with Card')]"),
+    (By.XPATH, "//button[contains(text(), 'Kart ile Sipariş')]"),
+    (By.CSS_SELECTOR, "button[data-id='card-payment']"),
+    (By.XPATH, "//button[contains(@class, 'card-payment')]"),
+], zaman_asimi=5)
+
+KART_ALANLARI = ('cardName', 'cardNumber', 'cvv', 'billingZip', 'deliveryZip')
+
+SON_KULLANMA_AY = SeciciGrubu('son_kullanma_ay', [
+    (By.NAME, 'expirationMonth'),
+    (By.ID, 'expiration-month'),
+    (By.CSS_SELECTOR, "select[name='expirationMonth']"),
+], zorunlu=False)
+
+SON_KULLANMA_YIL = SeciciGrubu('son_kullanma_yil', [
+    (By.NAME, 'expirationYear'),
+    (By.ID, 'expiration-year'),
+    (By.CSS_SELECTOR, "select[name='expirationYear']"),
+], zorunlu=False)
+
+SIPARISI_VER_BUTONU = SeciciGrubu('siparisi_ver_butonu', [
+    (By.XPATH, "//button[contains(text(), 'Place Order')]"),
+    (By.XPATH, "//button[contains(text(), 'Siparişi Ver')]"),
+    (By.CSS_SELECTOR, "button[data-id='place-order']"),
+    (By.CSS_SELECTOR, ".place-order-button"),
+    (By.XPATH, "//button[contains(@class, 'order-submit')]"),
+], zaman_asimi=20)
+
+# Onay sonrası sayfa kaynağında aranan metinler (küçük harf)
+BASARI_GOSTERGELERI = (
+    "order-confirmation",
+    "order-success",
+    "thank-you",
+    "teşekkür",
+    "sipariş alındı",
+    "order received",
+)
+
+# Kaydedilen her sayfa için o sayfada aranan gruplar (dosya adı: '<adim>.html')
+ADIM_SECICILERI: Dict[str, List[SeciciGrubu]] = {
+    'arac_sayfasi': [SIPARIS_BUTONU],
+    'siparis_formu': [POSTA_KODU_ALANI, *map(form_alani, FORM_ALANLARI), KART_ODEME_BUTONU],
+    'kart_bilgileri': [*map(kart_alani, KART_ALANLARI), SON_KULLANMA_AY, SON_KULLANMA_YIL],
+    'onay': [SIPARISI_VER_BUTONU],
+}
+SONUC_SAYFASI = 'sonuc'
+
+
+def _xpath_karsiligi(konumlayici: Konumlayici) -> Optional[str]:
+    tip, deger = konumlayici
+    if tip == By.XPATH:
+        return deger
+    if tip in (By.NAME, By.ID):
+        tirnak = '"' if "'" in deger else "'"
+        return f"//*[@{tip}={tirnak}{deger}{tirnak}]"
+    return None
+
+
+class KayitliSayfa:
+    """Kaydedilmiş bir sayfa; XPath lxml ağacında, CSS gerektiğinde BeautifulSoup ile değerlendirilir"""
+
+    def __init__(self, html: bytes):
+        self.html = html
+        self.agac = lxml.html.fromstring(html)
+        self._corba: Optional[BeautifulSoup] = None
+
+    def eslesme_sayisi(self, konumlayici: Konumlayici) -> int:
+        """Konumlayıcının eşleştiği eleman sayısı (geçersiz ifadede ValueError)"""
+        xpath = _xpath_karsiligi(konumlayici)
+        if xpath is not None:
+            try:
+                sonuc = self.agac.xpath(xpath)
+            except XPathError as e:
+                raise ValueError(f"Geçersiz XPath: {e}")
+            return len(sonuc) if isinstance(sonuc, list) else int(bool(sonuc))
+
+        tip, deger = konumlayici
+        if tip == By.CLASS_NAME:
+            deger, tip = f".{deger}", By.CSS_SELECTOR
+        elif tip == By.TAG_NAME:
+            tip = By.CSS_SELECTOR
+        if tip != By.CSS_SELECTOR:
+            raise ValueError(f"Desteklenmeyen konumlayıcı: {tip}")
+        if self._corba is None:
+            self._corba = BeautifulSoup(self.html, 'lxml')
+        try:
+            return len(self._corba.select(deger))
+        except Exception as e:  # soupsieve.SelectorSyntaxError
+            raise ValueError(f"Geçersiz CSS: {e}")
+
+
+class GrupSonucu:
+    """Bir seçici grubunun kaydedilmiş sayfadaki sonucu"""
+
+    def __init__(self, adim: str, grup: SeciciGrubu):
+        self.adim = adim
+        self.grup = grup
+        self.eslesmeler: List[int] = []
+        self.hatalar: Dict[int, str] = {}
+
+    @property
+    def secilen(self) -> Optional[int]:
+        """Botun kullanacağı konumlayıcının sırası (ilk eşleşen)"""
+        return next((i for i, adet in enumerate(self.eslesmeler) if adet), None)
+
+    @property
+    def bekleme_cezasi(self) -> float:
+        """Eşleşen konumlayıcıya gelene kadar boşa beklenecek süre (saniye)"""
+        secilen = self.secilen
+        atlanan = len(self.eslesmeler) if secilen is None else secilen
+        return atlanan * self.grup.zaman_asimi
+
+    @property
+    def basarili(self) -> bool:
+        return not self.hatalar and (self.secilen is not None or not self.grup.zorunlu)
+
+
+def sayfayi_dogrula(adim: str, sayfa: KayitliSayfa,
+                    gruplar: Optional[Sequence[SeciciGrubu]] = None) -> List[GrupSonucu]:
+    """Adımın tüm seçici gruplarını kaydedilmiş sayfada değerlendir"""
+    sonuclar = []
+    for grup in gruplar if gruplar is not None else ADIM_SECICILERI[adim]:
+        sonuc = GrupSonucu(adim, grup)
+        for sira, konumlayici in enumerate(grup):
+            try:
+                sonuc.eslesmeler.append(sayfa.eslesme_sayisi(konumlayici))
+            except ValueError as e:
+                sonuc.eslesmeler.append(0)
+                sonuc.hatalar[sira] = str(e)
+        sonuclar.append(sonuc)
+    return sonuclar
+
+
+def basari_gostergeleri(sayfa: KayitliSayfa) -> List[str]:
+    """Sonuç sayfasında bulunan başarı göstergeleri"""
+    metin = lxml.html.tostring(sayfa.agac, encoding='unicode').lower()
+    return [gosterge for gosterge in BASARI_GOSTERGELERI if gosterge in metin]
+
+
+def klasoru_dogrula(klasor: str) -> Tuple[Dict[str, List[GrupSonucu]], Optional[List[str]]]:
+    """Klasördeki '<adim>.html' kayıtlarını doğrula; kaydı olmayan adımlar atlanır"""
+    sonuclar: Dict[str, List[GrupSonucu]] = {}
+    for adim in ADIM_SECICILERI:
+        yol = os.path.join(klasor, f"{adim}.html")
+        if os.path.exists(yol):
+            with open(yol, 'rb') as f:
+                sonuclar[adim] = sayfayi_dogrula(adim, KayitliSayfa(f.read()))
+    gostergeler = None
+    yol = os.path.join(klasor, f"{SONUC_SAYFASI}.html")
+    if os.path.exists(yol):
+        with open(yol, 'rb') as f:
+            gostergeler = basari_gostergeleri(KayitliSayfa(f.read()))
+    return sonuclar, gostergeler
+
+
+def rapor_yazdir(sonuclar: Dict[str, List[GrupSonucu]], gostergeler: Optional[List[str]]) -> int:
+    """Sonuçları yazdır; sorunlu grup sayısını döndür"""
+    sorunlu = 0
+    for adim in ADIM_SECICILERI:
+        if adim not in sonuclar:
+            print(f"[UYARI] {adim}: kayıt yok")
+            continue
+        print(f"\n{adim}")
+        for sonuc in sonuclar[adim]:
+            secilen = sonuc.secilen
+            durum = "OK" if sonuc.basarili else "HATA"
+            if sonuc.basarili and (secilen is None or sonuc.bekleme_cezasi):
+                durum = "UYARI"
+            sorunlu += not sonuc.basarili
+            ozet = "eşleşme yok" if secilen is None else f"{secilen + 1}. konumlayıcı"
+            ceza = f", {sonuc.bekleme_cezasi:.0f} sn bekleme" if sonuc.bekleme_cezasi else ""
+            print(f"  [{durum}] {sonuc.grup.ad:<20} {ozet}{ceza}")
+            for sira, (konumlayici, adet) in enumerate(zip(sonuc.grup, sonuc.eslesmeler)):
+                isaret = "✗" if sira in sonuc.hatalar else ("✓" if adet else "·")
+                ek = f"  {sonuc.hatalar[sira]}" if sira in sonuc.hatalar else (f"  ({adet})" if adet else "")
+                print(f"      {isaret} {konumlayici[0]:<12} {konumlayici[1]}{ek}")
+    if gostergeler is not None:
+        if gostergeler:
+            print(f"\n[OK] {SONUC_SAYFASI}: başarı göstergeleri: {', '.join(gostergeler)}")
+        else:
+            sorunlu += 1
+            print(f"\n[HATA] {SONUC_SAYFASI}: başarı göstergesi bulunamadı")
+    return sorunlu
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Sipariş seçicilerini kaydedilmiş sayfalara karşı doğrula")
+    parser.add_argument('klasor', nargs='?', default="sayfa_kayitlari", help="Sayfa kayıtlarının klasörü")
+    parser.add_argument('--yerel', action='store_true', help="Yerel sipariş sayfalarına karşı doğrula")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    if args.yerel:
+        from utils.mock_checkout import YerelSiparisSunucusu
+        sayfalar = YerelSiparisSunucusu.sayfalar()
+        sonuclar = {
+            adim: sayfayi_dogrula(adim, KayitliSayfa(sayfalar[adim].encode('utf-8')))
+            for adim in ADIM_SECICILERI
+        }
+        gostergeler = basari_gostergeleri(KayitliSayfa(sayfalar[SONUC_SAYFASI].encode('utf-8')))
+    else:
+        if not os.path.isdir(args.klasor):
+            print(f"[HATA] Kayıt klasörü bulunamadı: {args.klasor} (sayfa_kaydi ile bir sipariş çalıştırın)")
+            return 1
+        sonuclar, gostergeler = klasoru_dogrula(args.klasor)
+    sure_ms = (time.perf_counter() - t0) * 1000
+
+    sorunlu = rapor_yazdir(sonuclar, gostergeler)
+    print(f"\n[BILGI] {sum(len(g) for g in sonuclar.values())} grup {sure_ms:.1f} ms içinde doğrulandı")
+    if sorunlu:
+        print(f"[HATA] {sorunlu} grup eşleşmedi veya geçersiz")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+Tesla Eşleştirme Modülü
+Tek bir envanter sorgusunu birden fazla tercih profiline karşı değerlendirme
+"""
+
+from bisect import bisect_right
+from operator import attrgetter
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from core.config import AracTercihi, AracTipi, RenkTercihi
+from .options import tercih_maskeleri
+
+
+# API'deki PAINT kodlarının renk tercihlerine karşılığı
+RENK_ESLEMESI: Dict[str, RenkTercihi] = {
+    'red': RenkTercihi.KIRMIZI,
+    'white': RenkTercihi.BEYAZ,
+    'black': RenkTercihi.SIYAH,
+    'blue': RenkTercihi.MAVI,
+    'grey': RenkTercihi.GRI,
+    'pearl': RenkTercihi.BEYAZ,  # Pearl white
+    'solid': RenkTercihi.SIYAH,  # Solid black
+}
+
+SATISTAKI_DURUMLAR = ('Available', 'InTransit')
+
+_FIYAT = attrgetter('fiyat')
+
+
+class EnvanterIndeksi:
+    """Bir kontrolde getirilen araçların ön filtrelenmiş, paylaşılan indeksi
+
+    Stokta olan araçlar bir kez (araç tipi, renk) gruplarına ayrılır ve her
+    grup fiyata göre sıralanır. Bir profili değerlendirmek yalnızca renk
+    tercihleri kadar grup araması ve fiyat limiti için bir ikili arama
+    gerektirir, bu yüzden profil eklemek kontrol başına neredeyse bedavadır.
+    Zorunlu/yasak opsiyonlar araç başına iki bitset işlemiyle elenir.
+    """
+
+    def __init__(self, araclar: Sequence):
+        self.arac_sayisi = len(araclar)
+        self._gruplar: Dict[Tuple[AracTipi, RenkTercihi], List] = {}
+
+        # Aynı (boya, trim) çiftleri tekrar tekrar geldiği için aracın gireceği
+        # grup listeleri çift başına bir kez bulunur
+        hedefler: Dict[Tuple[str, str], Tuple[List, ...]] = {}
+
+        for arac in araclar:
+            if arac.durum not in SATISTAKI_DURUMLAR:
+                continue
+            cift = (arac.renk, arac.trim)
+            gruplar = hedefler.get(cift)
+            if gruplar is None:
+                gruplar = hedefler[cift] = self._hedef_gruplar(arac)
+            for grup in gruplar:
+                grup.append(arac)
+
+        self._fiyatlar: Dict[Tuple[AracTipi, RenkTercihi], List[float]] = {}
+        for anahtar, grup in self._gruplar.items():
+            grup.sort(key=_FIYAT)
+            self._fiyatlar[anahtar] = [arac.fiyat for arac in grup]
+
+    def _hedef_gruplar(self, arac) -> Tuple[List, ...]:
+        """Aracın (tip, renk) grup listeleri; renk tanınmıyorsa boş"""
+        renk = RENK_ESLEMESI.get(arac.renk.lower())
+        if renk is None:
+            return ()
+        return tuple(
+            self._gruplar.setdefault((arac_tipi, renk), [])
+            for arac_tipi in AracTipi if arac.tip_uygun_mu(arac_tipi)
+        )
+
+    def uygunlar(self, tercih: AracTercihi) -> List:
+        """Profile uyan tüm araçlar (renk önceliği, sonra fiyat sırasıyla)"""
+        zorunlu, yasak = tercih_maskeleri(tercih)
+        sonuc = []
+        for renk in dict.fromkeys(tercih.renk_tercihi):
+            anahtar = (tercih.arac_tipi, renk)
+            grup = self._gruplar.get(anahtar)
+            if grup:
+                sinir = bisect_right(self._fiyatlar[anahtar], tercih.maksimum_fiyat)
+                if zorunlu or yasak:
+                    sonuc.extend(
+                        arac for arac in grup[:sinir]
+                        if arac.secenek_maskesi & zorunlu == zorunlu and not arac.secenek_maskesi & yasak
+                    )
+                else:
+                    sonuc.extend(grup[:sinir])
+        return sonuc
+
+
+# Red nedenleri, değerlendirme sırasıyla (bir profilde daha ileri gidilen neden daha bilgilendiricidir)
+RED_NEDENLERI = ('durum', 'trim', 'renk', 'fiyat', 'opsiyon')
+
+
+def red_nedeni(arac, tercihler: Sequence[AracTercihi]) -> Optional[str]:
+    """Araç herhangi bir profile uyuyorsa None, uymuyorsa en ileri aşamadaki red nedeni"""
+    if arac.durum not in SATISTAKI_DURUMLAR:
+        return 'durum'
+    renk = RENK_ESLEMESI.get(arac.renk.lower())
+    en_ileri = 1
+    for tercih in tercihler:
+        if not arac.tip_uygun_mu(tercih.arac_tipi):
+            continue
+        if renk is None or renk not in tercih.renk_tercihi:
+            en_ileri = max(en_ileri, 2)
+            continue
+        if arac.fiyat > tercih.maksimum_fiyat:
+            en_ileri = max(en_ileri, 3)
+            continue
+        zorunlu, yasak = tercih_maskeleri(tercih)
+        if not arac.secenekler_uygun_mu(zorunlu, yasak):
+            en_ileri = max(en_ileri, 4)
+            continue
+        return None
+    return RED_NEDENLERI[en_ileri]
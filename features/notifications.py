@@ -0,0 +1,113 @@
+"""
+Tesla Bildirim Modülü
+Olay yolu abonesi olarak çalışan webhook, masaüstü ve sesli bildirimler
+"""
+
+import json
+import shutil
+import subprocess
+import sys
+from typing import List, Optional
+
+import requests
+
+from core.config import BotAyarlari
+from utils.events import (
+    Olay, OlayYolu, Abone, AracBulundu, SiparisBasarili, SiparisBasarisiz, KontrolHatasi
+)
+
+
+# Kullanıcının dikkatini gerektiren olaylar
+ONEMLI_OLAYLAR = (AracBulundu, SiparisBasarili, SiparisBasarisiz)
+
+
+def olay_metni(olay: Olay) -> str:
+    """Olayı kısa, okunabilir bir metne çevir"""
+    if isinstance(olay, AracBulundu):
+        return f"Araç bulundu: {olay.trim} / {olay.renk} / {olay.fiyat:,.0f} {olay.para_birimi} ({olay.vin})"
+    if isinstance(olay, SiparisBasarili):
+        return f"Sipariş verildi: {olay.vin}"
+    if isinstance(olay, SiparisBasarisiz):
+        return f"Sipariş başarısız ({olay.adim or 'başlangıç'}): {olay.hata}"
+    if isinstance(olay, KontrolHatasi):
+        return f"Kontrol #{olay.deneme} hatası: {olay.hata}"
+    return olay.tip
+
+
+class WebhookBildirici:
+    """Olayları JSON olarak bir webhook adresine gönderir"""
+
+    def __init__(self, url: str, zaman_asimi: float = 5.0):
+        self.url = url
+        self.zaman_asimi = zaman_asimi
+        self.session = requests.Session()
+
+    def __call__(self, olay: Olay):
+        veri = olay.sozluk()
+        veri['mesaj'] = olay_metni(olay)
+        yanit = self.session.post(
+            self.url,
+            data=json.dumps(veri, ensure_ascii=False, default=str).encode('utf-8'),
+            headers={'Content-Type': 'application/json'},
+            timeout=self.zaman_asimi,
+        )
+        yanit.raise_for_status()
+
+
+class MasaustuBildirici:
+    """İşletim sisteminin bildirim aracıyla masaüstü bildirimi gösterir"""
+
+    def __init__(self, baslik: str = "Tesla Bot"):
+        self.baslik = baslik
+
+    def _komut(self, mesaj: str) -> Optional[List[str]]:
+        if sys.platform == 'darwin':
+            return ['osascript', '-e', f'display notification {json.dumps(mesaj)} with title {json.dumps(self.baslik)}']
+        if shutil.which('notify-send'):
+            return ['notify-send', self.baslik, mesaj]
+        return None
+
+    def __call__(self, olay: Olay):
+        komut = self._komut(olay_metni(olay))
+        if komut:
+            subprocess.run(komut, timeout=10, check=False,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+class SesliUyari:
+    """Önemli olaylarda sesli uyarı verir"""
+
+    SES_KOMUTLARI = [
+        ['paplay', '/usr/share/sounds/freedesktop/stereo/complete.oga'],
+        ['afplay', '/System/Library/Sounds/Glass.aiff'],
+    ]
+
+    def __init__(self, tekrar: int = 3):
+        self.tekrar = tekrar
+        self._komut = next((k for k in self.SES_KOMUTLARI if shutil.which(k[0])), None)
+
+    def __call__(self, olay: Olay):
+        for _ in range(self.tekrar):
+            if self._komut:
+                subprocess.run(self._komut, timeout=10, check=False,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            else:
+                # Terminal zili
+                sys.stdout.write('\a')
+                sys.stdout.flush()
+
+
+def bildirimleri_bagla(olaylar: OlayYolu, ayarlar: BotAyarlari) -> List[Abone]:
+    """Ayarlarda açık olan bildirimleri olay yoluna abone et"""
+    aboneler = []
+    if ayarlar.bildirim_webhook:
+        aboneler.append(olaylar.abone_ol(
+            WebhookBildirici(ayarlar.bildirim_webhook),
+            ONEMLI_OLAYLAR + (KontrolHatasi,),
+            ad="webhook",
+        ))
+    if ayarlar.masaustu_bildirimi:
+        aboneler.append(olaylar.abone_ol(MasaustuBildirici(), ONEMLI_OLAYLAR, ad="masaustu"))
+    if ayarlar.sesli_uyari:
+        aboneler.append(olaylar.abone_ol(SesliUyari(), ONEMLI_OLAYLAR, ad="ses"))
+    return aboneler
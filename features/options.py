@@ -0,0 +1,78 @@
+"""
+Tesla Opsiyon Modülü
+Opsiyon kodlarını global bir sözlükte bit konumlarına çevirerek zorunlu/yasak opsiyon kontrolü
+"""
+
+import threading
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple, Union
+
+from core.config import AracTercihi
+
+
+class SecenekSozlugu:
+    """Opsiyon kodlarını kalıcı bit konumlarına eşleyen sözlük
+
+    Her kod ilk görüldüğünde bir sonraki boş bite yerleşir; bir aracın
+    opsiyonları tek bir tamsayı (bitset) olarak tutulur. Böylece zorunlu ve
+    yasak opsiyon kontrolü araç başına iki tamsayı işlemine iner.
+    """
+
+    def __init__(self):
+        self._bitler: Dict[str, int] = {}
+        self._kodlar: List[str] = []
+        self._kilit = threading.Lock()
+
+    def bit(self, kod: str) -> int:
+        """Kodun bit değerini döndür (ilk görülüyorsa yeni bit ayır)"""
+        bit = self._bitler.get(kod)
+        if bit is None:
+            with self._kilit:
+                bit = self._bitler.get(kod)
+                if bit is None:
+                    bit = self._bitler[kod] = 1 << len(self._kodlar)
+                    self._kodlar.append(kod)
+        return bit
+
+    def maske(self, kodlar: Iterable[str]) -> int:
+        """Kod listesinin bitset karşılığı"""
+        maske = 0
+        for kod in kodlar:
+            kod = kod.strip().upper()
+            if kod:
+                maske |= self.bit(kod)
+        return maske
+
+    def kodlar(self, maske: int) -> List[str]:
+        """Bitset'teki kodları geri çöz"""
+        return [kod for i, kod in enumerate(self._kodlar) if maske >> i & 1]
+
+    def __len__(self):
+        return len(self._kodlar)
+
+
+# Tüm araçlar ve tercihler için ortak sözlük (bitler süreç boyunca sabit kalır)
+SECENEKLER = SecenekSozlugu()
+
+
+@lru_cache(maxsize=4096)
+def _metin_maskesi(opsiyonlar: str) -> int:
+    return SECENEKLER.maske(opsiyonlar.split(','))
+
+
+def secenek_maskesi(opsiyonlar: Union[str, Iterable[str], None]) -> int:
+    """API'deki OptionCodeList değerini (virgüllü metin veya liste) bitset'e çevir
+
+    Aynı opsiyon kombinasyonu birçok araçta tekrarlandığı için metin
+    biçimindeki listeler önbelleğe alınır.
+    """
+    if not opsiyonlar:
+        return 0
+    if isinstance(opsiyonlar, str):
+        return _metin_maskesi(opsiyonlar)
+    return _metin_maskesi(','.join(opsiyonlar))
+
+
+def tercih_maskeleri(tercih: AracTercihi) -> Tuple[int, int]:
+    """Tercihin (zorunlu, yasak) opsiyon maskeleri"""
+    return SECENEKLER.maske(tercih.zorunlu_secenekler), SECENEKLER.maske(tercih.yasak_secenekler)
@@ -1,33 +1,69 @@
 """
 Tesla Sipariş Bot Modülü
-Selenium kullanarak otomatik form doldurma ve sipariş verme
+Selenium veya doğrudan DevTools (CDP) bağlantısıyla otomatik form doldurma ve sipariş verme
 """
 
+import os
+import shutil
+import threading
 import time
 import random
-from typing import Optional, Dict, Any
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.keys import Keys
-from selenium.webdriver.support.select import Select
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from typing import Optional, Dict, Any, List, Union
 import undetected_chromedriver as uc
 
-from core.config import TeslaConfig, BolgeAyarlari
+from core.config import TeslaConfig
+from core.markets import pazar_getir
+from .browser import TarayiciSurucusu, surucu_olustur
+from .locators import (
+    SIPARIS_BUTONU, POSTA_KODU_ALANI, FORM_ALANLARI, KART_ODEME_BUTONU, KART_ALANLARI,
+    SON_KULLANMA_AY, SON_KULLANMA_YIL, SIPARISI_VER_BUTONU, BASARI_GOSTERGELERI, SONUC_SAYFASI,
+    form_alani, kart_alani
+)
+from .forensics import HataKaydedici, girdi_degerlerini_sil
 from .inventory import EnvanterArac
+from utils.clock import Saat, GERCEK_SAAT
+from utils.events import OlayYolu, SiparisBasladi, AdimTamamlandi, SiparisBasarili, SiparisBasarisiz
+from utils.profiling import ProfilYakalayici
 
 
 class TeslaSiparisBot:
     """Tesla sipariş işlemlerini yöneten bot sınıfı"""
     
-    def __init__(self, config: TeslaConfig):
+    def __init__(self, config: TeslaConfig, profil: Optional[ProfilYakalayici] = None,
+                 olaylar: Optional[OlayYolu] = None, saat: Optional[Saat] = None,
+                 tasarim_url: Optional[str] = None):
         self.config = config
+        self.tasarim_url = tasarim_url or pazar_getir(config.bot.pazar).tasarim_url
+        self.saat = saat or GERCEK_SAAT
+        self.profil = profil or ProfilYakalayici.configden(config.bot)
+        self.olaylar = olaylar or OlayYolu()
+        self._aktif_adim: Optional[str] = None
+        self.hata_kaydedici = HataKaydedici.configden(config.bot, self._gizli_degerler(config))
+        self._bekleyen_config: Optional[TeslaConfig] = None
+        self._config_kilidi = threading.Lock()
         self.driver = None
-        self.wait = None
+        self.surucu: Optional[TarayiciSurucusu] = None
         
+    # Uzun çalışmalarda profil dizininin büyümesini önlemek için kapanışta silinen önbellekler
+    PROFIL_ONBELLEKLERI = [
+        os.path.join('Default', 'Cache'),
+        os.path.join('Default', 'Code Cache'),
+        os.path.join('Default', 'GPUCache'),
+        os.path.join('Default', 'Service Worker', 'CacheStorage'),
+        os.path.join('Default', 'Service Worker', 'ScriptCache'),
+        'GrShaderCache',
+        'ShaderCache',
+        'Crashpad',
+    ]
+    
     def tarayici_baslat(self):
         """Chrome tarayıcısını başlat"""
+        # Önceki çalıştırmadan (ör. debug modunda) açık kalan tarayıcıyı kapat
+        if self.driver:
+            self.tarayici_kapat()
+        # Önceki tarayıcı hata kaydı için açık tutuluyorsa profil dizini serbest kalana kadar bekle
+        self.hata_kaydedici.bekle()
+        
         options = uc.ChromeOptions()
         
         # Temel ayarlar
@@ -43,11 +79,18 @@ class TeslaSiparisBot:
             options.add_argument('--disable-features=IsolateOrigins,site-per-process')
             
             # Kullanıcı profili gibi görünmek için
-            options.add_argument('--user-data-dir=/tmp/chrome_profile')
+            options.add_argument(f'--user-data-dir={self.config.bot.chrome_profil_dizini}')
             
             # Dil ayarı
             options.add_argument('--lang=tr-TR')
         
+        # Hata kayıtları için konsol (ve istenirse ağ) loglarını topla
+        if self.hata_kaydedici.aktif:
+            loglar = {'browser': 'ALL'}
+            if self.hata_kaydedici.ag_kaydi:
+                loglar['performance'] = 'ALL'
+            options.set_capability('goog:loggingPrefs', loglar)
+        
         # Headless mod
         if self.config.bot.headless_mod:
             options.add_argument('--headless=new')
@@ -57,7 +100,7 @@ class TeslaSiparisBot:
         
         # Undetected ChromeDriver kullan
         self.driver = uc.Chrome(options=options, version_main=120)
-        self.wait = WebDriverWait(self.driver, 20)
+        self.surucu = surucu_olustur(self.driver, self.config.bot.tarayici_protokolu.value)
         
         # JavaScript özelliklerini ayarla (bot tespitini zorlaştırır)
         if self.config.bot.bot_korumalari:
@@ -65,87 +108,173 @@ class TeslaSiparisBot:
             self.driver.execute_script("Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]})")
             self.driver.execute_script("Object.defineProperty(navigator, 'languages', {get: () => ['tr-TR', 'tr', 'en-US', 'en']})")
         
-        print("[BOT] Tarayıcı başlatıldı")
+        print(f"[BOT] Tarayıcı başlatıldı ({self.surucu.ad})")
     
     def tarayici_kapat(self):
         """Tarayıcıyı kapat"""
+        if self.surucu:
+            self.surucu.kapat()
+            self.surucu = None
         if self.driver:
-            self.driver.quit()
+            driver, self.driver = self.driver, None
+            # Bekleyen hata kaydı varsa tarayıcı ekran görüntüsü ve DOM okunduktan sonra kapatılır
+            if not self.hata_kaydedici.kapanisi_devral(lambda: self._driveri_kapat(driver)):
+                self._driveri_kapat(driver)
+    
+    def _driveri_kapat(self, driver):
+        try:
+            driver.quit()
             print("[BOT] Tarayıcı kapatıldı")
+        except Exception as e:
+            print(f"[HATA] Tarayıcı kapatılamadı: {str(e)}")
+        self._profil_onbellegini_temizle()
+    
+    @staticmethod
+    def _gizli_degerler(config: TeslaConfig) -> List[str]:
+        """Hata kayıtlarında maskelenecek kart değerleri"""
+        return [config.kart.kart_no, config.kart.cvv] if config.kart else []
+    
+    def _profil_onbellegini_temizle(self):
+        """Chrome profilindeki önbellek klasörlerini sil (çerezler korunur)"""
+        if not self.config.bot.bot_korumalari:
+            return
+        for klasor in self.PROFIL_ONBELLEKLERI:
+            shutil.rmtree(os.path.join(self.config.bot.chrome_profil_dizini, klasor), ignore_errors=True)
     
     def _insan_gibi_yaz(self, element, text: str):
         """İnsan gibi yazma simülasyonu"""
-        element.clear()
+        self.surucu.temizle(element)
         
         if self.config.bot.bot_korumalari:
             for char in text:
-                element.send_keys(char)
-                time.sleep(random.uniform(0.05, 0.15))
+                self.surucu.yaz(element, char)
+                self.saat.uyu(random.uniform(0.05, 0.15))
         else:
-            element.send_keys(text)
+            self.surucu.yaz(element, text)
+    
+    def _sayfayi_kaydet(self, adim: str):
+        """Sayfa kaydı açıksa sayfanın HTML'ini '<klasör>/<adim>.html' olarak yaz (seçici doğrulaması için)
+        
+        Girilen değerler yazılmaz: alanların value öznitelikleri silinir ve
+        kart numarası ile CVV maskelenir.
+        """
+        if not self.config.bot.sayfa_kaydi:
+            return
+        try:
+            html = self.hata_kaydedici.maskele(girdi_degerlerini_sil(self.surucu.sayfa_kaynagi()))
+            os.makedirs(self.config.bot.sayfa_kayit_klasoru, exist_ok=True)
+            with open(os.path.join(self.config.bot.sayfa_kayit_klasoru, f"{adim}.html"), 'w', encoding='utf-8') as f:
+                f.write(html)
+        except Exception as e:
+            print(f"[UYARI] '{adim}' sayfası kaydedilemedi: {str(e)}")
     
     def _rastgele_bekle(self, min_saniye: float = 0.5, max_saniye: float = 2.0):
         """Rastgele bekleme (bot koruması)"""
         if self.config.bot.bot_korumalari:
-            time.sleep(random.uniform(min_saniye, max_saniye))
+            self.saat.uyu(random.uniform(min_saniye, max_saniye))
         else:
-            time.sleep(0.5)
+            self.saat.uyu(0.5)
     
     def _element_bekle_ve_tikla(self, locator, timeout: int = 10):
         """Element görünür olana kadar bekle ve tıkla"""
-        try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.element_to_be_clickable(locator)
-            )
-            
-            # Scroll into view
-            self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            self._rastgele_bekle(0.3, 0.8)
-            
-            # İnsan gibi tıklama
-            if self.config.bot.bot_korumalari:
-                # Rastgele offset ile tıkla
-                action = self.driver.action_chains
-                action.move_to_element_with_offset(
-                    element, 
-                    random.randint(-5, 5), 
-                    random.randint(-5, 5)
-                )
-                action.click().perform()
-            else:
-                element.click()
-                
-            return True
-        except TimeoutException:
+        element = self.surucu.bul(locator, timeout, tiklanabilir=True)
+        if element is None:
             print(f"[HATA] Element bulunamadı: {locator}")
             return False
+        
+        # Scroll into view
+        self.surucu.kaydir(element)
+        self._rastgele_bekle(0.3, 0.8)
+        
+        # İnsan gibi tıklama
+        if self.config.bot.bot_korumalari:
+            # Rastgele offset ile tıkla
+            self.surucu.tikla(element, (random.randint(-5, 5), random.randint(-5, 5)))
+        else:
+            self.surucu.tikla(element)
+            
+        return True
+    
+    def config_guncelle(self, yeni: Union[TeslaConfig, Dict[str, Any]]) -> List[str]:
+        """Konfigürasyonu değiştir; sürmekte olan sipariş etkilenmez, bir sonrakinde uygulanır
+        
+        Sözlük verilirse mevcut konfigürasyonla birleştirilip doğrulanır
+        (geçersizse ValidationError). Tarayıcı her siparişte başlatıldığı için
+        tüm ayarlar yeniden başlatma gerektirmeden geçerli olur.
+        """
+        with self._config_kilidi:
+            temel = self._bekleyen_config or self.config
+            if isinstance(yeni, dict):
+                yeni = temel.guncelle(yeni)
+            degisenler = self.config.degisen_alanlar(yeni)
+            self._bekleyen_config = yeni if degisenler else None
+        return degisenler
+    
+    def _guncellemeyi_uygula(self):
+        """Bekleyen konfigürasyonu uygula"""
+        with self._config_kilidi:
+            yeni, self._bekleyen_config = self._bekleyen_config, None
+        if yeni is None:
+            return
+        self.hata_kaydedici.aktif = yeni.bot.hata_kaydi
+        self.hata_kaydedici.ag_kaydi = yeni.bot.ag_kaydi
+        self.hata_kaydedici.gizli_degerler(self._gizli_degerler(yeni))
+        self.hata_kaydedici.klasor = yeni.bot.hata_kayit_klasoru
+        self.hata_kaydedici.limit_bayt = int(yeni.bot.hata_kayit_limiti_mb * 1024 * 1024)
+        self.config = yeni
     
     def siparis_ver(self, arac: EnvanterArac) -> bool:
         """Seçilen araç için sipariş işlemini başlat"""
+        self._guncellemeyi_uygula()
+        with self.profil.olc(f"siparis_{arac.vin}"):
+            return self._siparis_ver(arac)
+    
+    def _adim_calistir(self, arac: EnvanterArac, adim: str, fonksiyon, *args) -> bool:
+        """Tek bir sipariş adımını çalıştır ve sonucunu olay olarak yayınla"""
+        self._aktif_adim = adim
+        baslangic = time.perf_counter()
         try:
+            tamamlandi = fonksiyon(*args)
+        finally:
+            # Adımda bulunan elemanlar sonraki adımlarda kullanılmaz
+            if self.surucu:
+                self.surucu.elemanlari_birak()
+        if not tamamlandi:
+            self.hata_kaydedici.yakala(self.driver, adim, arac.vin, "Adım tamamlanamadı")
+            return False
+        sure_ms = (time.perf_counter() - baslangic) * 1000
+        self.olaylar.yayinla(AdimTamamlandi(arac.vin, adim, round(sure_ms, 1)))
+        return True
+    
+    def _siparis_ver(self, arac: EnvanterArac) -> bool:
+        """Sipariş adımlarını sırayla çalıştır"""
+        baslangic = time.perf_counter()
+        self._aktif_adim = None
+        self.olaylar.yayinla(SiparisBasladi(arac.vin))
+        try:
+            self._aktif_adim = "tarayici"
             self.tarayici_baslat()
             
-            # 1. Araç sayfasına git
-            if not self._arac_sayfasina_git(arac):
-                return False
-            
-            # 2. Sipariş formunu doldur
-            if not self._siparis_formunu_doldur():
-                return False
-            
-            # 3. Kart bilgilerini gir
-            if not self._kart_bilgilerini_gir():
-                return False
-            
-            # 4. Siparişi onayla
-            if not self._siparisi_onayla():
-                return False
+            adimlar = [
+                ("arac_sayfasi", self._arac_sayfasina_git, arac),   # 1. Araç sayfasına git
+                ("siparis_formu", self._siparis_formunu_doldur),    # 2. Sipariş formunu doldur
+                ("kart_bilgileri", self._kart_bilgilerini_gir),     # 3. Kart bilgilerini gir
+                ("onay", self._siparisi_onayla),                    # 4. Siparişi onayla
+            ]
+            for adim, fonksiyon, *args in adimlar:
+                if not self._adim_calistir(arac, adim, fonksiyon, *args):
+                    self.olaylar.yayinla(SiparisBasarisiz(arac.vin, adim, "Adım tamamlanamadı"))
+                    return False
             
             print("\n[BAŞARI] Sipariş başarıyla verildi!")
+            sure_ms = (time.perf_counter() - baslangic) * 1000
+            self.olaylar.yayinla(SiparisBasarili(arac.vin, round(sure_ms, 1)))
             return True
             
         except Exception as e:
             print(f"\n[HATA] Sipariş işlemi başarısız: {str(e)}")
+            self.hata_kaydedici.yakala(self.driver, self._aktif_adim or "siparis", arac.vin, str(e))
+            self.olaylar.yayinla(SiparisBasarisiz(arac.vin, self._aktif_adim, str(e)))
             if self.config.bot.debug_mod:
                 import traceback
                 traceback.print_exc()
@@ -159,21 +288,14 @@ class TeslaSiparisBot:
         try:
             # Önce tasarım sayfasına git
             print(f"[BOT] Araç sayfasına gidiliyor: {arac.vin}")
-            self.driver.get(f"{BolgeAyarlari.DESIGN_URL}?vin={arac.vin}")
+            self.surucu.git(f"{self.tasarim_url}?vin={arac.vin}")
             
             self._rastgele_bekle(2, 4)
+            self._sayfayi_kaydet("arac_sayfasi")
             
             # "Order Now" butonunu bekle ve tıkla
-            order_button_selectors = [
-                (By.XPATH, "//button[contains(text(), 'Sipariş Ver')]"),
-                (By.XPATH, "//button[contains(text(), 'Order Now')]"),
-                (By.CSS_SELECTOR, "button[data-id='order-button']"),
-                (By.CSS_SELECTOR, ".order-button"),
-                (By.XPATH, "//button[contains(@class, 'order')]")
-            ]
-            
-            for selector in order_button_selectors:
-                if self._element_bekle_ve_tikla(selector, timeout=5):
+            for selector in SIPARIS_BUTONU:
+                if self._element_bekle_ve_tikla(selector, timeout=SIPARIS_BUTONU.zaman_asimi):
                     print("[BOT] Sipariş sayfasına yönlendiriliyor...")
                     self._rastgele_bekle(2, 3)
                     return True
@@ -191,22 +313,15 @@ class TeslaSiparisBot:
             print("[BOT] Sipariş formu dolduruluyor...")
             
             # Teslimat posta kodu
-            zip_selectors = [
-                (By.XPATH, "//input[@placeholder='Enter Delivery ZIP']"),
-                (By.XPATH, "//input[@placeholder='Teslimat Posta Kodu']"),
-                (By.NAME, "deliveryZip"),
-                (By.ID, "delivery-zip"),
-                (By.CSS_SELECTOR, "input[data-id='delivery-zip']")
-            ]
-            
-            for selector in zip_selectors:
-                try:
-                    zip_input = self.wait.until(EC.presence_of_element_located(selector))
+            for selector in POSTA_KODU_ALANI:
+                zip_input = self.surucu.bul(selector, POSTA_KODU_ALANI.zaman_asimi)
+                if zip_input is not None:
+                    self._sayfayi_kaydet("siparis_formu")
                     self._insan_gibi_yaz(zip_input, self.config.tercih.teslimat_posta_kodu)
                     self._rastgele_bekle()
                     break
-                except:
-                    continue
+            else:
+                self._sayfayi_kaydet("siparis_formu")
             
             # Hesap bilgileri formunu doldur
             form_fields = {
@@ -217,33 +332,17 @@ class TeslaSiparisBot:
                 'phone': self.config.kullanici.telefon
             }
             
-            for field_name, value in form_fields.items():
-                selectors = [
-                    (By.NAME, field_name),
-                    (By.ID, field_name),
-                    (By.CSS_SELECTOR, f"input[name='{field_name}']"),
-                    (By.XPATH, f"//input[@name='{field_name}']")
-                ]
-                
-                for selector in selectors:
-                    try:
-                        element = self.driver.find_element(*selector)
-                        self._insan_gibi_yaz(element, value)
+            for field_name in FORM_ALANLARI:
+                for selector in form_alani(field_name):
+                    element = self.surucu.bul(selector)
+                    if element is not None:
+                        self._insan_gibi_yaz(element, form_fields[field_name])
                         self._rastgele_bekle(0.5, 1)
                         break
-                    except:
-                        continue
             
             # "Order with Card" butonuna tıkla
-            card_button_selectors = [
-                (By.XPATH, "//button[contains(text(), 'Order with Card')]"),
-                (By.XPATH, "//button[contains(text(), 'Kart ile Sipariş')]"),
-                (By.CSS_SELECTOR, "button[data-id='card-payment']"),
-                (By.XPATH, "//button[contains(@class, 'card-payment')]")
-            ]
-            
-            for selector in card_button_selectors:
-                if self._element_bekle_ve_tikla(selector, timeout=5):
+            for selector in KART_ODEME_BUTONU:
+                if self._element_bekle_ve_tikla(selector, timeout=KART_ODEME_BUTONU.zaman_asimi):
                     print("[BOT] Kart bilgileri sayfasına geçiliyor...")
                     return True
             
@@ -259,6 +358,7 @@ class TeslaSiparisBot:
             print("[BOT] Kart bilgileri giriliyor...")
             
             self._rastgele_bekle(2, 3)
+            self._sayfayi_kaydet("kart_bilgileri")
             
             # Kart bilgileri
             kart_fields = {
@@ -269,54 +369,29 @@ class TeslaSiparisBot:
                 'deliveryZip': self.config.tercih.teslimat_posta_kodu
             }
             
-            for field_name, value in kart_fields.items():
-                selectors = [
-                    (By.NAME, field_name),
-                    (By.ID, field_name),
-                    (By.CSS_SELECTOR, f"input[name='{field_name}']"),
-                    (By.XPATH, f"//input[@placeholder*='{field_name}']")
-                ]
-                
-                for selector in selectors:
-                    try:
-                        element = self.driver.find_element(*selector)
-                        self._insan_gibi_yaz(element, value)
+            for field_name in KART_ALANLARI:
+                for selector in kart_alani(field_name):
+                    element = self.surucu.bul(selector)
+                    if element is not None:
+                        self._insan_gibi_yaz(element, kart_fields[field_name])
                         self._rastgele_bekle(0.5, 1.5)
                         break
-                    except:
-                        continue
-            
-            # Son kullanma tarihi - Ay
-            month_selectors = [
-                (By.NAME, 'expirationMonth'),
-                (By.ID, 'expiration-month'),
-                (By.CSS_SELECTOR, "select[name='expirationMonth']")
-            ]
-            
-            for selector in month_selectors:
-                try:
-                    month_select = Select(self.driver.find_element(*selector))
-                    month_select.select_by_value(str(self.config.kart.son_kullanma_ay))
-                    self._rastgele_bekle()
-                    break
-                except:
-                    continue
-            
-            # Son kullanma tarihi - Yıl
-            year_selectors = [
-                (By.NAME, 'expirationYear'),
-                (By.ID, 'expiration-year'),
-                (By.CSS_SELECTOR, "select[name='expirationYear']")
-            ]
             
-            for selector in year_selectors:
-                try:
-                    year_select = Select(self.driver.find_element(*selector))
-                    year_select.select_by_value(str(self.config.kart.son_kullanma_yil))
-                    self._rastgele_bekle()
-                    break
-                except:
-                    continue
+            # Son kullanma tarihi - Ay ve Yıl
+            for grup, deger in (
+                (SON_KULLANMA_AY, self.config.kart.son_kullanma_ay),
+                (SON_KULLANMA_YIL, self.config.kart.son_kullanma_yil),
+            ):
+                for selector in grup:
+                    select = self.surucu.bul(selector)
+                    if select is None:
+                        continue
+                    try:
+                        self.surucu.sec(select, str(deger))
+                        self._rastgele_bekle()
+                        break
+                    except Exception:
+                        continue
             
             return True
             
@@ -331,66 +406,50 @@ class TeslaSiparisBot:
             
             # Son kontroller için bekle
             self._rastgele_bekle(2, 3)
+            self._sayfayi_kaydet("onay")
             
             # Place Order butonunu bul ve tıkla
-            place_order_selectors = [
-                (By.XPATH, "//button[contains(text(), 'Place Order')]"),
-                (By.XPATH, "//button[contains(text(), 'Siparişi Ver')]"),
-                (By.CSS_SELECTOR, "button[data-id='place-order']"),
-                (By.CSS_SELECTOR, ".place-order-button"),
-                (By.XPATH, "//button[contains(@class, 'order-submit')]")
-            ]
-            
-            for selector in place_order_selectors:
-                try:
-                    button = self.wait.until(EC.element_to_be_clickable(selector))
-                    
-                    # Debug modda onay iste
-                    if self.config.bot.debug_mod:
-                        input("\n[DEBUG] Sipariş vermek üzere. Devam etmek için ENTER'a basın...")
-                    
-                    # Butona tıkla
-                    self.driver.execute_script("arguments[0].scrollIntoView(true);", button)
-                    self._rastgele_bekle(1, 2)
-                    
-                    if self.config.bot.bot_korumalari:
-                        # JavaScript ile tıkla (daha güvenilir)
-                        self.driver.execute_script("arguments[0].click();", button)
-                    else:
-                        button.click()
-                    
-                    # Sipariş onayını bekle
-                    self._rastgele_bekle(3, 5)
-                    
-                    # Başarı kontrolü
-                    success_indicators = [
-                        "order-confirmation",
-                        "order-success",
-                        "thank-you",
-                        "teşekkür",
-                        "sipariş alındı",
-                        "order received"
-                    ]
-                    
-                    page_source = self.driver.page_source.lower()
-                    for indicator in success_indicators:
-                        if indicator in page_source:
-                            print("[BAŞARI] Sipariş onayı alındı!")
-                            return True
-                    
-                    # URL kontrolü
-                    if "success" in self.driver.current_url or "confirmation" in self.driver.current_url:
-                        print("[BAŞARI] Sipariş başarıyla tamamlandı!")
-                        return True
-                    
-                    return True  # Varsayılan olarak başarılı kabul et
-                    
-                except TimeoutException:
+            for selector in SIPARISI_VER_BUTONU:
+                button = self.surucu.bul(selector, SIPARISI_VER_BUTONU.zaman_asimi, tiklanabilir=True)
+                if button is None:
                     continue
+                
+                # Debug modda onay iste
+                if self.config.bot.debug_mod:
+                    input("\n[DEBUG] Sipariş vermek üzere. Devam etmek için ENTER'a basın...")
+                
+                # Butona tıkla
+                self.surucu.kaydir(button)
+                self._rastgele_bekle(1, 2)
+                
+                if self.config.bot.bot_korumalari:
+                    # JavaScript ile tıkla (daha güvenilir)
+                    self.surucu.js_tikla(button)
+                else:
+                    self.surucu.tikla(button)
+                
+                # Sipariş onayını bekle
+                self._rastgele_bekle(3, 5)
+                self._sayfayi_kaydet(SONUC_SAYFASI)
+                
+                # Başarı kontrolü
+                page_source = self.surucu.sayfa_kaynagi().lower()
+                for indicator in BASARI_GOSTERGELERI:
+                    if indicator in page_source:
+                        print("[BAŞARI] Sipariş onayı alındı!")
+                        return True
+                
+                # URL kontrolü
+                current_url = self.surucu.url()
+                if "success" in current_url or "confirmation" in current_url:
+                    print("[BAŞARI] Sipariş başarıyla tamamlandı!")
+                    return True
+                
+                return True  # Varsayılan olarak başarılı kabul et
             
             print("[HATA] Sipariş onay butonu bulunamadı")
             return False
             
         except Exception as e:
             print(f"[HATA] Sipariş onaylama hatası: {str(e)}")
-            return False 
\ No newline at end of file
+            return False 
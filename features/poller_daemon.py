@@ -0,0 +1,484 @@
+"""
+Tesla Paylaşılan Kontrol Modülü
+Envanteri tek bir yerel süreçte sorgulayıp farkları soket üzerinden birden fazla aboneye dağıtma
+
+Kullanım:
+    python -m features.poller_daemon --port 8765 --aralik 5
+"""
+
+import argparse
+import json
+import queue
+import socket
+import socketserver
+import sys
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from core.config import TeslaConfig, AracTercihi, BotAyarlari, KartBilgisi, KullaniciHesabi, RenkTercihi
+from core.markets import VARSAYILAN_PAZAR, pazar_kodlari
+from utils.clock import Saat, GERCEK_SAAT
+from .inventory import TeslaEnvanter, EnvanterArac
+
+
+VARSAYILAN_PORT = 8765
+
+
+class YayinciConfig(TeslaConfig):
+    """Kullanıcı ve kart bilgisi olmadan doğrulanan yayıncı konfigürasyonu"""
+    kullanici: Optional[KullaniciHesabi] = None
+    kart: Optional[KartBilgisi] = None
+
+
+def yayinci_config(posta_kodu: str = "34000", **bot_ayarlari) -> YayinciConfig:
+    """Yayıncı konfigürasyonu
+
+    Buradaki tercih yalnızca başlangıç değeridir; aboneler bağlanınca
+    sorgu filtreleri ve fiyat limiti abonelerin tercih profillerinden
+    üretilir. Kullanıcı ve kart bilgisi gerekmez.
+    """
+    return YayinciConfig(
+        tercih=AracTercihi(
+            maksimum_fiyat=1e12,  # Sorgu yapılmadan önce abonelerin profilleriyle değişir
+            renk_tercihi=list(RenkTercihi),
+            teslimat_posta_kodu=posta_kodu,
+        ),
+        bot=BotAyarlari(**bot_ayarlari),
+    )
+
+
+def _satir(mesaj: Dict[str, Any]) -> bytes:
+    return json.dumps(mesaj, ensure_ascii=False, separators=(',', ':')).encode('utf-8') + b'\n'
+
+
+def _tercih_verisi(tercih: AracTercihi) -> Dict[str, Any]:
+    """Tercih profilinin JSON'a yazılabilir sözlüğü (enum değerleriyle)"""
+    return json.loads(tercih.json())
+
+
+class _AboneBaglantisi:
+    """Yayıncı tarafında tek bir abonenin soketi, gönderim kuyruğu ve yazıcı thread'i
+
+    Yavaş bir abone yalnızca kendi yazıcı thread'ini bekletir; kuyruğu
+    dolarsa bağlantısı kapatılır.
+    """
+
+    KUYRUK_BOYUTU = 64
+
+    def __init__(self, soket: socket.socket):
+        self.soket = soket
+        self.tercihler: Optional[List[AracTercihi]] = None  # Abone göndermeden sorguya katılmaz
+        self._kuyruk: queue.Queue = queue.Queue(maxsize=self.KUYRUK_BOYUTU)
+        self._thread = threading.Thread(target=self._yaz_dongusu, name="envanter-yayinci-yazici", daemon=True)
+
+    def baslat(self):
+        self._thread.start()
+
+    def gonder(self, mesaj: bytes) -> bool:
+        """Mesajı kuyruğa bırak; kuyruk doluysa False"""
+        try:
+            self._kuyruk.put_nowait(mesaj)
+            return True
+        except queue.Full:
+            return False
+
+    def _yaz_dongusu(self):
+        while True:
+            mesaj = self._kuyruk.get()
+            if mesaj is None:
+                return
+            try:
+                self.soket.sendall(mesaj)
+            except OSError:
+                self.kapat()
+                return
+
+    def kapat(self):
+        """Soketi kapat; bekleyen okuma ve yazma hatayla sonlanır"""
+        try:
+            self.soket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        try:
+            self.soket.close()
+        except OSError:
+            pass
+        try:
+            self._kuyruk.put_nowait(None)
+        except queue.Full:
+            pass  # Yazıcı kapalı sokette hata alıp çıkar
+
+
+class EnvanterYayinci:
+    """Envanteri bir kez sorgulayıp sonucu tüm abonelere gönderen yerel sunucu
+
+    Aboneler bağlanınca tercih profillerini gönderir; sorgu tüm abonelerin
+    profillerinin birleşik filtresiyle yapılır ve en yüksek fiyat limitinde
+    sayfalama durur. Tercih göndermiş abone yoksa sorgu yapılmaz.
+
+    Her kontrolde yalnızca eklenen, değişen ve silinen kayıtlar satır
+    bazlı JSON olarak bir kez kodlanır ve aynı baytlar her abonenin
+    kuyruğuna bırakılır. Yeni bağlanan abone önce tam listeyi alır.
+    Upstream istek sayısı abone sayısından bağımsızdır.
+    """
+
+    def __init__(self, envanter: TeslaEnvanter, host: str = "127.0.0.1", port: int = VARSAYILAN_PORT):
+        self.envanter = envanter
+        self.surum = 0
+        self._kayitlar: Dict[str, Dict[str, Any]] = {}
+        self._istemciler: List[_AboneBaglantisi] = []
+        self._kilit = threading.Lock()
+        self._durdur = threading.Event()
+
+        yayinci = self
+
+        class _Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                abone = yayinci._istemci_ekle(self.request)
+                # Abone bağlantıyı kapatana kadar tercih güncellemelerini oku
+                try:
+                    for satir in self.request.makefile('rb'):
+                        yayinci._mesaj_al(abone, satir)
+                except OSError:
+                    pass
+                yayinci._istemci_cikar(abone)
+
+        socketserver.ThreadingTCPServer.allow_reuse_address = True
+        self._sunucu = socketserver.ThreadingTCPServer((host, port), _Handler)
+        self._sunucu.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def adres(self) -> str:
+        host, port = self._sunucu.server_address[:2]
+        return f"{host}:{port}"
+
+    @property
+    def abone_sayisi(self) -> int:
+        return len(self._istemciler)
+
+    @property
+    def hazir_abone_sayisi(self) -> int:
+        """Tercih profillerini göndermiş abone sayısı"""
+        return sum(istemci.tercihler is not None for istemci in self._istemciler)
+
+    def baslat(self) -> 'EnvanterYayinci':
+        """Soket sunucusunu arka planda başlat"""
+        self._thread = threading.Thread(target=self._sunucu.serve_forever, name="envanter-yayinci", daemon=True)
+        self._thread.start()
+        print(f"[YAYINCI] {self.adres} adresinde aboneler bekleniyor")
+        return self
+
+    def _istemci_ekle(self, soket: socket.socket) -> _AboneBaglantisi:
+        soket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        istemci = _AboneBaglantisi(soket)
+        with self._kilit:
+            istemci.gonder(_satir({
+                'tip': 'tam', 'surum': self.surum, 'kayitlar': list(self._kayitlar.values()),
+                'saat_farki': self._saat_farki(),
+            }))
+            self._istemciler.append(istemci)
+        istemci.baslat()
+        return istemci
+
+    def _mesaj_al(self, istemci: _AboneBaglantisi, satir: bytes):
+        """Abonenin gönderdiği tercih profillerini doğrulayıp sorguya yansıt"""
+        try:
+            mesaj = json.loads(satir)
+            if mesaj.get('tip') != 'tercihler':
+                return
+            tercihler = [AracTercihi(**veri) for veri in mesaj['tercihler']]
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"[YAYINCI] Geçersiz abone tercihi yok sayıldı: {str(e)}")
+            return
+        with self._kilit:
+            istemci.tercihler = tercihler
+        self._sorguyu_guncelle()
+
+    def _sorguyu_guncelle(self):
+        """Sorgu profillerini bağlı abonelerin tercihlerinin birleşimine ayarla
+
+        Profil sırası önemsizdir; aynı profiller bir kez sorgulanır. Teslimat
+        posta kodu yayıncının ayarından gelir.
+        """
+        with self._kilit:
+            profiller: Dict[str, AracTercihi] = {}
+            for istemci in self._istemciler:
+                for tercih in istemci.tercihler or ():
+                    profiller.setdefault(tercih.json(), tercih)
+        if not profiller:
+            return
+        posta_kodu = self.envanter.config.tercih.teslimat_posta_kodu
+        veriler = [_tercih_verisi(tercih) for tercih in profiller.values()]
+        for veri in veriler:
+            veri['teslimat_posta_kodu'] = posta_kodu
+        self.envanter.config_guncelle({'tercih': veriler[0], 'yedek_tercihler': veriler[1:]})
+
+    def _saat_farki(self) -> Optional[Dict[str, Any]]:
+        """Yayıncının ölçtüğü sunucu saat farkı (aboneler aynı makinede, aynı yerel saatle çalışır)"""
+        durum = self.envanter.saat_farki_durumu()
+        return durum if durum['belirsizlik_sn'] is not None else None
+
+    def _istemci_cikar(self, istemci: _AboneBaglantisi):
+        with self._kilit:
+            if istemci in self._istemciler:
+                self._istemciler.remove(istemci)
+        istemci.kapat()
+        # Ayrılan abonenin profilleri sorgudan çıkar (fiyat limiti düşebilir)
+        if istemci.tercihler is not None:
+            self._sorguyu_guncelle()
+
+    def _yayinla(self, mesaj: bytes):
+        """Aynı baytları tüm abonelerin kuyruğuna bırak; kuyruğu dolu abone düşürülür
+
+        `_kilit` altında çağrılır; gönderim abonelerin kendi thread'lerinde yapılır.
+        """
+        for istemci in list(self._istemciler):
+            if not istemci.gonder(mesaj):
+                print("[YAYINCI] Yanıt vermeyen abone düşürüldü")
+                self._istemciler.remove(istemci)
+                istemci.kapat()
+
+    def kontrol_et(self) -> Tuple[int, int, int]:
+        """Envanteri bir kez sorgula ve farkları yayınla; (eklenen, değişen, silinen) döndür"""
+        if not self.hazir_abone_sayisi:
+            return 0, 0, 0
+
+        yeni: Dict[str, Dict[str, Any]] = {}
+        for sayfa in self.envanter.ham_sayfalar():
+            for kayit in sayfa:
+                yeni[kayit.get('VIN', '')] = kayit
+
+        # Sayfalama yarıda kaldıysa (hata, istek sınırı) eksik liste yüzünden araçlar silinmiş sayılmasın
+        if not self.envanter.son_sorgu_tam:
+            print(f"[YAYINCI] Envanter eksik alındı ({self.envanter.son_hata or 'sayfa sınırı'}), fark yayınlanmadı")
+            return 0, 0, 0
+
+        with self._kilit:
+            eklenen = [k for vin, k in yeni.items() if vin not in self._kayitlar]
+            degisen = [k for vin, k in yeni.items() if vin in self._kayitlar and self._kayitlar[vin] != k]
+            silinen = [vin for vin in self._kayitlar if vin not in yeni]
+            self._kayitlar = yeni
+            if eklenen or degisen or silinen:
+                self.surum += 1
+                self._yayinla(_satir({
+                    'tip': 'fark', 'surum': self.surum,
+                    'kayitlar': eklenen + degisen, 'silinen': silinen,
+                    'saat_farki': self._saat_farki(),
+                }))
+        return len(eklenen), len(degisen), len(silinen)
+
+    def calistir(self, dongu: Optional[int] = None):
+        """Satış saatine uyarak kontrol döngüsünü çalıştır"""
+        sayac = 0
+        while not self._durdur.is_set() and (dongu is None or sayac < dongu):
+            sayac += 1
+            if not self.hazir_abone_sayisi:
+                print("[YAYINCI] Tercih göndermiş abone yok, sorgu yapılmadı")
+            elif self.envanter.satis_saati_kontrolu():
+                eklenen, degisen, silinen = self.kontrol_et()
+                print(f"[YAYINCI] Sürüm {self.surum}: +{eklenen} ~{degisen} -{silinen} "
+                      f"({len(self._kayitlar)} araç, {self.abone_sayisi} abone)")
+            if dongu is None or sayac < dongu:
+                self.envanter.saat.uyu(self.envanter.bekleme_suresi())
+
+    def durdur(self):
+        """Döngüyü ve soket sunucusunu durdur"""
+        self._durdur.set()
+        self._sunucu.shutdown()
+        self._sunucu.server_close()
+        with self._kilit:
+            for istemci in self._istemciler:
+                istemci.kapat()
+            self._istemciler = []
+        self.envanter.kapat()
+
+
+class EnvanterAbonesi:
+    """Yayıncıya bağlanıp envanter kopyasını farklarla güncel tutan istemci
+
+    Bağlanınca tercih profillerini (fiyat limitleri ve filtreler) yayıncıya
+    gönderir. Bağlantı koparsa arka planda yeniden bağlanır; yeniden
+    bağlanınca profiller tekrar gönderilir ve tam liste tekrar alınır.
+    Araçlar yalnızca değiştiklerinde EnvanterArac'a çevrilir.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = VARSAYILAN_PORT, saat: Optional[Saat] = None,
+                 tercihler: Sequence[AracTercihi] = ()):
+        self.host = host
+        self.port = port
+        self.saat = saat or GERCEK_SAAT
+        self.tercihler: List[AracTercihi] = list(tercihler)
+        self.surum = -1
+        self.bagli = False
+        self.saat_farki: Optional[Dict[str, Any]] = None  # Yayıncının son bildirdiği sunucu saat farkı
+        self._araclar: Dict[str, EnvanterArac] = {}
+        self._durum = threading.Condition()
+        self._durdur = threading.Event()
+        self._soket: Optional[socket.socket] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def adresten(cls, adres: str, **kwargs) -> 'EnvanterAbonesi':
+        """'host:port' biçimindeki adresten oluştur"""
+        host, _, port = adres.rpartition(':')
+        return cls(host or "127.0.0.1", int(port), **kwargs)
+
+    def baslat(self) -> 'EnvanterAbonesi':
+        self._thread = threading.Thread(target=self._dongu, name="envanter-abonesi", daemon=True)
+        self._thread.start()
+        return self
+
+    def _dongu(self):
+        bekleme = 0.5
+        while not self._durdur.is_set():
+            try:
+                with socket.create_connection((self.host, self.port), timeout=5.0) as soket:
+                    soket.settimeout(None)
+                    self._soket = soket
+                    self._tercihleri_yaz(soket)
+                    bekleme = 0.5
+                    for satir in soket.makefile('rb'):
+                        self._uygula(json.loads(satir))
+            except (OSError, ValueError):
+                pass
+            with self._durum:
+                self.bagli = False
+                self._durum.notify_all()
+            if not self._durdur.wait(bekleme):
+                bekleme = min(bekleme * 2, 10.0)
+
+    def tercihleri_gonder(self, tercihler: Sequence[AracTercihi]):
+        """Tercih profillerini değiştir ve bağlıysa yayıncıya bildir"""
+        self.tercihler = list(tercihler)
+        if self._soket is not None:
+            try:
+                self._tercihleri_yaz(self._soket)
+            except OSError:
+                pass  # Yeniden bağlanınca gönderilir
+
+    def _tercihleri_yaz(self, soket: socket.socket):
+        soket.sendall(_satir({'tip': 'tercihler', 'tercihler': [_tercih_verisi(t) for t in self.tercihler]}))
+
+    def _uygula(self, mesaj: Dict[str, Any]):
+        with self._durum:
+            if mesaj['tip'] == 'tam':
+                self._araclar = {}
+            for vin in mesaj.get('silinen', ()):
+                self._araclar.pop(vin, None)
+            for kayit in mesaj['kayitlar']:
+                self._araclar[kayit.get('VIN', '')] = EnvanterArac(kayit)
+            self.surum = mesaj['surum']
+            if mesaj.get('saat_farki'):
+                self.saat_farki = mesaj['saat_farki']
+            self.bagli = True
+            self._durum.notify_all()
+
+    def araclar(self) -> List[EnvanterArac]:
+        """Güncel envanterin fiyata göre sıralı kopyası"""
+        with self._durum:
+            araclar = list(self._araclar.values())
+        araclar.sort(key=lambda arac: arac.fiyat)
+        return araclar
+
+    def bekle(self, surum: int, zaman_asimi: float) -> bool:
+        """`surum`dan yeni bir sürüm gelene kadar bekle"""
+        with self._durum:
+            return self._durum.wait_for(lambda: self.surum > surum, zaman_asimi)
+
+    def baglanti_bekle(self, zaman_asimi: float) -> bool:
+        """Yayıncıdan tam liste alınmış bir bağlantı olana kadar bekle"""
+        with self._durum:
+            return self._durum.wait_for(lambda: self.bagli, zaman_asimi)
+
+    def durdur(self):
+        self._durdur.set()
+        if self._soket is not None:
+            try:
+                self._soket.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+class PaylasilanEnvanter(TeslaEnvanter):
+    """Envanteri API yerine yerel yayıncıdan alan TeslaEnvanter
+
+    Eşleştirme, adaptif zamanlama ve olaylar aynen çalışır; yalnızca
+    `envanter_sorgula` yayıncının son gönderdiği kopyayı döndürür. Tercih
+    profilleri yayıncıya gönderilir ve değiştikçe yeniden bildirilir. Sunucu
+    saat farkı da yayıncının ölçümünden alınır. Upstream'e istek yapılmadığı
+    için HTTP oturumu, DNS thread'i ve istek yöneticisi kurulmaz.
+    """
+
+    SAAT_OLCUMU = False
+    UPSTREAM_ISTEMCISI = False
+
+    def __init__(self, config: TeslaConfig, adres: Optional[str] = None, **kwargs):
+        super().__init__(config, **kwargs)
+        self.abone = EnvanterAbonesi.adresten(
+            adres or config.bot.kontrol_sunucusu, saat=self.saat, tercihler=config.tercih_profilleri()
+        ).baslat()
+
+    def _guncellemeyi_uygula(self):
+        super()._guncellemeyi_uygula()
+        profiller = self.config.tercih_profilleri()
+        if profiller != self.abone.tercihler:
+            self.abone.tercihleri_gonder(profiller)
+
+    def envanter_sorgula(self) -> List[EnvanterArac]:
+        self._son_hata = None
+        self._tam_sonuc = False
+        if not self.abone.baglanti_bekle(5.0):
+            self._son_hata = f"Kontrol sunucusuna bağlanılamadı ({self.abone.host}:{self.abone.port})"
+            print(f"[HATA] {self._son_hata}")
+            return []
+        araclar = self.abone.araclar()
+        self._tam_sonuc = True
+        if self.config.bot.debug_mod:
+            print(f"[DEBUG] Yayıncıdan {len(araclar)} araç alındı (sürüm {self.abone.surum})")
+        return araclar
+
+    def saat_farki_durumu(self) -> Dict[str, Any]:
+        return self.abone.saat_farki or super().saat_farki_durumu()
+
+    def sunucu_simdi(self) -> datetime:
+        if self.abone.saat_farki:
+            return self.saat.simdi() + timedelta(seconds=self.abone.saat_farki['fark_sn'])
+        return super().sunucu_simdi()
+
+    def kapat(self):
+        self.abone.durdur()
+        super().kapat()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Paylaşılan envanter kontrol sunucusu")
+    parser.add_argument('--host', default="127.0.0.1", help="Dinlenecek adres")
+    parser.add_argument('--port', type=int, default=VARSAYILAN_PORT, help="Dinlenecek port")
+    parser.add_argument('--aralik', type=int, default=5, help="Kontrol aralığı (saniye)")
+    parser.add_argument('--posta-kodu', default="34000", help="Sorguda kullanılacak posta kodu")
+    parser.add_argument('--satis-saati', default="00:00", help="Kontrollerin başlayacağı saat (SS:DD)")
+    parser.add_argument('--pazar', default=VARSAYILAN_PAZAR, choices=pazar_kodlari(), help="Sorgulanacak pazar")
+    parser.add_argument('--api-url', help="Envanter API adresi (yerel test sunucusu için)")
+    args = parser.parse_args(argv)
+
+    config = yayinci_config(
+        args.posta_kodu,
+        kontrol_araligi=args.aralik,
+        satis_baslangic_saati=args.satis_saati,
+        maksimum_deneme=sys.maxsize,
+        pazar=args.pazar,
+    )
+    yayinci = EnvanterYayinci(TeslaEnvanter(config, api_url=args.api_url), args.host, args.port).baslat()
+    try:
+        yayinci.calistir()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        yayinci.durdur()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,198 @@
+"""
+Tesla Adaptif Kontrol Modülü
+Gözlenen envanter geliş örüntüsüne göre kontrol aralığını belirleme
+"""
+
+import json
+import math
+import os
+from collections import deque
+from datetime import datetime
+from typing import Dict, Iterable, Optional
+
+from core.config import BotAyarlari
+from utils.clock import Saat, GERCEK_SAAT
+
+
+class AdaptifZamanlayici:
+    """Yeni araçların ne zaman geldiğini öğrenip kontrol aralığını ayarlayan sınıf"""
+
+    DILIM_DAKIKA = 15
+    DILIM_SAYISI = 24 * 60 // DILIM_DAKIKA
+    YARI_OMUR = 7 * 24 * 3600  # Eski gözlemlerin ağırlığı bir haftada yarıya iner
+    ONCUL_GELIS = 1.0  # Satış saati dilimine verilen başlangıç ağırlığı
+    ONCUL_SURE = DILIM_DAKIKA / 60  # Az gözlenmiş dilimler bir dilimlik (saat) genel yoğunlukla dengelenir
+    KAYIT_ARALIGI = 300  # Öğrenilen örüntü en fazla bu sıklıkla (saniye) diske yazılır
+    OMUR_ORNEK_SAYISI = 200
+
+    def __init__(self, ayarlar: BotAyarlari, saat: Optional[Saat] = None):
+        self.ayarlar = ayarlar
+        self.saat = saat or GERCEK_SAAT
+        self.gelisler = [0.0] * self.DILIM_SAYISI
+        self.gozlem_suresi = [0.0] * self.DILIM_SAYISI
+        self.omurler = deque(maxlen=self.OMUR_ORNEK_SAYISI)
+        self._gorulen: Dict[str, list] = {}
+        self._son_gozlem: Optional[float] = None
+        self._son_kayit: Optional[float] = None
+        self._satis_dilimi = self._saat_dilimi(ayarlar.satis_baslangic_saati)
+        self._yukle()
+
+    def ayarlari_guncelle(self, ayarlar: BotAyarlari):
+        """Aralık sınırlarını ve satış saatini öğrenilen örüntüyü koruyarak değiştir"""
+        self.ayarlar = ayarlar
+        self._satis_dilimi = self._saat_dilimi(ayarlar.satis_baslangic_saati)
+
+    def _saat_dilimi(self, saat: str) -> int:
+        """'SS:DD' biçimindeki saatin gün içindeki dilimini bul"""
+        zaman = datetime.strptime(saat, '%H:%M')
+        return (zaman.hour * 60 + zaman.minute) // self.DILIM_DAKIKA
+
+    def _dilim(self, zaman: float) -> int:
+        """Unix zamanının gün içindeki dilimini bul"""
+        an = datetime.fromtimestamp(zaman)
+        return (an.hour * 60 + an.minute) // self.DILIM_DAKIKA
+
+    def gozlemle(self, araclar: Iterable, zaman: Optional[float] = None):
+        """Bir kontrolde görülen tüm araçları kaydet (tercih filtresinden önce)
+
+        Geliş örüntüsü pazarın tamamından öğrenilir; yalnızca uygun araçlar
+        verilirse neredeyse hiç geliş görülmez.
+        """
+        zaman = self.saat.zaman() if zaman is None else zaman
+        dilim = self._dilim(zaman)
+        ilk_gozlem = self._son_gozlem is None
+
+        if not ilk_gozlem:
+            gecen = max(0.0, zaman - self._son_gozlem)
+            self._sondur(gecen)
+            self.gozlem_suresi[dilim] += gecen
+
+        degisti = False
+        simdiki = set()
+        for arac in araclar:
+            simdiki.add(arac.vin)
+            if arac.vin in self._gorulen:
+                self._gorulen[arac.vin][1] = zaman
+            else:
+                self._gorulen[arac.vin] = [zaman, zaman]
+                # İlk kontrolde görülenler zaten stokta olan araçlardır, geliş sayılmaz
+                if not ilk_gozlem:
+                    self.gelisler[dilim] += 1
+                    degisti = True
+
+        for vin in [v for v in self._gorulen if v not in simdiki]:
+            ilk, son = self._gorulen.pop(vin)
+            # Araç son görüldüğü an ile kaybolduğu an arasında bir yerde satıldı
+            self.omurler.append((son - ilk) + (zaman - son) / 2)
+            degisti = True
+
+        self._son_gozlem = zaman
+        if degisti and (self._son_kayit is None or zaman - self._son_kayit >= self.KAYIT_ARALIGI):
+            self._son_kayit = zaman
+            self._kaydet()
+
+    def _sondur(self, gecen: float):
+        """Eski gözlemlerin ağırlığını zamanla azalt"""
+        if gecen <= 0:
+            return
+        katsayi = 0.5 ** (gecen / self.YARI_OMUR)
+        self.gelisler = [g * katsayi for g in self.gelisler]
+        self.gozlem_suresi = [s * katsayi for s in self.gozlem_suresi]
+
+    def _genel_yogunluk(self) -> float:
+        """Tüm gün boyunca saatlik ortalama geliş yoğunluğu"""
+        sure = sum(self.gozlem_suresi) / 3600
+        return sum(self.gelisler) / sure if sure > 0 else 0.0
+
+    def _dilim_yogunlugu(self, dilim: int, genel: float) -> float:
+        """Dilimdeki saatlik geliş yoğunluğu (komşu dilimlerle yumuşatılmış)"""
+        gelis = 0.0
+        sure = 0.0
+        for komsu, agirlik in ((-1, 0.25), (0, 0.5), (1, 0.25)):
+            d = (dilim + komsu) % self.DILIM_SAYISI
+            gelis += agirlik * self.gelisler[d]
+            sure += agirlik * self.gozlem_suresi[d]
+            if d == self._satis_dilimi:
+                gelis += agirlik * self.ONCUL_GELIS
+        # Az gözlenmiş dilim genel yoğunluğa yakın sayılır
+        return (gelis + genel * self.ONCUL_SURE) / (sure / 3600 + self.ONCUL_SURE)
+
+    def medyan_omur(self) -> Optional[float]:
+        """Araçların stokta kalma süresinin medyanı (saniye)"""
+        if not self.omurler:
+            return None
+        sirali = sorted(self.omurler)
+        return sirali[len(sirali) // 2]
+
+    def bekleme_suresi(self, zaman: Optional[float] = None) -> float:
+        """Şu anki dilim için önerilen kontrol aralığı (saniye)"""
+        zaman = self.saat.zaman() if zaman is None else zaman
+        en_kisa = self.ayarlar.minimum_aralik
+        en_uzun = self.ayarlar.maksimum_aralik
+
+        # Hiç geliş öğrenilmemişse yapılandırılmış aralığı kullan
+        genel = self._genel_yogunluk()
+        if genel == 0:
+            yakin_satis = abs(self._dilim(zaman) - self._satis_dilimi) <= 1
+            aralik = en_kisa if yakin_satis else self.ayarlar.kontrol_araligi
+            return min(max(aralik, en_kisa), en_uzun)
+
+        # İstek sayısı ile yeni aracı görme gecikmesi dengelendiğinde aralık
+        # yoğunluğun kareköküyle ters orantılıdır. Genel yoğunlukta aralık
+        # kontrol_araligi olur; zamana göre ortalama istek sayısı sabit aralığı aşmaz.
+        yogunluk = self._dilim_yogunlugu(self._dilim(zaman), genel)
+        if yogunluk <= 0:
+            aralik = en_uzun
+        elif yogunluk >= genel:
+            aralik = self.ayarlar.kontrol_araligi * math.sqrt(genel / yogunluk)
+        else:
+            # Ortalamanın altındaki dilimlerde yoğunlukla doğrusal geri çekilinir
+            aralik = self.ayarlar.kontrol_araligi * genel / yogunluk
+
+        # Araçlar kısa sürede tükeniyorsa kaçırmamak için daha sık kontrol et
+        omur = self.medyan_omur()
+        if omur is not None:
+            aralik = min(aralik, max(en_kisa, omur / 3))
+
+        return min(max(aralik, en_kisa), en_uzun)
+
+    def _kaydet(self):
+        """Öğrenilen örüntüyü diske yaz"""
+        dosya = self.ayarlar.adaptif_gecmis_dosyasi
+        if not dosya:
+            return
+        veri = {
+            'dilim_dakika': self.DILIM_DAKIKA,
+            'gelisler': self.gelisler,
+            'gozlem_suresi': self.gozlem_suresi,
+            'omurler': list(self.omurler),
+            'kayit_zamani': self._son_gozlem,
+        }
+        try:
+            gecici = f"{dosya}.tmp"
+            with open(gecici, 'w', encoding='utf-8') as f:
+                json.dump(veri, f)
+            os.replace(gecici, dosya)
+        except OSError as e:
+            print(f"[HATA] Adaptif geçmiş kaydedilemedi: {str(e)}")
+
+    def _yukle(self):
+        """Önceden öğrenilmiş örüntüyü diskten oku"""
+        dosya = self.ayarlar.adaptif_gecmis_dosyasi
+        if not dosya or not os.path.exists(dosya):
+            return
+        try:
+            with open(dosya, 'r', encoding='utf-8') as f:
+                veri = json.load(f)
+            if (veri.get('dilim_dakika') != self.DILIM_DAKIKA
+                    or len(veri['gelisler']) != self.DILIM_SAYISI
+                    or len(veri['gozlem_suresi']) != self.DILIM_SAYISI):
+                return
+            self.gelisler = [float(g) for g in veri['gelisler']]
+            self.gozlem_suresi = [float(s) for s in veri['gozlem_suresi']]
+            self.omurler.extend(float(o) for o in veri.get('omurler', []))
+            kayit_zamani = veri.get('kayit_zamani')
+            if kayit_zamani:
+                self._sondur(self.saat.zaman() - kayit_zamani)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"[HATA] Adaptif geçmiş okunamadı: {str(e)}")
@@ -0,0 +1,130 @@
+"""
+Tesla Envanter Sorgu Modülü
+Araç tercihlerini envanter API'sinin kendi filtre seçeneklerine çevirme ve
+pazar + tercih başına bir kez kodlanan istek dizeleri
+"""
+
+import json
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import urlencode
+
+from core.config import AracTercihi, AracTipi, RenkTercihi
+from core.markets import Pazar, VARSAYILAN_PAZAR, pazar_getir
+
+
+# Envanter API'sinin TRIM filtresinde kullandığı kodlar
+TRIM_KODLARI: Dict[AracTipi, List[str]] = {
+    AracTipi.SR: ['MYRWD'],
+    AracTipi.LR: ['LRAWD'],
+    AracTipi.PERF: ['PAWD'],
+}
+
+# Envanter API'sinin PAINT filtresinde kullandığı kodlar
+# Standart renk için API'de karşılık yok, bu renk seçiliyse boya filtresi gönderilmez
+BOYA_KODLARI: Dict[RenkTercihi, str] = {
+    RenkTercihi.KIRMIZI: 'RED',
+    RenkTercihi.BEYAZ: 'WHITE',
+    RenkTercihi.SIYAH: 'BLACK',
+    RenkTercihi.MAVI: 'BLUE',
+    RenkTercihi.GRI: 'GRAY',
+}
+
+
+def sorgu_secenekleri(tercihler: Sequence[AracTercihi]) -> Dict[str, List[str]]:
+    """Tercih profillerinden API'nin desteklediği filtre seçeneklerini üret
+
+    Birden fazla profil varsa filtreler birleştirilir; böylece tek sorgu tüm
+    profillerin adaylarını getirir. Fiyat limiti API tarafında
+    filtrelenemediği için burada yer almaz; fiyata göre artan sıralama ile
+    sayfalama erken durdurularak uygulanır.
+    """
+    secenekler: Dict[str, List[str]] = {}
+
+    trimler: List[str] = []
+    for tercih in tercihler:
+        trim_kodlari = TRIM_KODLARI.get(tercih.arac_tipi)
+        if not trim_kodlari:
+            trimler = []
+            break
+        trimler += [kod for kod in trim_kodlari if kod not in trimler]
+    if trimler:
+        secenekler['TRIM'] = trimler
+
+    renkler = [renk for tercih in tercihler for renk in tercih.renk_tercihi]
+    if renkler and all(renk in BOYA_KODLARI for renk in renkler):
+        boyalar = []
+        for renk in renkler:
+            if BOYA_KODLARI[renk] not in boyalar:
+                boyalar.append(BOYA_KODLARI[renk])
+        secenekler['PAINT'] = boyalar
+
+    return secenekler
+
+
+def envanter_sorgusu(tercihler: Sequence[AracTercihi], sunucu_filtresi: bool = True,
+                     pazar: Optional[Pazar] = None) -> Dict[str, Any]:
+    """Envanter API'sine gönderilecek sorgu sözlüğünü oluştur"""
+    pazar = pazar or pazar_getir(VARSAYILAN_PAZAR)
+    return {
+        'model': 'my',  # Model Y
+        'condition': 'new',
+        'market': pazar.market,
+        'language': pazar.dil,
+        'super_region': pazar.super_region,
+        'options': sorgu_secenekleri(tercihler) if sunucu_filtresi else {},
+        'arrangeby': 'Price',
+        'order': 'asc',
+        'zip': tercihler[0].teslimat_posta_kodu,
+        'range': 0  # Tüm mesafeler
+    }
+
+
+class DerlenmisSorgu:
+    """Pazar ve tercih profilleri için önceden kodlanmış envanter isteği
+
+    JSON sorgusu ve URL kodlaması bir kez yapılır; kontrol başına yalnızca
+    offset eklenir. Tam adresler endpoint ve offset başına saklanır.
+    """
+
+    def __init__(self, pazar: Pazar, tercihler: Sequence[AracTercihi],
+                 sunucu_filtresi: bool, sayfa_boyutu: int):
+        self.pazar = pazar
+        self.sorgu = envanter_sorgusu(tercihler, sunucu_filtresi, pazar)
+        self._onek = urlencode({'query': json.dumps(self.sorgu)}) + '&offset='
+        self._sonek = '&' + urlencode({
+            'count': str(sayfa_boyutu),
+            'outsideOffset': '0',
+            'outsideSearch': 'false',
+        })
+        self._adresler: Dict[Tuple[str, int], str] = {}
+
+    def dize(self, offset: int = 0) -> str:
+        """Kodlanmış sorgu dizesi (soru işareti olmadan)"""
+        return f"{self._onek}{offset}{self._sonek}"
+
+    def adres(self, api_url: str, offset: int = 0) -> str:
+        """Endpoint ve offset için tam istek adresi"""
+        anahtar = (api_url, offset)
+        adres = self._adresler.get(anahtar)
+        if adres is None:
+            adres = self._adresler[anahtar] = f"{api_url}?{self.dize(offset)}"
+        return adres
+
+
+# (pazar, tercih profilleri, sunucu filtresi, sayfa boyutu) -> derlenmiş sorgu
+_DERLENMIS_SORGULAR: Dict[Tuple[Any, ...], DerlenmisSorgu] = {}
+DERLENMIS_SORGU_LIMITI = 32
+
+
+def derlenmis_sorgu(pazar_kodu: str, tercihler: Sequence[AracTercihi], sunucu_filtresi: bool,
+                    sayfa_boyutu: int) -> DerlenmisSorgu:
+    """Pazar ve tercih profilleri için derlenmiş sorguyu döndür (aynı girdiler paylaşılır)"""
+    anahtar = (pazar_kodu, tuple(t.json() for t in tercihler), sunucu_filtresi, sayfa_boyutu)
+    sorgu = _DERLENMIS_SORGULAR.get(anahtar)
+    if sorgu is None:
+        if len(_DERLENMIS_SORGULAR) >= DERLENMIS_SORGU_LIMITI:
+            _DERLENMIS_SORGULAR.clear()
+        sorgu = _DERLENMIS_SORGULAR[anahtar] = DerlenmisSorgu(
+            pazar_getir(pazar_kodu), tercihler, sunucu_filtresi, sayfa_boyutu
+        )
+    return sorgu
@@ -0,0 +1,173 @@
+"""
+Tesla Sıralama Modülü
+Uygun araçları fiyat, renk, teslimat, mesafe, lokasyon ve stok durumuna göre ağırlıklı puanlama
+"""
+
+from datetime import date
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from core.config import AracTercihi, SiralamaAyarlari
+from core.markets import Pazar, VARSAYILAN_PAZAR, pazar_getir
+from utils.clock import Saat, GERCEK_SAAT
+from .geo import KonumIndeksi, ad_anahtari, pazar_indeksi
+from .matching import RENK_ESLEMESI
+
+
+# Puan dökümündeki terimler (ayar adı: '<terim>_agirligi')
+TERIMLER = ('fiyat', 'renk', 'teslimat', 'mesafe', 'lokasyon', 'durum')
+
+
+class AdayPuani:
+    """Sıralanmış bir aday ve terim bazında puan dökümü"""
+
+    __slots__ = ('arac', 'puan', 'kirilim')
+
+    def __init__(self, arac, puan: float, kirilim: Dict[str, float]):
+        self.arac = arac
+        self.puan = puan
+        self.kirilim = kirilim
+
+    def __repr__(self):
+        dokum = ' '.join(f"{terim}={deger:.2f}" for terim, deger in self.kirilim.items() if deger)
+        return f"<AdayPuani VIN={self.arac.vin} puan={self.puan:.3f} {dokum}>"
+
+
+class _LokasyonSirasi(dict):
+    """Lokasyon adı -> tercih sırası; her ad ilk görüldüğünde bir kez normalleştirilir"""
+
+    def __init__(self, lokasyonlar: Sequence[str]):
+        super().__init__()
+        self.eksik = len(lokasyonlar)
+        self._siralar = {ad_anahtari(lokasyon): sira for sira, lokasyon in enumerate(lokasyonlar)}
+
+    def __missing__(self, lokasyon: str) -> int:
+        sira = self[lokasyon] = self._siralar.get(ad_anahtari(lokasyon), self.eksik)
+        return sira
+
+
+def _olcekle(degerler: np.ndarray) -> np.ndarray:
+    """Adaylar arasında 0-1 aralığına ölçekle; bilinmeyen (NaN) değerler en kötü sayılır"""
+    gecerli = ~np.isnan(degerler)
+    if not gecerli.any():
+        return np.ones_like(degerler)
+    alt = degerler[gecerli].min()
+    aralik = degerler[gecerli].max() - alt
+    sonuc = (degerler - alt) / aralik if aralik > 0 else np.zeros_like(degerler)
+    sonuc[~gecerli] = 1.0
+    return sonuc
+
+
+class AracSiralayici:
+    """Aday araçları vektörel olarak puanlayıp en iyi k tanesini seçen sınıf
+
+    Adayların alanları bir kez numpy dizilerine alınır; sert kısıtlar maske,
+    puan ağırlıklı terimlerin toplamıdır. Tam sıralama yerine `argpartition`
+    ile yalnızca en iyi k aday seçilip kendi aralarında sıralanır.
+
+    Pazarın konum indeksi yoksa mesafe ağırlığı ve maksimum mesafe kısıtı
+    uyarıyla devre dışı bırakılır.
+    """
+
+    def __init__(self, ayarlar: SiralamaAyarlari, saat: Optional[Saat] = None,
+                 konumlar: Optional[KonumIndeksi] = None, pazar: Optional[Pazar] = None):
+        self.ayarlar = ayarlar
+        self.saat = saat or GERCEK_SAAT
+        # Konum indeksi yalnızca mesafe kullanılıyorsa açılır
+        self.mesafe_gerekli = ayarlar.mesafe_agirligi > 0 or ayarlar.maksimum_mesafe_km is not None
+        if self.mesafe_gerekli and konumlar is None:
+            pazar = pazar or pazar_getir(VARSAYILAN_PAZAR)
+            konumlar = pazar_indeksi(pazar)
+            if konumlar is None:
+                print(f"[UYARI] {pazar.ad} pazarı için konum indeksi yok; "
+                      f"mesafe ağırlığı ve maksimum mesafe kısıtı kullanılmayacak")
+                self.mesafe_gerekli = False
+        self.konumlar = konumlar
+        self._lokasyon_sirasi = _LokasyonSirasi(ayarlar.tercih_edilen_lokasyonlar)
+        # ETA metinleri az sayıda farklı değer alır, tarih ayrıştırma önbelleğe alınır
+        self._tarihler: Dict[str, Optional[date]] = {}
+
+    def _tarih(self, metin: str) -> Optional[date]:
+        tarih = self._tarihler.get(metin, False)
+        if tarih is False:
+            try:
+                tarih = date.fromisoformat(metin[:10])
+            except (TypeError, ValueError):
+                tarih = None
+            if len(self._tarihler) > 4096:
+                self._tarihler.clear()
+            self._tarihler[metin] = tarih
+        return tarih
+
+    def sirala(self, adaylar: Sequence, tercih: AracTercihi, k: Optional[int] = None) -> List[AdayPuani]:
+        """Kısıtlara uyan en iyi k adayı puan sırasıyla döndür"""
+        n = len(adaylar)
+        if not n:
+            return []
+        ayarlar = self.ayarlar
+        k = k or ayarlar.aday_sayisi
+        bugun = self.saat.simdi().date()
+
+        renk_sirasi = {renk: sira for sira, renk in enumerate(dict.fromkeys(tercih.renk_tercihi))}
+        lokasyon_sirasi = self._lokasyon_sirasi
+
+        fiyat = np.fromiter((arac.fiyat for arac in adaylar), float, n)
+        renk = np.fromiter(
+            (renk_sirasi.get(RENK_ESLEMESI.get(arac.renk.lower()), len(renk_sirasi)) for arac in adaylar), float, n
+        )
+        teslimat = np.fromiter(
+            ((tarih - bugun).days if (tarih := self._tarih(arac.teslimat_tarihi)) else np.nan for arac in adaylar),
+            float, n,
+        )
+        if self.mesafe_gerekli:
+            tablo = self.konumlar.mesafe_tablosu(tercih.teslimat_posta_kodu)
+            mesafe = np.fromiter((tablo[arac.lokasyon] for arac in adaylar), float, n)
+        else:
+            mesafe = np.zeros(n)
+        lokasyon = np.fromiter((lokasyon_sirasi[arac.lokasyon] for arac in adaylar), float, n)
+        yolda = np.fromiter((arac.durum == 'InTransit' for arac in adaylar), bool, n)
+        menzil = np.fromiter((float(arac.menzil or 0) for arac in adaylar), float, n)
+
+        # Sert kısıtlar
+        uygun = np.ones(n, dtype=bool)
+        if ayarlar.maksimum_teslimat_gun is not None:
+            uygun &= np.nan_to_num(teslimat, nan=np.inf) <= ayarlar.maksimum_teslimat_gun
+        if self.mesafe_gerekli and ayarlar.maksimum_mesafe_km is not None:
+            # Konumu bilinmeyen araç elenmez, mesafe puanında en kötü sayılır
+            uygun &= np.isnan(mesafe) | (mesafe <= ayarlar.maksimum_mesafe_km)
+        if ayarlar.minimum_menzil is not None:
+            uygun &= menzil >= ayarlar.minimum_menzil
+        if not ayarlar.yoldakiler_dahil:
+            uygun &= ~yolda
+        indeksler = np.flatnonzero(uygun)
+        if not len(indeksler):
+            return []
+
+        # Terimler kalan adaylar arasında ölçeklenir (renk ve lokasyon tercih listesinin uzunluğuna göre)
+        terimler = {
+            'fiyat': _olcekle(fiyat[indeksler]),
+            'renk': renk[indeksler] / max(len(renk_sirasi) - 1, 1),
+            'teslimat': _olcekle(teslimat[indeksler]),
+            'mesafe': _olcekle(mesafe[indeksler]),
+            'lokasyon': lokasyon[indeksler] / max(lokasyon_sirasi.eksik, 1),
+            'durum': yolda[indeksler].astype(float),
+        }
+        agirlikli = {terim: getattr(ayarlar, f"{terim}_agirligi") * deger for terim, deger in terimler.items()}
+        puan = np.sum(list(agirlikli.values()), axis=0)
+
+        # En iyi k aday; eşit puanlarda ucuz olan önce gelir
+        if len(indeksler) > k:
+            secilen = np.argpartition(puan, k - 1)[:k]
+        else:
+            secilen = np.arange(len(indeksler))
+        secilen = secilen[np.lexsort((fiyat[indeksler][secilen], puan[secilen]))]
+
+        return [
+            AdayPuani(
+                adaylar[indeksler[i]],
+                float(puan[i]),
+                {terim: float(deger[i]) for terim, deger in agirlikli.items()},
+            )
+            for i in secilen
+        ]
@@ -0,0 +1,110 @@
+"""
+Tesla Envanter Takip Modülü
+Kontrol döngüsünün gördüğü envanteri araç bazında takip edip arayüze farklar halinde sunma
+"""
+
+import threading
+from collections import deque
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+
+from core.config import AracTercihi
+from utils.events import EnvanterGuncellendi
+from .matching import red_nedeni
+
+
+class EnvanterTakibi:
+    """Her kontrolde değişen araçları sürüm numaralı farklar olarak tutan sınıf
+
+    Olay yolu abonesi olarak kendi thread'inde çalışır; kontrol döngüsüne
+    yük bindirmez. Red nedeni yalnızca yeni gelen veya fiyatı/durumu
+    değişen araçlar için hesaplanır. Arayüz `farklar` ile yalnızca son
+    gördüğü sürümden bu yana değişen satırları alır.
+    """
+
+    FARK_GECMISI = 50
+
+    def __init__(self):
+        self.surum = 0
+        self.son_guncelleme: Optional[float] = None
+        self._satirlar: Dict[str, Dict[str, Any]] = {}
+        self._imzalar: Dict[str, Tuple] = {}
+        self._tercihler: Optional[List[Dict[str, Any]]] = None
+        self._farklar = deque(maxlen=self.FARK_GECMISI)  # (sürüm, değişen vin'ler, silinen vin'ler)
+        self._kilit = threading.Lock()
+
+    def __call__(self, olay: EnvanterGuncellendi):
+        self.guncelle(olay.araclar, olay.tercihler, olay.zaman)
+
+    def guncelle(self, araclar: Sequence, tercihler: Sequence[AracTercihi], zaman: float):
+        """Bir kontrolün sonucunu işle ve yeni sürüm oluştur"""
+        # Tercihler değiştiyse tüm araçların nedenleri yeniden hesaplanır
+        tercih_ozeti = [tercih.dict() for tercih in tercihler]
+        if tercih_ozeti != self._tercihler:
+            self._tercihler = tercih_ozeti
+            self._imzalar = {}
+
+        yeni_satirlar: Dict[str, Dict[str, Any]] = {}
+        degisen: Set[str] = set()
+        for arac in araclar:
+            imza = (arac.fiyat, arac.durum, arac.renk, arac.trim)
+            eski = self._satirlar.get(arac.vin)
+            if eski is not None and self._imzalar.get(arac.vin) == imza:
+                yeni_satirlar[arac.vin] = eski
+                continue
+            neden = red_nedeni(arac, tercihler)
+            yeni_satirlar[arac.vin] = {
+                'vin': arac.vin,
+                'trim': arac.trim,
+                'renk': arac.renk,
+                'fiyat': arac.fiyat,
+                'durum': arac.durum,
+                'lokasyon': arac.lokasyon,
+                'uygun': neden is None,
+                'red_nedeni': neden or '',
+                'ilk_gorulme': eski['ilk_gorulme'] if eski else zaman,
+            }
+            self._imzalar[arac.vin] = imza
+            degisen.add(arac.vin)
+
+        silinen = set(self._satirlar) - set(yeni_satirlar)
+        for vin in silinen:
+            self._imzalar.pop(vin, None)
+
+        with self._kilit:
+            self._satirlar = yeni_satirlar
+            self.surum += 1
+            self.son_guncelleme = zaman
+            self._farklar.append((self.surum, degisen, silinen))
+
+    def farklar(self, son_surum: int) -> Tuple[int, List[Dict[str, Any]], List[str], bool]:
+        """`son_surum`dan bu yana değişen satırlar
+
+        (sürüm, eklenen/değişen satırlar, silinen vin'ler, tam_liste) döndürür;
+        geçmiş yetmiyorsa tam liste gönderilir.
+        """
+        with self._kilit:
+            if son_surum == self.surum:
+                return self.surum, [], [], False
+            if son_surum <= 0 or not self._farklar or self._farklar[0][0] > son_surum + 1:
+                return self.surum, [dict(s) for s in self._satirlar.values()], [], True
+
+            degisen: Set[str] = set()
+            silinen: Set[str] = set()
+            for surum, fark_degisen, fark_silinen in self._farklar:
+                if surum <= son_surum:
+                    continue
+                degisen |= fark_degisen
+                silinen |= fark_silinen
+            satirlar = [dict(self._satirlar[vin]) for vin in degisen if vin in self._satirlar]
+            silinen = [vin for vin in silinen if vin not in self._satirlar]
+            return self.surum, satirlar, silinen, False
+
+    def ozet(self) -> Dict[str, int]:
+        """Uygun araç ve red nedeni sayıları"""
+        with self._kilit:
+            satirlar = list(self._satirlar.values())
+        sayilar = {'toplam': len(satirlar), 'uygun': 0}
+        for satir in satirlar:
+            anahtar = 'uygun' if satir['uygun'] else satir['red_nedeni']
+            sayilar[anahtar] = sayilar.get(anahtar, 0) + 1
+        return sayilar
@@ -0,0 +1,336 @@
+"""
+Tesla HTTP Taşıma Modülü
+Envanter istemcisi için bağlantı havuzu, DNS önbelleği, ısınma ve istek zamanlaması
+"""
+
+import socket
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.util.retry import Retry
+
+from core.config import BotAyarlari
+from utils.clock import Saat, SunucuSaatFarki, GERCEK_SAAT
+
+try:
+    import httpx  # HTTP/2 için opsiyonel (pip install httpx[http2])
+except ImportError:
+    httpx = None
+
+
+class IstekZamanlamasi:
+    """Tek bir isteğin aşama aşama süreleri (saniye)"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self.dns = 0.0
+        self.baglanti = 0.0
+        self.tls = 0.0
+        self.ilk_bayt = 0.0
+        self.indirme = 0.0
+        self.toplam = 0.0
+        self.yeni_baglanti = False
+        self.durum_kodu: Optional[int] = None
+
+    def sozluk(self) -> Dict[str, Any]:
+        """Zamanlamayı milisaniye cinsinden sözlük olarak döndür"""
+        return {
+            'url': self.url,
+            'durum_kodu': self.durum_kodu,
+            'yeni_baglanti': self.yeni_baglanti,
+            'dns_ms': round(self.dns * 1000, 2),
+            'baglanti_ms': round(self.baglanti * 1000, 2),
+            'tls_ms': round(self.tls * 1000, 2),
+            'ilk_bayt_ms': round(self.ilk_bayt * 1000, 2),
+            'indirme_ms': round(self.indirme * 1000, 2),
+            'toplam_ms': round(self.toplam * 1000, 2),
+        }
+
+    def __repr__(self):
+        return (f"<IstekZamanlamasi dns={self.dns * 1000:.1f}ms baglanti={self.baglanti * 1000:.1f}ms "
+                f"tls={self.tls * 1000:.1f}ms ttfb={self.ilk_bayt * 1000:.1f}ms "
+                f"indirme={self.indirme * 1000:.1f}ms>")
+
+
+# Aktif isteğin zamanlaması, bağlantı sınıfları tarafından doldurulur
+_yerel = threading.local()
+
+
+def _aktif_olcum() -> Optional[IstekZamanlamasi]:
+    return getattr(_yerel, 'olcum', None)
+
+
+class DNSOnbellegi:
+    """Host adlarını önceden çözen ve arka planda yenileyen DNS önbelleği"""
+
+    def __init__(self, yenileme_araligi: float = 300.0):
+        self.yenileme_araligi = yenileme_araligi
+        self._kayitlar: Dict[str, List[str]] = {}
+        self._kilit = threading.Lock()
+        self._durdur = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sistemden_coz(self, host: str) -> List[str]:
+        bilgiler = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+        adresler = []
+        for aile, _, _, _, adres in bilgiler:
+            # IPv4 adreslerini öne al
+            if adres[0] not in adresler:
+                if aile == socket.AF_INET:
+                    adresler.insert(0, adres[0])
+                else:
+                    adresler.append(adres[0])
+        return adresler
+
+    def on_coz(self, host: str) -> bool:
+        """Host adını şimdi çöz ve önbelleğe al"""
+        try:
+            adresler = self._sistemden_coz(host)
+        except OSError:
+            return False
+        if adresler:
+            with self._kilit:
+                self._kayitlar[host] = adresler
+        return bool(adresler)
+
+    def coz(self, host: str) -> str:
+        """Önbellekteki adresi döndür, yoksa çözüp önbelleğe al"""
+        with self._kilit:
+            adresler = self._kayitlar.get(host)
+        if adresler:
+            return adresler[0]
+        if self.on_coz(host):
+            with self._kilit:
+                return self._kayitlar[host][0]
+        # Çözülemezse sistem çözücüsüne bırak (hata orada raporlanır)
+        return host
+
+    def baslat(self):
+        """Arka plan yenileme thread'ini başlat"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._durdur.clear()
+        self._thread = threading.Thread(target=self._yenile, name="dns-yenileme", daemon=True)
+        self._thread.start()
+
+    def durdur(self):
+        """Arka plan yenilemesini durdur"""
+        self._durdur.set()
+
+    def _yenile(self):
+        while not self._durdur.wait(self.yenileme_araligi):
+            with self._kilit:
+                hostlar = list(self._kayitlar)
+            for host in hostlar:
+                # Başarısız yenilemede eski adres korunur
+                self.on_coz(host)
+
+
+class _ZamanliBaglantiMixin:
+    """Yeni bağlantılarda DNS önbelleğini kullanan ve aşama sürelerini ölçen karışım"""
+
+    dns_onbellegi: Optional[DNSOnbellegi] = None
+
+    def _new_conn(self):
+        olcum = _aktif_olcum()
+        t0 = time.perf_counter()
+        asil_host = self._dns_host
+        if self.dns_onbellegi is not None:
+            self._dns_host = self.dns_onbellegi.coz(asil_host)
+        t1 = time.perf_counter()
+        try:
+            sock = super()._new_conn()
+        finally:
+            self._dns_host = asil_host
+        t2 = time.perf_counter()
+
+        self._son_dns = t1 - t0
+        self._son_baglanti = t2 - t1
+        if olcum is not None:
+            olcum.yeni_baglanti = True
+            olcum.dns += self._son_dns
+            olcum.baglanti += self._son_baglanti
+        return sock
+
+
+class _ZamanliHTTPBaglanti(_ZamanliBaglantiMixin, HTTPConnection):
+    pass
+
+
+class _ZamanliHTTPSBaglanti(_ZamanliBaglantiMixin, HTTPSConnection):
+
+    def connect(self):
+        t0 = time.perf_counter()
+        self._son_dns = self._son_baglanti = 0.0
+        super().connect()
+        olcum = _aktif_olcum()
+        if olcum is not None:
+            olcum.tls += max(0.0, time.perf_counter() - t0 - self._son_dns - self._son_baglanti)
+
+
+class _AyarliAdapter(HTTPAdapter):
+    """Bağlantı sınıflarını DNS önbelleği ve zamanlamayla değiştiren adapter"""
+
+    def __init__(self, dns_onbellegi: DNSOnbellegi, **kwargs):
+        self.dns_onbellegi = dns_onbellegi
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        pool_kwargs.setdefault(
+            'socket_options',
+            HTTPConnection.default_socket_options + [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)]
+        )
+        super().init_poolmanager(connections, maxsize, block=block, **pool_kwargs)
+
+        ozellik = {'dns_onbellegi': self.dns_onbellegi}
+        http_baglanti = type('HTTPBaglanti', (_ZamanliHTTPBaglanti,), ozellik)
+        https_baglanti = type('HTTPSBaglanti', (_ZamanliHTTPSBaglanti,), ozellik)
+        self.poolmanager.pool_classes_by_scheme = {
+            'http': type('HTTPHavuzu', (HTTPConnectionPool,), {'ConnectionCls': http_baglanti}),
+            'https': type('HTTPSHavuzu', (HTTPSConnectionPool,), {'ConnectionCls': https_baglanti}),
+        }
+
+
+class EnvanterTasiyici:
+    """Envanter istemcisinin HTTP katmanı
+
+    Kalıcı bağlantı havuzu, ayrı bağlantı/okuma zaman aşımları, önbellekli
+    DNS çözümleme, opsiyonel HTTP/2 ve satış öncesi bağlantı ısıtma sağlar.
+    Her isteğin DNS, bağlantı, TLS, ilk bayt ve indirme süreleri kaydedilir;
+    yanıtların `Date` başlığı sunucu saat farkı tahminine eklenir.
+    """
+
+    ZAMANLAMA_GECMISI = 200
+
+    def __init__(self, ayarlar: BotAyarlari, saat: Optional[Saat] = None):
+        self.ayarlar = ayarlar
+        self.saat = saat or GERCEK_SAAT
+        self.saat_farki = SunucuSaatFarki()
+        self.zaman_asimi: Tuple[float, float] = (ayarlar.baglanti_zaman_asimi, ayarlar.okuma_zaman_asimi)
+        self.dns_onbellegi = DNSOnbellegi()
+        self.zamanlamalar = deque(maxlen=self.ZAMANLAMA_GECMISI)
+
+        self.session = requests.Session()
+        adapter = _AyarliAdapter(
+            self.dns_onbellegi,
+            pool_connections=2,
+            pool_maxsize=ayarlar.baglanti_havuzu,
+            max_retries=Retry(
+                total=2, connect=2, read=0, status=0,
+                backoff_factor=0.1, allowed_methods=frozenset({'GET', 'HEAD'})
+            ),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self._http2 = None
+        if ayarlar.http2:
+            if httpx is None:
+                print("[UYARI] HTTP/2 için httpx[http2] kurulu değil, HTTP/1.1 kullanılacak")
+            else:
+                try:
+                    # Zaman aşımı istek başına verilir, çalışırken değişen ayar hemen geçerli olur
+                    self._http2 = httpx.Client(
+                        http2=True,
+                        limits=httpx.Limits(max_keepalive_connections=ayarlar.baglanti_havuzu),
+                    )
+                except ImportError:
+                    print("[UYARI] HTTP/2 için h2 paketi kurulu değil, HTTP/1.1 kullanılacak")
+
+        self.dns_onbellegi.baslat()
+
+    @property
+    def son_zamanlama(self) -> Optional[IstekZamanlamasi]:
+        """En son isteğin zamanlaması"""
+        return self.zamanlamalar[-1] if self.zamanlamalar else None
+
+    def get(self, url: str, params: Optional[Dict[str, str]] = None, method: str = 'GET'):
+        """İstek gönder, yanıtı tamamen oku ve aşama sürelerini kaydet"""
+        if self._http2 is not None:
+            return self._http2_get(url, params, method)
+
+        olcum = IstekZamanlamasi(url)
+        _yerel.olcum = olcum
+        gonderim = self.saat.zaman()
+        t0 = time.perf_counter()
+        try:
+            response = self.session.request(method, url, params=params, timeout=self.zaman_asimi, stream=True)
+            t_baslik = time.perf_counter()
+            response.content  # Gövdeyi indir
+            t_son = time.perf_counter()
+        finally:
+            _yerel.olcum = None
+
+        olcum.durum_kodu = response.status_code
+        olcum.toplam = t_son - t0
+        olcum.indirme = t_son - t_baslik
+        olcum.ilk_bayt = max(0.0, (t_baslik - t0) - olcum.dns - olcum.baglanti - olcum.tls)
+        self._kaydet(olcum)
+        self.saat_farki.ornek_ekle(response.headers.get('Date'), gonderim, gonderim + (t_baslik - t0))
+        return response
+
+    def _http2_get(self, url: str, params: Optional[Dict[str, str]], method: str):
+        """İsteği HTTP/2 istemcisiyle gönder"""
+        olcum = IstekZamanlamasi(url)
+        gonderim = self.saat.zaman()
+        t0 = time.perf_counter()
+        try:
+            baglanti, okuma = self.zaman_asimi
+            with self._http2.stream(method, url, params=params, headers=dict(self.session.headers),
+                                    timeout=httpx.Timeout(okuma, connect=baglanti)) as response:
+                t_baslik = time.perf_counter()
+                response.read()
+                t_son = time.perf_counter()
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+
+        olcum.durum_kodu = response.status_code
+        olcum.toplam = t_son - t0
+        olcum.indirme = t_son - t_baslik
+        olcum.ilk_bayt = t_baslik - t0
+        self._kaydet(olcum)
+        self.saat_farki.ornek_ekle(response.headers.get('Date'), gonderim, gonderim + (t_baslik - t0))
+        return response
+
+    def _kaydet(self, olcum: IstekZamanlamasi):
+        self.zamanlamalar.append(olcum)
+        if self.ayarlar.debug_mod:
+            print(f"[DEBUG] Zamanlama: {olcum}")
+
+    def isit(self, url: str,
+             gonder: Optional[Callable[[str], Optional[requests.Response]]] = None) -> bool:
+        """Satış öncesi DNS'i çöz, bağlantıyı aç ve doğrula
+
+        HEAD isteği `gonder` ile yapılır (istek yöneticisinden izin almak
+        için); None dönerse ısınma sonraki kontrole bırakılır.
+        """
+        host = urlsplit(url).hostname
+        if host and not self.dns_onbellegi.on_coz(host):
+            print(f"[HATA] Isınma: {host} çözülemedi")
+            return False
+        try:
+            response = gonder(url) if gonder else self.get(url, method='HEAD')
+        except requests.exceptions.RequestException as e:
+            print(f"[HATA] Isınma isteği başarısız: {str(e)}")
+            return False
+        if response is None:
+            return False
+        olcum = self.son_zamanlama
+        print(f"[BILGI] Bağlantı ısıtıldı ({response.status_code}, {olcum.toplam * 1000:.0f} ms)")
+        return response.status_code < 500
+
+    def kapat(self):
+        """Bağlantıları ve arka plan thread'ini kapat"""
+        self.dns_onbellegi.durdur()
+        self.session.close()
+        if self._http2 is not None:
+            self._http2.close()
@@ -0,0 +1,173 @@
+"""
+Saat Modülü
+Kontrol döngüsü ve sipariş botunun kullandığı değiştirilebilir zaman kaynağı ve bekleyici
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional, Union
+
+
+class Saat(ABC):
+    """Zaman kaynağı ve bekleyici arayüzü"""
+
+    @abstractmethod
+    def zaman(self) -> float:
+        """Unix zamanı (saniye)"""
+
+    def simdi(self) -> datetime:
+        """Yerel saat"""
+        return datetime.fromtimestamp(self.zaman())
+
+    @abstractmethod
+    def uyu(self, saniye: float, kesici: Optional[threading.Event] = None):
+        """Belirtilen süre kadar bekle (`kesici` tetiklenirse erken uyan)"""
+
+
+class GercekSaat(Saat):
+    """Sistem saatini ve gerçek beklemeyi kullanan saat"""
+
+    def zaman(self) -> float:
+        return time.time()
+
+    def simdi(self) -> datetime:
+        return datetime.now()
+
+    def uyu(self, saniye: float, kesici: Optional[threading.Event] = None):
+        if saniye <= 0:
+            return
+        if kesici is not None:
+            kesici.wait(saniye)
+        else:
+            time.sleep(saniye)
+
+
+class SanalSaat(Saat):
+    """Beklemeleri anında zamanı ileri alarak yapan sanal saat
+
+    Simülasyonlarda saatlerce süren kontrol döngüleri milisaniyeler içinde
+    ve her çalıştırmada aynı şekilde yürütülür.
+    """
+
+    def __init__(self, baslangic: Union[datetime, float, None] = None):
+        if baslangic is None:
+            baslangic = datetime(2025, 1, 1, 0, 0)
+        if isinstance(baslangic, datetime):
+            baslangic = baslangic.timestamp()
+        self._zaman = float(baslangic)
+        self.uyku_sayisi = 0
+        self.toplam_uyku = 0.0
+
+    def zaman(self) -> float:
+        return self._zaman
+
+    def uyu(self, saniye: float, kesici: Optional[threading.Event] = None):
+        # Gerçek saatte olduğu gibi, bekleme başlamadan tetiklenmiş kesici uyumayı atlatır
+        if kesici is not None and kesici.is_set():
+            saniye = 0
+        if saniye > 0:
+            self._zaman += saniye
+            self.toplam_uyku += saniye
+        self.uyku_sayisi += 1
+
+    def ilerlet(self, saniye: float = 0.0, hedef: Optional[datetime] = None):
+        """Zamanı bekleme sayılmadan ileri al"""
+        if hedef is not None:
+            saniye = hedef.timestamp() - self._zaman
+        self._zaman += max(0.0, saniye)
+
+    def __repr__(self):
+        return f"<SanalSaat {self.simdi().isoformat(timespec='seconds')}>"
+
+
+class SunucuSaatFarki:
+    """Yanıtların `Date` başlığı ve gidiş-dönüş süresinden sunucu saat farkı tahmini
+
+    `Date` saniyeye yuvarlanmış (aşağı) sunucu saatidir ve istek gönderimi
+    ile yanıt başlıklarının alınması arasında bir anda üretilmiştir. Her
+    örnek farkı (sunucu - yerel) [D - alım, D + 1 - gönderim] aralığına
+    sınırlar; örneklerin kesişimi farklı saniye fazlarında alınan isteklerle
+    tek bir isteğin çözünürlüğünden çok daha dar olur. Eski sınırlar saat
+    kayması payı kadar genişletilir; kesişim boşalırsa (yerel saat
+    sıçraması) yeni örnekten baştan başlanır. Tahmin, aralık orta
+    noktalarının üstel ortalamasıdır ve her zaman sınırlar içinde kalır.
+    """
+
+    KAYMA_ORANI = 100e-6  # Saat kayması payı (saniye/saniye)
+    YUMUSATMA = 0.3
+
+    def __init__(self):
+        self._kilit = threading.Lock()
+        self.alt: Optional[float] = None
+        self.ust: Optional[float] = None
+        self._fark = 0.0
+        self.son_ornek: Optional[float] = None  # Son örneğin yerel zamanı
+        self.ornek_sayisi = 0
+        self.min_rtt: Optional[float] = None
+
+    def ornek_ekle(self, tarih_basligi: Optional[str], gonderim: float, alim: float) -> bool:
+        """`Date` başlığını, isteğin gönderildiği ve başlıkların alındığı yerel zamanla ekle"""
+        if not tarih_basligi or alim < gonderim:
+            return False
+        try:
+            sunucu = parsedate_to_datetime(tarih_basligi).timestamp()
+        except (TypeError, ValueError, IndexError):
+            return False
+
+        alt, ust = sunucu - alim, sunucu + 1.0 - gonderim
+        with self._kilit:
+            if self.alt is not None:
+                pay = self.KAYMA_ORANI * max(0.0, alim - self.son_ornek)
+                kesisim_alt, kesisim_ust = max(self.alt - pay, alt), min(self.ust + pay, ust)
+                if kesisim_alt <= kesisim_ust:
+                    alt, ust = kesisim_alt, kesisim_ust
+                else:
+                    print(f"[UYARI] Sunucu saat farkı sıçradı ({self._fark:+.2f} sn dışında), tahmin sıfırlandı")
+                    self.ornek_sayisi = 0
+            orta = (alt + ust) / 2
+            if self.ornek_sayisi:
+                orta = self._fark + self.YUMUSATMA * (orta - self._fark)
+            self._fark = min(max(orta, alt), ust)
+            self.alt, self.ust = alt, ust
+            self.son_ornek = alim
+            self.ornek_sayisi += 1
+            rtt = alim - gonderim
+            self.min_rtt = rtt if self.min_rtt is None else min(self.min_rtt, rtt)
+        return True
+
+    @property
+    def fark(self) -> float:
+        """Sunucu saati - yerel saat (saniye); örnek yoksa 0"""
+        return self._fark
+
+    @property
+    def belirsizlik(self) -> Optional[float]:
+        """Tahminin en kötü durum hatası (saniye); örnek yoksa None"""
+        with self._kilit:
+            if self.alt is None:
+                return None
+            return max(self._fark - self.alt, self.ust - self._fark)
+
+    def olcum_gerekli(self, simdi: float, hedef_belirsizlik: float = 0.25, en_eski: float = 300.0) -> bool:
+        """Tahmin yoksa, yeterince dar değilse veya son örnek eskiyse True"""
+        belirsizlik = self.belirsizlik
+        return (belirsizlik is None or belirsizlik > hedef_belirsizlik
+                or simdi - self.son_ornek > en_eski)
+
+    def durum(self) -> Dict[str, Any]:
+        """Arayüz için özet"""
+        belirsizlik = self.belirsizlik
+        return {
+            'fark_sn': round(self._fark, 3),
+            'belirsizlik_sn': None if belirsizlik is None else round(belirsizlik, 3),
+            'ornek': self.ornek_sayisi,
+            'min_rtt_ms': None if self.min_rtt is None else round(self.min_rtt * 1000, 1),
+        }
+
+
+# Varsayılan saat (tüm modüller saat verilmezse bunu kullanır)
+GERCEK_SAAT = GercekSaat()
+
@@ -0,0 +1,215 @@
+"""
+Olay Yolu Modülü
+Eşleşme, sipariş ve kontrol olaylarını abonelere kendi thread'lerinde ileten süreç içi olay yolu
+"""
+
+import queue
+import threading
+import time
+import traceback
+from typing import Any, Callable, Dict, List, Optional, Sequence, Type
+
+
+class Olay:
+    """Tüm olayların temel sınıfı"""
+
+    tip = "olay"
+
+    def __init__(self):
+        self.zaman = time.time()
+
+    def sozluk(self) -> Dict[str, Any]:
+        """Olayı JSON'a çevrilebilir sözlük olarak döndür"""
+        veri = {'tip': self.tip, 'zaman': self.zaman}
+        veri.update({k: v for k, v in self.__dict__.items() if k != 'zaman'})
+        return veri
+
+    def __repr__(self):
+        alanlar = ' '.join(f"{k}={v!r}" for k, v in self.__dict__.items() if k != 'zaman')
+        return f"<{type(self).__name__} {alanlar}>"
+
+
+class AracBulundu(Olay):
+    """Tercih profillerinden birine uyan araç bulundu"""
+
+    tip = "arac_bulundu"
+
+    def __init__(self, vin: str, trim: str, renk: str, fiyat: float, profil_sirasi: int = 0,
+                 para_birimi: str = "TRY"):
+        super().__init__()
+        self.vin = vin
+        self.trim = trim
+        self.renk = renk
+        self.fiyat = fiyat
+        self.profil_sirasi = profil_sirasi
+        self.para_birimi = para_birimi
+
+
+class SiparisBasladi(Olay):
+    """Bulunan araç için sipariş işlemi başladı"""
+
+    tip = "siparis_basladi"
+
+    def __init__(self, vin: str):
+        super().__init__()
+        self.vin = vin
+
+
+class AdimTamamlandi(Olay):
+    """Sipariş adımlarından biri başarıyla tamamlandı"""
+
+    tip = "adim_tamamlandi"
+
+    def __init__(self, vin: str, adim: str, sure_ms: float):
+        super().__init__()
+        self.vin = vin
+        self.adim = adim
+        self.sure_ms = sure_ms
+
+
+class SiparisBasarili(Olay):
+    """Sipariş onaylandı"""
+
+    tip = "siparis_basarili"
+
+    def __init__(self, vin: str, sure_ms: float):
+        super().__init__()
+        self.vin = vin
+        self.sure_ms = sure_ms
+
+
+class SiparisBasarisiz(Olay):
+    """Sipariş bir adımda başarısız oldu"""
+
+    tip = "siparis_basarisiz"
+
+    def __init__(self, vin: str, adim: Optional[str], hata: str):
+        super().__init__()
+        self.vin = vin
+        self.adim = adim
+        self.hata = hata
+
+
+class KontrolHatasi(Olay):
+    """Envanter kontrolü sırasında hata oluştu"""
+
+    tip = "kontrol_hatasi"
+
+    def __init__(self, deneme: int, hata: str):
+        super().__init__()
+        self.deneme = deneme
+        self.hata = hata
+
+
+class EnvanterGuncellendi(Olay):
+    """Bir kontrolde envanterin tamamı getirildi (canlı envanter tablosu için)"""
+
+    tip = "envanter_guncellendi"
+
+    def __init__(self, araclar: Sequence, tercihler: Sequence):
+        super().__init__()
+        self.araclar = araclar
+        self.tercihler = tercihler
+
+    def sozluk(self) -> Dict[str, Any]:
+        return {'tip': self.tip, 'zaman': self.zaman, 'arac_sayisi': len(self.araclar)}
+
+    def __repr__(self):
+        return f"<EnvanterGuncellendi arac_sayisi={len(self.araclar)}>"
+
+
+class Abone:
+    """Kendi sınırlı kuyruğu ve işçi thread'i olan abone
+
+    Kuyruk dolduğunda en eski olay atılır; yayıncı hiçbir zaman beklemez.
+    """
+
+    def __init__(self, ad: str, dinleyici: Callable[[Olay], None],
+                 olay_tipleri: Optional[Sequence[Type[Olay]]] = None, kuyruk_boyutu: int = 100):
+        self.ad = ad
+        self.dinleyici = dinleyici
+        self.olay_tipleri = tuple(olay_tipleri) if olay_tipleri else None
+        self.atilan = 0
+        self.hata_sayisi = 0
+        self._kuyruk: queue.Queue = queue.Queue(maxsize=kuyruk_boyutu)
+        self._thread = threading.Thread(target=self._calis, name=f"olay-{ad}", daemon=True)
+        self._thread.start()
+
+    def ilgileniyor_mu(self, olay: Olay) -> bool:
+        return self.olay_tipleri is None or isinstance(olay, self.olay_tipleri)
+
+    def birak(self, olay: Optional[Olay]):
+        """Olayı kuyruğa bırak, doluysa en eskisini at"""
+        while True:
+            try:
+                self._kuyruk.put_nowait(olay)
+                return
+            except queue.Full:
+                try:
+                    self._kuyruk.get_nowait()
+                    self.atilan += 1
+                except queue.Empty:
+                    pass
+
+    def _calis(self):
+        while True:
+            olay = self._kuyruk.get()
+            if olay is None:
+                return
+            try:
+                self.dinleyici(olay)
+            except Exception as e:
+                self.hata_sayisi += 1
+                print(f"[OLAY] '{self.ad}' abonesi hata verdi: {str(e)}")
+                traceback.print_exc()
+
+    def durdur(self, zaman_asimi: float = 2.0):
+        """Kuyruktaki olaylar işlendikten sonra thread'i durdur"""
+        self.birak(None)
+        self._thread.join(zaman_asimi)
+
+
+class OlayYolu:
+    """Yayınla/abone ol tabanlı, bloklamayan olay yolu
+
+    `yayinla` yalnızca abonelerin kuyruklarına olay bırakır; yavaş bir
+    bildirim (webhook, ses vb.) sipariş akışını asla geciktiremez.
+    """
+
+    def __init__(self, kuyruk_boyutu: int = 100):
+        self.kuyruk_boyutu = kuyruk_boyutu
+        self._aboneler: List[Abone] = []
+        self._kilit = threading.Lock()
+
+    def abone_ol(self, dinleyici: Callable[[Olay], None],
+                 olay_tipleri: Optional[Sequence[Type[Olay]]] = None,
+                 ad: Optional[str] = None, kuyruk_boyutu: Optional[int] = None) -> Abone:
+        """Dinleyiciyi kendi işçi thread'inde çalışacak şekilde kaydet"""
+        abone = Abone(
+            ad or getattr(dinleyici, '__name__', type(dinleyici).__name__),
+            dinleyici,
+            olay_tipleri,
+            kuyruk_boyutu or self.kuyruk_boyutu,
+        )
+        with self._kilit:
+            self._aboneler = self._aboneler + [abone]
+        return abone
+
+    def abonelikten_cik(self, abone: Abone):
+        """Aboneyi kaldır ve thread'ini durdur"""
+        with self._kilit:
+            self._aboneler = [a for a in self._aboneler if a is not abone]
+        abone.durdur()
+
+    def yayinla(self, olay: Olay):
+        """Olayı ilgili tüm abonelere ilet (bloklamaz)"""
+        for abone in self._aboneler:
+            if abone.ilgileniyor_mu(olay):
+                abone.birak(olay)
+
+    def kapat(self, zaman_asimi: float = 2.0):
+        """Tüm aboneleri durdur"""
+        with self._kilit:
+            aboneler, self._aboneler = self._aboneler, []
+        for abone in aboneler:
+            abone.durdur(zaman_asimi)
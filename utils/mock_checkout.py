@@ -0,0 +1,167 @@
+"""
+Yerel Sipariş Sayfaları
+Tasarım, sipariş formu, kart bilgileri ve onay adımlarını taklit eden yerel HTTP sunucusu
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+from urllib.parse import parse_qs, urlsplit
+
+
+_SAYFA = """<!DOCTYPE html>
+<html lang="tr"><head><meta charset="utf-8"><title>{baslik}</title></head>
+<body>{govde}</body></html>"""
+
+_TASARIM = """
+<h1>Model Y</h1>
+<p id="vin">{vin}</p>
+<button data-id="order-button" class="order-button"
+        onclick="location.href='/siparis?vin={vin}'">Sipariş Ver</button>
+"""
+
+_FORM = """
+<form onsubmit="return false">
+  <input name="deliveryZip" id="delivery-zip" placeholder="Enter Delivery ZIP">
+  <input name="firstName" id="firstName">
+  <input name="lastName" id="lastName">
+  <input name="email" id="email">
+  <input name="confirmEmail" id="confirmEmail">
+  <input name="phone" id="phone">
+  <button type="button" data-id="card-payment" class="card-payment"
+          onclick="location.href='/kart?vin={vin}'">Order with Card</button>
+</form>
+"""
+
+_KART = """
+<form onsubmit="return false">
+  <input name="cardName" id="cardName">
+  <input name="cardNumber" id="cardNumber">
+  <input name="cvv" id="cvv">
+  <input name="billingZip" id="billingZip">
+  <input name="deliveryZip" id="deliveryZip">
+  <select name="expirationMonth" id="expiration-month">{aylar}</select>
+  <select name="expirationYear" id="expiration-year">{yillar}</select>
+  <button type="button" data-id="place-order" class="place-order-button" onclick="gonder()">Place Order</button>
+</form>
+<script>
+function gonder() {{
+  const veri = {{vin: '{vin}'}};
+  for (const el of document.querySelectorAll('input, select')) veri[el.name] = el.value;
+  location.href = '/onay?veri=' + encodeURIComponent(JSON.stringify(veri));
+}}
+</script>
+"""
+
+_ONAY = """
+<div class="order-confirmation"><h1>Teşekkürler</h1><p>Sipariş alındı: {vin}</p></div>
+"""
+
+
+def _secenekler(degerler) -> str:
+    return '<option value="">--</option>' + ''.join(f'<option value="{d}">{d}</option>' for d in degerler)
+
+
+class YerelSiparisSunucusu:
+    """Botun seçicileriyle eşleşen dört adımlı sipariş akışını sunan yerel sunucu
+
+    Sayfalar her adımın ilk seçicisiyle eşleşir; ölçümler yedek seçicilerin
+    zaman aşımlarını içermez.
+
+    Onay sayfasına ulaşan her form `siparisler` listesine kaydedilir; böylece
+    sürücü arka uçları gerçek ağ olmadan uçtan uca karşılaştırılabilir.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        self._kilit = threading.Lock()
+        self.siparisler: List[Dict[str, Any]] = []
+        self.istek_sayisi = 0
+
+        sunucu = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                sunucu._yanitla(self)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def kok(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def tasarim_url(self) -> str:
+        """Botun `?vin=` ekleyerek açacağı tasarım sayfası adresi"""
+        return f"{self.kok}/tasarim"
+
+    def baslat(self) -> 'YerelSiparisSunucusu':
+        """Sunucuyu arka plan thread'inde başlat"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="yerel-siparis", daemon=True)
+        self._thread.start()
+        return self
+
+    def durdur(self):
+        """Sunucuyu durdur ve soketi kapat"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    @staticmethod
+    def _html(yol: str, vin: str) -> Optional[str]:
+        if yol == '/tasarim':
+            return _SAYFA.format(baslik="Tasarım", govde=_TASARIM.format(vin=vin))
+        if yol == '/siparis':
+            return _SAYFA.format(baslik="Sipariş", govde=_FORM.format(vin=vin))
+        if yol == '/kart':
+            govde = _KART.format(vin=vin, aylar=_secenekler(range(1, 13)), yillar=_secenekler(range(2024, 2100)))
+            return _SAYFA.format(baslik="Ödeme", govde=govde)
+        if yol == '/onay':
+            return _SAYFA.format(baslik="Onay", govde=_ONAY.format(vin=vin))
+        return None
+
+    @classmethod
+    def sayfalar(cls, vin: str = "YEREL") -> Dict[str, str]:
+        """Sipariş adımı -> sayfa HTML'i (sayfa kaydı ile aynı adlandırma)"""
+        kart = cls._html('/kart', vin)
+        return {
+            'arac_sayfasi': cls._html('/tasarim', vin),
+            'siparis_formu': cls._html('/siparis', vin),
+            'kart_bilgileri': kart,
+            'onay': kart,  # Onay butonu kart sayfasındadır
+            'sonuc': cls._html('/onay', vin),
+        }
+
+    def _sayfa(self, yol: str, params: Dict[str, List[str]]) -> Optional[str]:
+        vin = params.get('vin', [''])[0]
+        if yol == '/onay':
+            try:
+                veri = json.loads(params.get('veri', ['{}'])[0])
+            except ValueError:
+                return None
+            with self._kilit:
+                self.siparisler.append(veri)
+            vin = veri.get('vin', '')
+        return self._html(yol, vin)
+
+    def _yanitla(self, handler: BaseHTTPRequestHandler):
+        self.istek_sayisi += 1
+        adres = urlsplit(handler.path)
+        html = self._sayfa(adres.path, parse_qs(adres.query))
+        if html is None:
+            handler.send_error(404)
+            return
+        govde = html.encode('utf-8')
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'text/html; charset=utf-8')
+        handler.send_header('Content-Length', str(len(govde)))
+        handler.end_headers()
+        handler.wfile.write(govde)
@@ -0,0 +1,144 @@
+"""
+Yerel Envanter Sunucusu
+Tesla envanter API'sinin yerine geçen, sentetik veri sunan yerel HTTP sunucusu
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from utils.clock import Saat, GERCEK_SAAT
+from utils.synthetic import SentetikEnvanter
+
+
+# Sentetik PAINT kodlarının API filtresindeki karşılıkları
+BOYA_FILTRESI = {
+    'red': 'RED', 'white': 'WHITE', 'pearl': 'WHITE',
+    'black': 'BLACK', 'solid': 'BLACK', 'blue': 'BLUE', 'grey': 'GRAY',
+}
+
+
+class YerelEnvanterSunucusu:
+    """Sayfalı envanter sorgularını yanıtlayan yerel sunucu
+
+    `ilerlet` her çağrıldığında envanterin bir kısmı satılır ve yerine yeni
+    araçlar eklenir; böylece uzun simülasyonlarda gerçekçi bir akış oluşur.
+    `Date` başlığı verilen saatten `saat_farki` kadar ileri/geri üretilir.
+    """
+
+    API_YOLU = "/tr_TR/api/tesla/inventory/tesla"
+
+    def __init__(self, adet: int = 500, tohum: int = 7, host: str = "127.0.0.1", port: int = 0,
+                 saat: Optional[Saat] = None, saat_farki: float = 0.0):
+        self.saat = saat or GERCEK_SAAT
+        self.saat_farki = saat_farki
+        self.uretec = SentetikEnvanter(tohum=tohum)
+        self._kilit = threading.Lock()
+        self._araclar: List[Dict[str, Any]] = self.uretec.araclar(adet)
+        self.istek_sayisi = 0
+        self._zorunlu_yanitlar: List[Tuple[int, Optional[str]]] = []
+
+        sunucu = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                sunucu._yanitla(self)
+
+            def do_HEAD(self):
+                self.send_response(200)
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+
+            def date_time_string(self, timestamp=None):
+                return super().date_time_string(sunucu.saat.zaman() + sunucu.saat_farki)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Envanter API adresi"""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{self.API_YOLU}"
+
+    def baslat(self) -> 'YerelEnvanterSunucusu':
+        """Sunucuyu arka plan thread'inde başlat"""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="yerel-envanter", daemon=True)
+        self._thread.start()
+        return self
+
+    def durdur(self):
+        """Sunucuyu durdur ve soketi kapat"""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def ilerlet(self, satilan_orani: float = 0.02, yeni_orani: float = 0.02):
+        """Envanterin bir kısmını sat ve yeni araçlar ekle"""
+        with self._kilit:
+            rng = self.uretec.rng
+            adet = len(self._araclar)
+            kalan = [a for a in self._araclar if rng.random() >= satilan_orani]
+            kalan.extend(self.uretec.arac() for _ in range(int(adet * yeni_orani)))
+            kalan.sort(key=lambda kayit: kayit['Price'])
+            self._araclar = kalan
+
+    def zorla(self, durum_kodu: int, adet: int = 1, retry_after: Optional[str] = None):
+        """Sonraki `adet` isteğe verilen durum koduyla yanıt ver (429/503 simülasyonu)"""
+        with self._kilit:
+            self._zorunlu_yanitlar.extend([(durum_kodu, retry_after)] * adet)
+
+    def _filtrele(self, secenekler: Dict[str, List[str]]) -> List[Dict[str, Any]]:
+        trimler = secenekler.get('TRIM')
+        boyalar = secenekler.get('PAINT')
+        with self._kilit:
+            araclar = self._araclar
+        if not trimler and not boyalar:
+            return araclar
+        return [
+            a for a in araclar
+            if (not trimler or a['TrimCode'] in trimler)
+            and (not boyalar or BOYA_FILTRESI.get(a['PAINT']['Code']) in boyalar)
+        ]
+
+    def _yanitla(self, handler: BaseHTTPRequestHandler):
+        self.istek_sayisi += 1
+        with self._kilit:
+            zorunlu = self._zorunlu_yanitlar.pop(0) if self._zorunlu_yanitlar else None
+        if zorunlu:
+            durum_kodu, retry_after = zorunlu
+            handler.send_response(durum_kodu)
+            if retry_after is not None:
+                handler.send_header('Retry-After', retry_after)
+            handler.send_header('Content-Length', '0')
+            handler.end_headers()
+            return
+
+        params = parse_qs(urlsplit(handler.path).query)
+        try:
+            sorgu = json.loads(params.get('query', ['{}'])[0])
+            offset = int(params.get('offset', ['0'])[0])
+            count = int(params.get('count', ['50'])[0])
+        except ValueError:
+            handler.send_error(400)
+            return
+
+        araclar = self._filtrele(sorgu.get('options') or {})
+        govde = json.dumps({
+            'total_matches_found': str(len(araclar)),
+            'results': araclar[offset:offset + count],
+        }, ensure_ascii=False).encode('utf-8')
+
+        handler.send_response(200)
+        handler.send_header('Content-Type', 'application/json')
+        handler.send_header('Content-Length', str(len(govde)))
+        handler.end_headers()
+        handler.wfile.write(govde)
@@ -0,0 +1,141 @@
+"""
+Profil Kayıt Modülü
+Kontrol döngüleri ve sipariş çalıştırmaları için çalışma anında açılıp kapatılabilen profil kaydı
+"""
+
+import cProfile
+import heapq
+import os
+import queue
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+
+class ProfilYakalayici:
+    """Tek tek döngüleri cProfile ile ölçüp en yavaş N tanesini saklayan sınıf
+
+    Kapalıyken `olc` yalnızca bir bayrak kontrolü yapar, bu yüzden gerçek
+    satış sırasında da hazırda bekletilebilir. Profiller pstats biçiminde
+    (.prof) kaydedilir; snakeviz veya `python -m pstats` ile açılabilir.
+    Dosya yazma ve eski profillerin silinmesi arka plandaki yazıcı
+    thread'inde yapılır; ölçülen döngü yalnızca sıralama kararını verir.
+    """
+
+    KUYRUK_BOYUTU = 8
+
+    def __init__(self, klasor: str = "profiller", saklanacak: int = 10, aktif: bool = False):
+        self.klasor = klasor
+        self.saklanacak = saklanacak
+        self.aktif = aktif
+        self._yerel = threading.local()
+        self._kilit = threading.Lock()
+        self._en_yavaslar: List[Tuple[float, str, str]] = []  # (süre, etiket, dosya) min-heap
+        self._kuyruk: queue.Queue = queue.Queue(maxsize=self.KUYRUK_BOYUTU)
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def configden(cls, ayarlar) -> 'ProfilYakalayici':
+        """Bot ayarlarından oluştur (debug modunda varsayılan olarak açık)"""
+        return cls(
+            klasor=ayarlar.profil_klasoru,
+            saklanacak=ayarlar.profil_sayisi,
+            aktif=ayarlar.profil_modu or ayarlar.debug_mod,
+        )
+
+    def ac(self):
+        """Profil kaydını aç"""
+        self.aktif = True
+
+    def kapat(self):
+        """Profil kaydını kapat"""
+        self.aktif = False
+
+    @contextmanager
+    def olc(self, etiket: str):
+        """Bloğun profilini çıkar, en yavaşlardan biriyse kaydet"""
+        # İç içe ölçümlerde (ör. döngü içindeki sipariş) yalnızca dıştaki ölçülür
+        if not self.aktif or getattr(self._yerel, 'derinlik', 0):
+            yield
+            return
+
+        self._yerel.derinlik = 1
+        profil = cProfile.Profile()
+        t0 = time.perf_counter()
+        profil.enable()
+        try:
+            yield
+        finally:
+            profil.disable()
+            sure = time.perf_counter() - t0
+            self._yerel.derinlik = 0
+            self._sakla(profil, etiket, sure)
+
+    def _sakla(self, profil: cProfile.Profile, etiket: str, sure: float):
+        with self._kilit:
+            dolu = len(self._en_yavaslar) >= self.saklanacak
+            if dolu and sure <= self._en_yavaslar[0][0]:
+                return
+
+            guvenli_etiket = re.sub(r'[^A-Za-z0-9_.-]', '_', etiket)
+            zaman = datetime.now().strftime('%Y%m%d_%H%M%S_%f')
+            dosya = os.path.join(self.klasor, f"{zaman}_{guvenli_etiket}_{sure * 1000:.0f}ms.prof")
+            eski_dosya = self._en_yavaslar[0][2] if dolu else None
+            try:
+                self._kuyruk.put_nowait((profil, dosya, eski_dosya))
+            except queue.Full:
+                print(f"[UYARI] Profil kuyruğu dolu, '{etiket}' profili atlandı")
+                return
+
+            # Kuyruk sırayla yazıldığı için yerinden edilen dosya yazıldıktan sonra silinir
+            if dolu:
+                heapq.heapreplace(self._en_yavaslar, (sure, etiket, dosya))
+            else:
+                heapq.heappush(self._en_yavaslar, (sure, etiket, dosya))
+        self._yaziciyi_baslat()
+
+    def _yaziciyi_baslat(self):
+        with self._kilit:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._yaz_dongusu, name="profil-yazici", daemon=True)
+                self._thread.start()
+
+    def _yaz_dongusu(self):
+        while True:
+            profil, dosya, eski_dosya = self._kuyruk.get()
+            try:
+                os.makedirs(os.path.dirname(dosya) or '.', exist_ok=True)
+                profil.dump_stats(dosya)
+            except OSError as e:
+                print(f"[HATA] Profil kaydedilemedi: {str(e)}")
+                with self._kilit:
+                    self._en_yavaslar = [kayit for kayit in self._en_yavaslar if kayit[2] != dosya]
+                    heapq.heapify(self._en_yavaslar)
+            finally:
+                if eski_dosya:
+                    try:
+                        os.remove(eski_dosya)
+                    except OSError:
+                        pass
+                self._kuyruk.task_done()
+
+    def bekle(self, zaman_asimi: float = 10.0) -> bool:
+        """Kuyruktaki profillerin yazılmasını bekle"""
+        bitis = time.monotonic() + zaman_asimi
+        while self._kuyruk.unfinished_tasks:
+            if time.monotonic() >= bitis:
+                return False
+            time.sleep(0.05)
+        return True
+
+    def ozet(self) -> List[Dict[str, object]]:
+        """Saklanan profilleri en yavaştan hızlıya listele"""
+        with self._kilit:
+            kayitlar = sorted(self._en_yavaslar, reverse=True)
+        return [
+            {'etiket': etiket, 'sure_ms': round(sure * 1000, 1), 'dosya': dosya}
+            for sure, etiket, dosya in kayitlar
+        ]
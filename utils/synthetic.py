@@ -0,0 +1,108 @@
+"""
+Sentetik Envanter Üreteci
+Benchmark ve yerel testler için tohumlu, gerçekçi envanter yanıtları üretir
+"""
+
+import json
+import random
+import string
+from datetime import date, timedelta
+from typing import Any, Dict, List, Optional
+
+
+# (TrimName, API trim kodu, taban fiyat TL, menzil km)
+TRIMLER = [
+    ("Model Y Standard Range RWD", "MYRWD", 1_850_000, 455),
+    ("Model Y Long Range AWD", "LRAWD", 2_250_000, 533),
+    ("Model Y Performance AWD", "PAWD", 2_650_000, 514),
+]
+TRIM_AGIRLIKLARI = [0.55, 0.35, 0.10]
+
+# (PAINT kodu, opsiyon kodu, ek fiyat)
+BOYALAR = [
+    ("white", "PPSW", 45_000),
+    ("black", "PMBL", 45_000),
+    ("grey", "PMNG", 45_000),
+    ("blue", "PPSB", 45_000),
+    ("red", "PR01", 90_000),
+    ("pearl", "PPSW", 45_000),
+    ("solid", "PBSB", 0),
+]
+BOYA_AGIRLIKLARI = [0.25, 0.2, 0.15, 0.12, 0.1, 0.1, 0.08]
+
+ICLER = [("black", "IPB1"), ("white", "IPW1")]
+
+DURUMLAR = ["Available", "InTransit", "Reserved", "Sold"]
+DURUM_AGIRLIKLARI = [0.6, 0.25, 0.1, 0.05]
+
+METROLAR = ["İstanbul", "Ankara", "İzmir", "Bursa", "Antalya", "Kocaeli", "Adana", "Gaziantep"]
+
+TEMEL_OPSIYONLAR = ["APBS", "CPF0", "DV2W", "MDLY", "TM00", "SC04", "ST31", "TW00"]
+JANT_OPSIYONLARI = ["WY19B", "WY20P", "WY21P"]
+KOLTUK_OPSIYONLARI = ["STY5S", "STY7S"]
+EK_OPSIYONLAR = ["TW01", "APF2", "SLR1", "CH07", "ID3W"]
+
+VIN_KARAKTERLERI = "ABCDEFGHJKLMNPRSTUVWXYZ0123456789"
+
+
+class SentetikEnvanter:
+    """Tohumlu rastgele envanter verisi üreten sınıf"""
+
+    def __init__(self, tohum: int = 42, bugun: Optional[date] = None):
+        self.rng = random.Random(tohum)
+        self.bugun = bugun or date(2025, 1, 1)
+        self._sayac = 0
+
+    def _vin(self) -> str:
+        self._sayac += 1
+        seri = ''.join(self.rng.choice(VIN_KARAKTERLERI) for _ in range(3))
+        return f"7SAYGDEE{self.rng.choice(string.digits)}S{seri}{self._sayac:06d}"[:17]
+
+    def arac(self) -> Dict[str, Any]:
+        """Tek bir aracın API kaydını üret"""
+        trim_adi, trim_kodu, taban_fiyat, menzil = self.rng.choices(TRIMLER, TRIM_AGIRLIKLARI)[0]
+        boya, boya_opsiyonu, boya_fiyati = self.rng.choices(BOYALAR, BOYA_AGIRLIKLARI)[0]
+        ic, ic_opsiyonu = self.rng.choice(ICLER)
+        durum = self.rng.choices(DURUMLAR, DURUM_AGIRLIKLARI)[0]
+
+        opsiyonlar = list(TEMEL_OPSIYONLAR)
+        opsiyonlar += [trim_kodu, boya_opsiyonu, ic_opsiyonu]
+        opsiyonlar.append(self.rng.choice(JANT_OPSIYONLARI))
+        opsiyonlar.append(self.rng.choices(KOLTUK_OPSIYONLARI, [0.85, 0.15])[0])
+        opsiyonlar += [o for o in EK_OPSIYONLAR if self.rng.random() < 0.2]
+
+        fiyat = taban_fiyat + boya_fiyati + self.rng.randrange(0, 150_000, 1_000)
+        eta = self.bugun + timedelta(days=self.rng.randint(0, 90))
+
+        return {
+            'VIN': self._vin(),
+            'Model': 'my',
+            'TrimName': trim_adi,
+            'TrimCode': trim_kodu,
+            'PAINT': {'Code': boya, 'Value': boya_opsiyonu},
+            'INTERIOR': {'Code': ic, 'Value': ic_opsiyonu},
+            'Price': fiyat,
+            'Year': self.rng.choice([2024, 2025]),
+            'MetroName': self.rng.choice(METROLAR),
+            'TotalRange': menzil + self.rng.randint(-10, 5),
+            'InventoryStatus': durum,
+            'ETA': eta.isoformat(),
+            'OptionCodeList': ','.join(opsiyonlar),
+        }
+
+    def araclar(self, adet: int) -> List[Dict[str, Any]]:
+        """Fiyata göre artan sırada araç kayıtları üret"""
+        kayitlar = [self.arac() for _ in range(adet)]
+        kayitlar.sort(key=lambda kayit: kayit['Price'])
+        return kayitlar
+
+    def yanit(self, adet: int) -> Dict[str, Any]:
+        """Envanter API yanıtı biçiminde sözlük üret"""
+        return {
+            'total_matches_found': str(adet),
+            'results': self.araclar(adet),
+        }
+
+    def yanit_json(self, adet: int) -> bytes:
+        """Envanter API yanıtını JSON bayt dizisi olarak üret"""
+        return json.dumps(self.yanit(adet), ensure_ascii=False).encode('utf-8')